@@ -0,0 +1,54 @@
+import io
+
+import pytest
+
+import yuio.doc
+import yuio.md
+import yuio.string
+import yuio.term
+import yuio.theme
+
+_PARAGRAPH = (
+    "Use **`--verbose`** to print *more* output, or `--quiet` to print less. "
+    "See [the docs](https://example.com) for **bold *and italic* text**. "
+)
+
+_DOC = "\n\n".join(
+    f"## Section {i}\n\n{_PARAGRAPH * 3}\n\n- `--flag-{i}`: {_PARAGRAPH}\n"
+    f"- `--option-{i}`: {_PARAGRAPH}\n\n```python\nprint({i!r}, x + 1)\n```"
+    for i in range(200)
+)
+
+_DATA = {
+    f"key_{i}": [{"id": j, "name": f"item {j}", "ok": j % 2 == 0} for j in range(10)]
+    for i in range(200)
+}
+
+
+def _count_bytes(lines: list[yuio.string.ColorizedString], delta: bool) -> int:
+    return sum(
+        len("".join(line.as_code(yuio.term.ColorSupport.ANSI_TRUE, delta=delta)))
+        for line in lines
+    )
+
+
+@pytest.mark.full
+def test_as_code_delta_bytes():
+    term = yuio.term.Term(
+        io.StringIO(),
+        io.StringIO(),
+        color_support=yuio.term.ColorSupport.ANSI_TRUE,
+    )
+    theme = yuio.theme.DefaultTheme(term)
+    ctx = yuio.string.ReprContext(
+        term=term, theme=theme, width=100, multiline=True, highlighted=True
+    )
+
+    doc = yuio.doc.Formatter(ctx).format(yuio.md.MdParser().parse(_DOC))
+    data = ctx.repr(_DATA).wrap(100)
+
+    for name, lines in [("document", doc), ("repr", data)]:
+        full = _count_bytes(lines, delta=False)
+        delta = _count_bytes(lines, delta=True)
+        print(f"{name}: {full} bytes, {delta} bytes with delta codes")
+        assert delta < full
@@ -0,0 +1,46 @@
+import io
+import time
+
+import pytest
+
+import yuio.string
+import yuio.term
+import yuio.theme
+
+N_MESSAGES = 20_000
+
+
+def _colorize_messages(ctx: yuio.string.ReprContext) -> float:
+    start = time.perf_counter()
+    for i in range(N_MESSAGES):
+        yuio.string.colorize(
+            "Processed <c code>%s</c> in %.2fs, see `%s` for <c bold>details</c>",
+            "file.txt",
+            i / 1000,
+            "report.txt",
+            ctx=ctx,
+        )
+    return (time.perf_counter() - start) / N_MESSAGES
+
+
+@pytest.mark.full
+def test_colorize_messages(monkeypatch):
+    term = yuio.term.Term(
+        io.StringIO(),
+        io.StringIO(),
+        color_support=yuio.term.ColorSupport.ANSI_TRUE,
+    )
+    ctx = yuio.string.ReprContext(term=term, theme=yuio.theme.DefaultTheme(term))
+
+    elapsed = _colorize_messages(ctx)
+    with monkeypatch.context() as m:
+        m.setattr(yuio.string, "_MAX_CACHED_TEMPLATE_LEN", -1)
+        baseline = _colorize_messages(ctx)
+
+    print(
+        f"{N_MESSAGES} messages: {elapsed * 1e6:.1f}us per message "
+        f"(without template cache {baseline * 1e6:.1f}us per message)"
+    )
+
+    # Templates are parsed once, repeated messages only substitute arguments.
+    assert elapsed < baseline / 1.5
@@ -0,0 +1,104 @@
+import json
+import pathlib
+import subprocess
+import sys
+import time
+
+import pytest
+
+N_RUNS = 10
+N_SUBCOMMANDS = 25
+N_FLAGS = 10
+
+# Time spent completing a flag, on top of time spent starting the interpreter
+# and importing `yuio.app`. Every TAB press pays for it, so it should stay small
+# no matter how many subcommands the program has.
+COMPLETE_BUDGET = 0.25
+
+_MAIN = """
+import yuio.app
+import yuio.complete
+
+
+class EnvCompleter(yuio.complete.Completer):
+    def _process(self, collector):
+        for name in ["alpha", "beta", "gamma"]:
+            collector.add(name)
+
+
+@yuio.app.app
+def main(
+    #: Root flag.
+    verbose_level: int = 0,
+): ...
+
+
+for i in range({n}):
+    main.lazy_subcommand(f"sub_{{i}}:command", f"sub-{{i}}")
+
+if __name__ == "__main__":
+    main.run()
+"""
+
+_SUBCOMMAND = """
+import pathlib
+
+import yuio.app
+from main import EnvCompleter
+
+
+@yuio.app.app
+def command(
+{flags}
+    #: Environment.
+    env: str = yuio.app.field(default="", completer=EnvCompleter()),
+): ...
+"""
+
+_FLAG = """
+    #: Documentation for flag {i}.
+    flag_{i}: pathlib.Path | None = None,
+"""
+
+
+def _run(*args: str, cwd: pathlib.Path) -> float:
+    start = time.perf_counter()
+    subprocess.run([sys.executable, *args], cwd=cwd, check=True, capture_output=True)
+    return time.perf_counter() - start
+
+
+@pytest.mark.full
+def test_custom_completer(tmp_path: pathlib.Path):
+    (tmp_path / "main.py").write_text(_MAIN.format(n=N_SUBCOMMANDS))
+    flags = "".join(_FLAG.format(i=i) for i in range(N_FLAGS))
+    for i in range(N_SUBCOMMANDS):
+        (tmp_path / f"sub_{i}.py").write_text(_SUBCOMMAND.format(flags=flags))
+
+    data = json.dumps({"path": "/sub-7", "flags": ["--env"], "index": 0})
+    result = subprocess.run(
+        [sys.executable, "main.py", "--yuio-custom-completer--", data, ""],
+        cwd=tmp_path,
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    assert result.stdout.split() == ["alpha", "beta", "gamma"]
+
+    # Alternate runs so that both processes are affected by noise equally.
+    elapsed = elapsed_import = float("inf")
+    for _ in range(N_RUNS):
+        elapsed = min(
+            elapsed,
+            _run("main.py", "--yuio-custom-completer--", data, "", cwd=tmp_path),
+        )
+        elapsed_import = min(
+            elapsed_import, _run("-c", "import yuio.app", cwd=tmp_path)
+        )
+
+    print(
+        f"custom completer: {elapsed * 1000:.1f}ms, "
+        f"import yuio.app: {elapsed_import * 1000:.1f}ms"
+    )
+
+    # Only the requested subcommand is imported and built.
+    assert elapsed - elapsed_import < elapsed_import * COMPLETE_BUDGET
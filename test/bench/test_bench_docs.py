@@ -0,0 +1,70 @@
+import importlib.util
+import sys
+import time
+import weakref
+
+import pytest
+
+import yuio.util
+
+N_CLASSES = 60
+N_FIELDS = 5
+
+
+def _make_source() -> str:
+    lines = []
+    for i in range(N_CLASSES):
+        lines.append(f"class Config{i}:")
+        for j in range(N_FIELDS):
+            lines.append(f"    #: Documentation for field {j}.")
+            lines.append(f"    field_{j}: int = {j}")
+        lines.append("")
+    return "\n".join(lines)
+
+
+def _find_all_docs(monkeypatch, classes) -> float:
+    monkeypatch.setattr(yuio.util, "_DOCS_CACHE", weakref.WeakKeyDictionary())
+    monkeypatch.setattr(yuio.util, "_MODULE_DOCS_CACHE", {})
+
+    start = time.perf_counter()
+    for cls in classes:
+        assert len(yuio.util.find_docs(cls)) == N_FIELDS
+    return time.perf_counter() - start
+
+
+@pytest.mark.full
+def test_find_docs(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    monkeypatch.setenv("LOCALAPPDATA", str(tmp_path / "cache"))
+
+    path = tmp_path / "bench_docs_module.py"
+    path.write_text(_make_source())
+    spec = importlib.util.spec_from_file_location("bench_docs_module", path)
+    assert spec is not None
+    assert spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    monkeypatch.setitem(sys.modules, "bench_docs_module", module)
+    spec.loader.exec_module(module)
+    classes = [getattr(module, f"Config{i}") for i in range(N_CLASSES)]
+
+    start = time.perf_counter()
+    for cls in classes:
+        assert len(yuio.util._find_object_docs(cls)) == N_FIELDS
+    baseline = time.perf_counter() - start
+
+    monkeypatch.setenv("YUIO_DOCS_CACHE", "0")
+    cold = _find_all_docs(monkeypatch, classes)
+
+    monkeypatch.setenv("YUIO_DOCS_CACHE", "1")
+    _find_all_docs(monkeypatch, classes)
+    warm = _find_all_docs(monkeypatch, classes)
+
+    print(
+        f"docs for {N_CLASSES} classes: {cold * 1e3:.1f}ms, "
+        f"{warm * 1e3:.1f}ms from cache "
+        f"(inspecting every class separately: {baseline * 1e3:.1f}ms)"
+    )
+
+    # Module is parsed once instead of once per class.
+    assert cold * 5 < baseline
+    assert warm < cold
@@ -0,0 +1,45 @@
+import re
+import subprocess
+import sys
+
+import pytest
+
+N_RUNS = 10
+
+# Cold import of `yuio.io`, as a fraction of cold import of `yuio.app`.
+# Printing a couple of messages shouldn't require loading parsers, completers
+# and highlighters, which `yuio.app` needs anyway. Absolute numbers vary
+# too much between machines to be useful.
+IMPORT_BUDGET = 0.65
+
+
+def _import_time(module: str) -> float:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    for line in result.stderr.splitlines():
+        if match := re.match(
+            r"^import time:\s*\d+\s*\|\s*(\d+)\s*\|\s*" + re.escape(module) + "$",
+            line,
+        ):
+            return int(match.group(1)) / 1000
+    raise RuntimeError(f"can't find import time for {module}")
+
+
+@pytest.mark.full
+def test_import_yuio_io():
+    # Alternate runs so that both imports are affected by noise equally.
+    elapsed = elapsed_app = float("inf")
+    for _ in range(N_RUNS):
+        elapsed = min(elapsed, _import_time("yuio.io"))
+        elapsed_app = min(elapsed_app, _import_time("yuio.app"))
+
+    print(
+        f"import yuio.io: {elapsed:.1f}ms, import yuio.app: {elapsed_app:.1f}ms "
+        f"(budget for yuio.io {elapsed_app * IMPORT_BUDGET:.1f}ms)"
+    )
+
+    assert elapsed < elapsed_app * IMPORT_BUDGET
@@ -0,0 +1,67 @@
+import random
+import time
+import unicodedata
+
+import pytest
+
+import yuio.string
+
+N_LINES = 20_000
+
+_SCRIPTS = [
+    "The quick brown fox jumps over the lazy dog",
+    "Příliš žluťoučký kůň úpěl ďábelské ódy",
+    "Съешь же ещё этих мягких французских булок",
+    "色は匂へど散りぬるを我が世誰ぞ常ならむ",
+    "다람쥐 헌 쳇바퀴에 타고파",
+    "🚀 build ✅ tests 🐛 fixed 📦 release",
+    "áéíóú",
+]
+
+
+def _reference_line_width(s: str) -> int:
+    return sum(
+        (unicodedata.east_asian_width(c) in "WF") + 1
+        for c in s
+        if unicodedata.category(c)[0] not in "MC"
+    )
+
+
+def _make_corpus(seed: int) -> list[str]:
+    rng = random.Random(seed)
+    words = " ".join(_SCRIPTS).split()
+    return [
+        " ".join(rng.choice(words) for _ in range(rng.randint(1, 15)))
+        for _ in range(N_LINES)
+    ]
+
+
+def _measure(fn, corpus: list[str]) -> float:
+    start = time.perf_counter()
+    for line in corpus:
+        fn(line)
+    return time.perf_counter() - start
+
+
+@pytest.mark.full
+def test_line_width_mixed_scripts():
+    corpus = _make_corpus(0)
+    # Same content, different string objects, so that no hashes are cached.
+    corpus_repeated = [line[:1] + line[1:] for line in corpus[:100]] * (N_LINES // 100)
+
+    for line in corpus:
+        assert yuio.string.line_width(line) == _reference_line_width(line)
+
+    baseline = _measure(_reference_line_width, corpus)
+    elapsed = _measure(yuio.string.line_width, _make_corpus(1))
+    elapsed_repeated = _measure(yuio.string.line_width, corpus_repeated)
+
+    print(
+        f"{N_LINES} mixed-script lines: {elapsed * 1e3:.1f}ms, "
+        f"{elapsed_repeated * 1e3:.1f}ms for repeated lines "
+        f"(baseline {baseline * 1e3:.1f}ms)"
+    )
+
+    # Widths come from a lookup table instead of `unicodedata`.
+    assert elapsed < baseline / 2
+    assert elapsed_repeated < baseline / 2
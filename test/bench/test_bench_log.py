@@ -0,0 +1,40 @@
+import logging
+import time
+
+import pytest
+
+import yuio.io
+
+N_RECORDS = 100_000
+
+
+def _format_records(formatter: logging.Formatter, *args) -> float:
+    msg = "message" + " %s" * len(args)
+
+    start = time.perf_counter()
+    for i in range(N_RECORDS):
+        record = logging.LogRecord(
+            "yuio.test.bench", logging.INFO, __file__, i, msg, args, None
+        )
+        formatter.format(record)
+    elapsed = time.perf_counter() - start
+
+    return elapsed / N_RECORDS
+
+
+@pytest.mark.full
+def test_format_log_records():
+    baseline = _format_records(
+        logging.Formatter("%(asctime)s %(name)s %(levelname)s %(message)s")
+    )
+    elapsed = _format_records(yuio.io.Formatter())
+    elapsed_args = _format_records(yuio.io.Formatter(), "arg", 10)
+
+    print(
+        f"{N_RECORDS} log records: {elapsed * 1e6:.1f}us per record, "
+        f"{elapsed_args * 1e6:.1f}us per record with arguments "
+        f"(baseline {baseline * 1e6:.1f}us per record)"
+    )
+
+    # Log format is compiled once, and only fields used in the format are rendered.
+    assert elapsed < baseline * 5
@@ -0,0 +1,34 @@
+import os
+import time
+
+import pytest
+
+import yuio.io
+import yuio.term
+
+N_MESSAGES = 20_000
+
+
+def _print_messages(color_support: yuio.term.ColorSupport) -> float:
+    with open(os.devnull, "w") as devnull:
+        term = yuio.term.Term(devnull, devnull, color_support=color_support)
+
+        start = time.perf_counter()
+        for i in range(N_MESSAGES):
+            yuio.io.info("Processed `%s` items in %s", i, "dir", term=term)
+        return (time.perf_counter() - start) / N_MESSAGES
+
+
+@pytest.mark.full
+def test_info_to_devnull():
+    baseline = _print_messages(yuio.term.ColorSupport.ANSI_TRUE)
+    elapsed = _print_messages(yuio.term.ColorSupport.NONE)
+
+    print(
+        f"{N_MESSAGES} messages: {elapsed * 1e6:.1f}us per message without colors "
+        f"({baseline * 1e6:.1f}us per message with colors)"
+    )
+
+    # Without colors, we don't resolve message colors and don't assemble
+    # colorized strings before writing them.
+    assert elapsed < baseline
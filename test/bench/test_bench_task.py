@@ -0,0 +1,93 @@
+import threading
+import time
+
+import pytest
+
+import yuio.io
+
+N_THREADS = 8
+N_UPDATES = 10_000_000
+
+
+def _run_in_threads(fn) -> float:
+    n = N_UPDATES // N_THREADS
+    barrier = threading.Barrier(N_THREADS + 1)
+
+    def worker():
+        barrier.wait()
+        for i in range(n):
+            fn(i, n)
+
+    threads = [threading.Thread(target=worker) for _ in range(N_THREADS)]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - start
+
+
+@pytest.fixture
+def enable_bg_updates() -> bool:
+    return True
+
+
+@pytest.mark.full
+def test_progress_from_threads(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr("yuio.io.streams_wrapped", lambda: True)
+
+    def noop(done, total):
+        pass
+
+    baseline = _run_in_threads(noop)
+
+    with yuio.io.Task("task") as task:
+        elapsed = _run_in_threads(task.progress)
+
+    print(
+        f"{N_UPDATES} updates from {N_THREADS} threads: "
+        f"{elapsed:.2f}s (baseline {baseline:.2f}s, "
+        f"{elapsed / N_UPDATES * 1e9:.0f}ns per update)"
+    )
+
+    # Progress updates don't take locks, their cost should be comparable
+    # to a cost of a simple function call.
+    assert elapsed < baseline * 15
+
+
+def _render_frames(n_tasks: int, n_frames: int) -> float:
+    manager = yuio.io._manager()
+    tasks = [yuio.io.Task("task %s", i) for i in range(n_tasks)]
+    for task in tasks[::3]:
+        task.done()
+
+    start = time.perf_counter()
+    for i in range(n_frames):
+        tasks[(i * 7) % n_tasks].progress(i, n_frames)
+        tasks[(i * 13) % n_tasks].comment("item %s", i)
+        with yuio.io._IO_LOCK:
+            manager._needs_update = True
+            manager._show_tasks(immediate_render=True)
+    elapsed = time.perf_counter() - start
+
+    for task in tasks:
+        task.done()
+
+    return elapsed / n_frames
+
+
+@pytest.mark.full
+def test_render_many_tasks(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr("yuio.io.streams_wrapped", lambda: True)
+
+    baseline = _render_frames(50, 1000)
+    elapsed = _render_frames(5000, 1000)
+
+    print(
+        f"frame with 5000 tasks: {elapsed * 1e3:.2f}ms "
+        f"(baseline with 50 tasks {baseline * 1e3:.2f}ms)"
+    )
+
+    # Only changed tasks are laid out, and only visible tasks are drawn.
+    assert elapsed < baseline * 5
@@ -0,0 +1,87 @@
+import io
+import json
+import time
+
+import pytest
+
+import yuio.term
+import yuio.theme
+
+N_LOOKUPS = 100_000
+
+
+@pytest.mark.full
+def test_get_color():
+    term = yuio.term.Term(
+        io.StringIO(),
+        io.StringIO(),
+        color_support=yuio.term.ColorSupport.ANSI_TRUE,
+    )
+    theme = yuio.theme.DefaultTheme(term)
+
+    start = time.perf_counter()
+    theme._precompile_colors()
+    precompile = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for i in range(N_LOOKUPS):
+        theme.get_color(f"msg/text:code/sh-usage hl/flag:sh-usage/{i}")
+    miss = (time.perf_counter() - start) / N_LOOKUPS
+
+    start = time.perf_counter()
+    for _ in range(N_LOOKUPS):
+        theme.get_color("msg/text:code/sh-usage hl/flag:sh-usage")
+    hit = (time.perf_counter() - start) / N_LOOKUPS
+
+    print(
+        f"{len(theme.colors)} colors precompiled in {precompile * 1e3:.1f}ms; "
+        f"{hit * 1e9:.0f}ns per hit, {miss * 1e6:.1f}us per miss"
+    )
+
+    # A hit is a single dict lookup.
+    assert hit * 10 < miss
+
+
+N_LOADS = 200
+
+
+@pytest.mark.full
+def test_load_theme_file(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    monkeypatch.setenv("LOCALAPPDATA", str(tmp_path / "cache"))
+    base = tmp_path / "base.json"
+    base.write_text(
+        json.dumps(
+            {
+                "progress_bar_width": 25,
+                "colors": {f"color_{i}": "#ff5555" for i in range(100)},
+            }
+        )
+    )
+    theme = tmp_path / "theme.json"
+    theme.write_text(json.dumps({"include": "base.json", "colors": {"red": "bold"}}))
+    monkeypatch.setenv("YUIO_THEME_PATH", str(theme))
+
+    term = yuio.term.Term(
+        io.StringIO(),
+        io.StringIO(),
+        color_support=yuio.term.ColorSupport.ANSI_TRUE,
+    )
+
+    monkeypatch.setenv("YUIO_THEME_CACHE", "0")
+    start = time.perf_counter()
+    for _ in range(N_LOADS):
+        yuio.theme.load(term)
+    cold = (time.perf_counter() - start) / N_LOADS
+
+    monkeypatch.setenv("YUIO_THEME_CACHE", "1")
+    yuio.theme.load(term)
+    start = time.perf_counter()
+    for _ in range(N_LOADS):
+        yuio.theme.load(term)
+    warm = (time.perf_counter() - start) / N_LOADS
+
+    print(f"theme file loaded in {cold * 1e3:.2f}ms, {warm * 1e3:.2f}ms from cache")
+
+    # Cached theme skips config parsing and validation.
+    assert warm < cold
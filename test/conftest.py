@@ -7,6 +7,7 @@ import os
 import pathlib
 import re
 import sys
+import time
 import traceback
 from dataclasses import dataclass
 
@@ -189,8 +190,36 @@ def widget_checker(
 
 
 @pytest.fixture
-def enable_bg_updates() -> bool:
-    return False
+def enable_bg_updates(request: pytest.FixtureRequest) -> bool:
+    return request.node.get_closest_marker("bg_updates") is not None
+
+
+@pytest.fixture
+def screen(ostream: io.StringIO, width: int) -> _t.Callable[[], list[str]]:
+    """
+    Returns a function that renders everything written to `ostream` so far.
+
+    Background thread doesn't write to `ostream` while the function runs.
+
+    """
+
+    def screen() -> list[str]:
+        with yuio.io._IO_LOCK:
+            return RcCompare.from_commands(ostream.getvalue(), width).screen or []
+
+    return screen
+
+
+def wait_for(cond: _t.Callable[[], bool], timeout: float = 2):
+    """
+    Wait until `cond` returns :data:`True`, fail if it takes too long.
+
+    """
+
+    deadline = time.monotonic() + timeout
+    while not cond():
+        assert time.monotonic() < deadline, "timeout"
+        time.sleep(0.01)
 
 
 @pytest.fixture(autouse=True)
@@ -218,6 +247,7 @@ def setup_io(
     assert yuio.io._ORIG_STDOUT is None, "previous test didn't clean up"
 
     monkeypatch.setattr("sys.argv", ["prog"])
+    monkeypatch.setenv("YUIO_DOCS_CACHE", "0")
 
     monkeypatch.setattr(
         "yuio.term.get_tty_size",
@@ -225,6 +255,9 @@ def setup_io(
     )
 
     monkeypatch.setattr("yuio.term._is_foreground", lambda *_, **__: True)
+    if enable_bg_updates:
+        # Tasks are only updated from background thread when streams are wrapped.
+        monkeypatch.setattr("yuio.io.streams_wrapped", lambda: True)
     yuio.term._TTY_SETUP_PERFORMED = True
     yuio.term._TTY_OUTPUT = term.ostream
     yuio.term._TTY_INPUT = term.istream
@@ -719,8 +752,8 @@ class IOMocker:
         wrap_streams: bool | None = None,
     ):
         """
-        Bind :func:`yuio.widget._event_stream` and all mocked input streams
-        to events from this mocker.
+        Bind :func:`yuio.widget._event_stream`, :func:`yuio.widget._async_event_stream`
+        and all mocked input streams to events from this mocker.
 
         """
 
@@ -763,6 +796,17 @@ class IOMocker:
             yuio.widget._event_stream,
             lambda *_, **__: _CURRENT_IOSTREAM_MOCK,
         )
+
+        async def _async_event_stream(*_, **__):
+            stream = _CURRENT_IOSTREAM_MOCK
+            assert stream is not None
+            while True:
+                yield next(stream)
+
+        old_async_event_stream, yuio.widget._async_event_stream = (
+            yuio.widget._async_event_stream,
+            _async_event_stream,
+        )
         old_enter_raw_mode, yuio.term._enter_raw_mode = (
             yuio.term._enter_raw_mode,
             lambda *_, **__: contextlib.nullcontext(),
@@ -793,6 +837,7 @@ class IOMocker:
             sys.stderr = old_stderr
             yuio.term._enter_raw_mode = old_enter_raw_mode
             yuio.widget._event_stream = old_event_stream
+            yuio.widget._async_event_stream = old_async_event_stream
             _CURRENT_IOSTREAM_MOCK = None
 
 
@@ -1266,6 +1311,8 @@ def _render_screen(
     colors = []
     urls = []
     color = " "
+    fore = " "
+    bold = False
     url = " "
 
     def render_text(s: str):
@@ -1313,23 +1360,28 @@ def _render_screen(
                 if fn == "m":
                     # Color.
                     for code in part[:-1].split(";"):
-                        bold = False
-                        if not code or code in ["0", "39"]:
-                            color = " "
+                        if not code or code == "0":
+                            fore, bold = " ", False
+                        elif code == "39":
+                            fore = " "
                         else:
                             int_code = int(code)
                             if int_code == 1:
                                 bold = True
-                            elif int_code < 10:
+                            elif int_code == 22:
+                                bold = False
+                            elif int_code < 10 or 20 < int_code < 30:
                                 pass  # dim, italic, etc.
                             elif 30 <= int_code <= 37:
-                                color = _COLOR_NAMES[int_code - 30]
+                                fore = _COLOR_NAMES[int_code - 30]
                             else:
                                 assert False, (
                                     f"don't use non-standard colors with this assertion: {int_code}"
                                 )
-                        if bold:
-                            color = "#" if color == " " else color.upper()
+                    if bold:
+                        color = "#" if fore == " " else fore.upper()
+                    else:
+                        color = fore
                 elif fn == "J":
                     # Clear screen.
                     assert len(args) <= 1, f"invalid OSC: {part!r}"
@@ -1,3 +1,6 @@
+import io
+import json
+import sys
 import textwrap
 import types
 
@@ -5,6 +8,7 @@ import pytest
 
 import yuio
 import yuio.app
+import yuio.complete
 import yuio.config
 from yuio.app import App, CommandInfo, app, field, inline, positional
 
@@ -1378,3 +1382,100 @@ class TestLazySubcommand:
 
             assert exc_info.value.code == 0
             assert results.get("app_called") is True
+
+
+class _Completer(yuio.complete.Completer):
+    def __init__(self, *choices: str):
+        self._choices = choices
+
+    def _process(self, collector: yuio.complete.CompletionCollector):
+        for choice in self._choices:
+            collector.add(choice)
+
+
+class TestCustomCompleter:
+    @pytest.fixture
+    def complete(self, monkeypatch: pytest.MonkeyPatch):
+        def complete(app: App, path: str, flags: list[str], word: str = ""):
+            stdout = io.StringIO()
+            monkeypatch.setattr(sys, "__stdout__", stdout)
+            data = json.dumps({"path": path, "flags": flags, "index": 0})
+            with pytest.raises(SystemExit) as exc_info:
+                app.run(["--yuio-custom-completer--", data, word])
+            assert exc_info.value.code == 0
+            return [line.split("\t")[0] for line in stdout.getvalue().splitlines()]
+
+        return complete
+
+    @pytest.fixture
+    def main(self):
+        @app
+        def main(
+            value: str = field(default="", completer=_Completer("root-a", "root-b")),
+        ):
+            pass
+
+        @main.subcommand
+        def sub(
+            x: str = field(completer=_Completer("sub-x")),
+            /,
+            *,
+            value: str = field(default="", completer=_Completer("sub-a", "sub-b")),
+        ):
+            pass
+
+        @sub.subcommand
+        def nested(
+            other: str = field(default="", completer=_Completer("nested-a")),
+        ):
+            pass
+
+        return main
+
+    def test_root(self, main, complete):
+        assert complete(main, "", ["--value"]) == ["root-a", "root-b"]
+
+    def test_prefix(self, main, complete):
+        assert complete(main, "", ["--value"], "root-b") == ["root-b"]
+
+    def test_subcommand(self, main, complete):
+        assert complete(main, "/sub", ["--value"]) == ["sub-a", "sub-b"]
+
+    def test_subcommand_positional(self, main, complete):
+        assert complete(main, "/sub", ["0"]) == ["sub-x"]
+
+    def test_nested(self, main, complete):
+        assert complete(main, "/sub/nested", ["--other"]) == ["nested-a"]
+
+    def test_inherited(self, main, complete):
+        assert complete(main, "/sub/nested", ["--value"]) == ["sub-a", "sub-b"]
+
+    def test_unknown_path(self, main, complete):
+        assert complete(main, "/unknown", ["--value"]) == []
+
+    def test_lazy_subcommand_not_imported(self, monkeypatch, complete):
+        import_calls = []
+
+        def mock_import_module(name):
+            import_calls.append(name)
+            raise ImportError(f"no module named {name!r}")
+
+        monkeypatch.setattr("importlib.import_module", mock_import_module)
+
+        @app
+        def main(
+            value: str = field(default="", completer=_Completer("root-a")),
+        ):
+            pass
+
+        @main.subcommand
+        def sub(
+            value: str = field(default="", completer=_Completer("sub-a")),
+        ):
+            pass
+
+        main.lazy_subcommand("some.module:command", "lazy")
+
+        assert complete(main, "", ["--value"]) == ["root-a"]
+        assert complete(main, "/sub", ["--value"]) == ["sub-a"]
+        assert import_calls == []
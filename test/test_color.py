@@ -355,3 +355,91 @@ def test_color_operations(color, expect):
 )
 def test_color_to_code(color: yuio.color.Color, cap, expect):
     assert color.as_code(cap) == expect
+
+
+def test_color_to_code_cached():
+    color = yuio.color.Color.FORE_RED | yuio.color.Color.STYLE_BOLD
+    code = color.as_code(yuio.color.ColorSupport.ANSI)
+    assert color.as_code(yuio.color.ColorSupport.ANSI) is code
+    assert color.as_code(yuio.color.ColorSupport.ANSI_TRUE) == code
+    assert color == yuio.color.Color.FORE_RED | yuio.color.Color.STYLE_BOLD
+    assert hash(color) == hash(yuio.color.Color.FORE_RED | yuio.color.Color.STYLE_BOLD)
+    assert repr(color) == "<Color fore=<RED> bold=True>"
+
+
+def _apply_sgr(state: dict[str, str], code: str) -> dict[str, str]:
+    state = dict(state)
+    if not code:
+        return state
+    assert code.startswith("\x1b[")
+    assert code.endswith("m")
+    params = code[2:-1].split(";")
+    while params:
+        param = params.pop(0)
+        if param in ("", "0"):
+            state.clear()
+        elif param in ("38", "48"):
+            key = "fore" if param == "38" else "back"
+            n = 1 if params[0] == "5" else 3
+            state[key] = ";".join(params[: n + 1])
+            del params[: n + 1]
+        elif param in ("39", "49"):
+            state.pop("fore" if param == "39" else "back", None)
+        elif param[0] in "34" and len(param) == 2:
+            state["fore" if param[0] == "3" else "back"] = param[1]
+        elif param == "22":
+            state.pop("1", None)
+            state.pop("2", None)
+        elif len(param) == 2 and param[0] == "2":
+            state.pop(param[1], None)
+        else:
+            state[param] = "on"
+    return state
+
+
+_DELTA_COLORS = [
+    yuio.color.Color.NONE,
+    yuio.color.Color.FORE_RED,
+    yuio.color.Color.BACK_BLUE,
+    yuio.color.Color.STYLE_BOLD,
+    yuio.color.Color.STYLE_DIM,
+    yuio.color.Color.STYLE_BOLD | yuio.color.Color.STYLE_DIM,
+    yuio.color.Color.STYLE_ITALIC | yuio.color.Color.FORE_GREEN,
+    yuio.color.Color.STYLE_UNDERLINE | yuio.color.Color.BACK_RED,
+    yuio.color.Color.STYLE_BLINK,
+    yuio.color.Color.STYLE_INVERSE | yuio.color.Color.STYLE_BOLD,
+    yuio.color.Color.fore_from_hex("#338F15"),
+    yuio.color.Color.back_from_hex("#338F15") | yuio.color.Color.FORE_RED,
+    yuio.color.Color.STYLE_NORMAL,
+]
+
+
+@pytest.mark.parametrize(
+    "cap",
+    [
+        yuio.color.ColorSupport.ANSI,
+        yuio.color.ColorSupport.ANSI_256,
+        yuio.color.ColorSupport.ANSI_TRUE,
+    ],
+)
+@pytest.mark.parametrize("prev", _DELTA_COLORS)
+def test_color_to_code_from(prev: yuio.color.Color, cap):
+    prev_state = _apply_sgr({}, prev.as_code(cap))
+    for color in _DELTA_COLORS:
+        code = color.as_code_from(prev, cap)
+        assert len(code) <= len(color.as_code(cap))
+        assert _apply_sgr(prev_state, code) == _apply_sgr({}, color.as_code(cap)), (
+            color,
+            code,
+        )
+
+
+def test_color_to_code_from_examples():
+    ansi = yuio.color.ColorSupport.ANSI
+    red = yuio.color.Color.FORE_RED
+    bold = yuio.color.Color.STYLE_BOLD
+    assert red.as_code_from(red, ansi) == ""
+    assert (red | bold).as_code_from(red, ansi) == "\x1b[1m"
+    assert red.as_code_from(red | bold, ansi) == "\x1b[22m"
+    assert yuio.color.Color.NONE.as_code_from(red | bold, ansi) == "\x1b[m"
+    assert red.as_code_from(bold, yuio.color.ColorSupport.NONE) == ""
@@ -1,6 +1,10 @@
+import asyncio
 import io
+import re
 import sys
 import textwrap
+import threading
+import time
 
 import pytest
 
@@ -12,7 +16,7 @@ import yuio.theme
 import yuio.widget
 from yuio import _t
 
-from .conftest import IOMocker, RcCompare
+from .conftest import IOMocker, RcCompare, wait_for
 
 
 class TestSetup:
@@ -544,6 +548,66 @@ class TestMessage:
             ],
         )
 
+    def test_info_wrap_streamed(self, ostream: io.StringIO, monkeypatch):
+        writes = []
+        write_lines = yuio.io._IoManager._write_lines
+        monkeypatch.setattr(
+            yuio.io._IoManager,
+            "_write_lines",
+            lambda self, lines, stream: (
+                writes.append(len(lines)),
+                write_lines(self, lines, stream),
+            ),
+        )
+
+        msg = " ".join(f"`word{i}`" for i in range(1000))
+        yuio.io.info(msg)
+
+        ctx = yuio.io.make_repr_context()
+        expected = ctx.str(
+            yuio.string.Wrap(
+                yuio.string.WithBaseColor(
+                    yuio.string.Format(msg), base_color=ctx.get_color("msg/text:info")
+                )
+            )
+        )
+        expected += yuio.color.Color.NONE
+        expected += "\n"
+        assert RcCompare.from_commands(ostream.getvalue()) == RcCompare.from_commands(
+            "".join(expected.as_code(ctx.term.color_support))
+        )
+        assert len(writes) > 1
+
+    @pytest.mark.parametrize(("meth", "args", "kwargs", "expected"), MESSAGE_CASES)
+    def test_no_colors(self, istream, meth, args, kwargs, expected):
+        def run(color_support):
+            ostream = io.StringIO()
+            term = yuio.term.Term(
+                ostream,
+                istream,
+                color_support=color_support,
+                ostream_is_tty=True,
+                istream_is_tty=True,
+                is_unicode=True,
+            )
+            getattr(yuio.io, meth)(*args, **kwargs, term=term)
+            yuio.io.raw(
+                yuio.string.Format("Foo `bar` %s " * 10, *range(10)),
+                tag="warning",
+                wrap=True,
+                add_newline=True,
+                term=term,
+            )
+            return ostream.getvalue()
+
+        # Make sure that headings are always separated from previous output.
+        yuio.io.info("Start.")
+
+        plain = run(yuio.term.ColorSupport.NONE)
+        colored = run(yuio.term.ColorSupport.ANSI_TRUE)
+        assert "\x1b" not in plain
+        assert plain == re.sub(r"\x1b\[[0-9;]*m", "", colored)
+
     def test_hr(self, ostream: io.StringIO):
         yuio.io.hr()
         yuio.io.hr(weight=2)
@@ -599,6 +663,21 @@ class TestAsk:
         with io_mocker.mock():
             assert yuio.io.ask("Hello?") == "Hii~"
 
+    def test_async(self, io_mocker: IOMocker):
+        io_mocker.expect_screen(
+            [
+                "Are you there?      ",
+                "  no                ",
+                "> yes               ",
+                "f1 help             ",
+                "                    ",
+            ],
+        )
+        io_mocker.key(yuio.widget.Key.ENTER)
+
+        with io_mocker.mock():
+            assert asyncio.run(yuio.io.ask_async[bool]("Are you there?", default=True))
+
     def test_empty(self, io_mocker: IOMocker):
         io_mocker.expect_screen(
             [
@@ -962,6 +1041,50 @@ class TestAskNoColor:
         with io_mocker.mock():
             assert yuio.io.ask("Hello?") == "Hii~"
 
+    def test_async(self, io_mocker: IOMocker):
+        io_mocker.expect_screen(
+            [
+                "> Hello?            ",
+            ],
+        )
+        io_mocker.expect_istream_readline("Hii~")
+
+        with io_mocker.mock():
+            assert asyncio.run(yuio.io.ask_async("Hello?")) == "Hii~"
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="requires select on pipes")
+    def test_async_cancelled(
+        self, ostream: io.StringIO, monkeypatch: pytest.MonkeyPatch
+    ):
+        import os
+
+        read_fd, write_fd = os.pipe()
+        with open(read_fd) as istream, open(write_fd, "w") as wstream:
+            term = yuio.term.Term(
+                ostream,
+                istream,
+                color_support=yuio.term.ColorSupport.NONE,
+                ostream_is_tty=True,
+                istream_is_tty=True,
+                is_unicode=True,
+            )
+            monkeypatch.setattr("yuio.term.get_tty", lambda: term)
+
+            async def main():
+                task = asyncio.ensure_future(yuio.io.ask_async("Hello?"))
+                await asyncio.sleep(0.05)
+                task.cancel()
+                with pytest.raises(asyncio.CancelledError):
+                    await task
+
+            # `asyncio.run` waits for the reading thread to stop.
+            asyncio.run(asyncio.wait_for(main(), timeout=5))
+
+            # Input is left for the next reader.
+            wstream.write("Hii~\n")
+            wstream.flush()
+            assert yuio.io.ask("Hello?") == "Hii~"
+
     def test_empty(self, io_mocker: IOMocker):
         io_mocker.expect_screen(
             [
@@ -1456,6 +1579,18 @@ class TestWaitForUser:
         with io_mocker.mock():
             yuio.io.wait_for_user()
 
+    def test_async(self, io_mocker: IOMocker):
+        io_mocker.expect_screen(
+            [
+                "Press enter to      ",
+                "continue            ",
+            ]
+        )
+        io_mocker.key(yuio.widget.Key.ENTER)
+
+        with io_mocker.mock():
+            asyncio.run(yuio.io.wait_for_user_async())
+
     def test_msg(self, io_mocker: IOMocker):
         io_mocker.expect_screen(
             [
@@ -2417,6 +2552,83 @@ class TestTask:
                     io_mocker.mark()
                 io_mocker.mark()
 
+    def test_async_iter(self, io_mocker: IOMocker):
+        io_mocker.expect_screen(
+            [
+                "⣿ task                                  ",
+            ]
+        )
+        io_mocker.expect_mark()
+        io_mocker.expect_screen(
+            [
+                "■■■■■ task - 3/3                        ",
+            ]
+        )
+        io_mocker.expect_mark()
+        io_mocker.expect_screen([])
+
+        class Elems:
+            def __len__(self):
+                return 3
+
+            async def __aiter__(self):
+                for elem in "ABC":
+                    yield elem
+
+        async def main():
+            async with yuio.io.Task("task") as task:
+                io_mocker.mark()
+                elems = [elem async for elem in task.iter(Elems())]
+                io_mocker.mark()
+            return elems
+
+        with io_mocker.mock():
+            assert asyncio.run(main()) == ["A", "B", "C"]
+
+    def test_async_iter_no_len(self, io_mocker: IOMocker):
+        io_mocker.expect_screen(
+            [
+                "⣿ task                                  ",
+            ]
+        )
+        io_mocker.expect_mark()
+        io_mocker.expect_screen([])
+
+        async def elems():
+            for elem in "ABC":
+                yield elem
+
+        async def main():
+            async with yuio.io.Task("task") as task:
+                result = [elem async for elem in task.iter(elems())]
+                io_mocker.mark()
+            return result
+
+        with io_mocker.mock():
+            assert asyncio.run(main()) == ["A", "B", "C"]
+
+    def test_async_error(self, io_mocker: IOMocker):
+        io_mocker.expect_screen(
+            [
+                "⣿ task                                  ",
+            ]
+        )
+        io_mocker.expect_mark()
+        io_mocker.expect_screen(
+            [
+                "⣿ task - error                          ",
+            ]
+        )
+
+        async def main():
+            async with yuio.io.Task("task", persistent=True):
+                io_mocker.mark()
+                raise RuntimeError()
+
+        with io_mocker.mock():
+            with pytest.raises(RuntimeError):
+                asyncio.run(main())
+
     def test_multiple_tasks(self, io_mocker: IOMocker):
         io_mocker.expect_screen(
             [
@@ -3024,6 +3236,524 @@ class TestTaskBackground:
                 self.is_foreground = False
 
 
+@pytest.mark.bg_updates
+class TestTaskScheduler:
+    @pytest.fixture
+    def width(self):
+        return 40
+
+    @pytest.fixture
+    def renders(self, monkeypatch: pytest.MonkeyPatch) -> list[bool]:
+        manager = yuio.io._manager()
+        renders = []
+        show_tasks = manager._show_tasks
+
+        def _show_tasks(*args, **kwargs):
+            renders.append(True)
+            show_tasks(*args, **kwargs)
+
+        monkeypatch.setattr(manager, "_show_tasks", _show_tasks)
+        return renders
+
+    def test_idle(self, renders: list[bool]):
+        time.sleep(0.6)
+        assert renders == []
+
+    def test_no_spinner(self, renders: list[bool], screen: _t.Callable[[], list[str]]):
+        task = yuio.io.Task("task")
+        task.progress(0.5)
+        wait_for(lambda: "task" in "\n".join(screen()))
+
+        # Progressbar doesn't need to be animated, so there should be no updates.
+        n_renders = len(renders)
+        time.sleep(0.6)
+        assert len(renders) == n_renders
+
+        # Task update wakes background thread up.
+        task.comment("comment")
+        wait_for(lambda: "comment" in "\n".join(screen()))
+
+        task.done()
+
+    def test_spinner(self, renders: list[bool], screen: _t.Callable[[], list[str]]):
+        task = yuio.io.Task("task")
+        wait_for(lambda: "task" in "\n".join(screen()))
+
+        # Spinner is animated, so we keep updating.
+        n_renders = len(renders)
+        wait_for(lambda: len(renders) > n_renders + 2)
+
+        task.done()
+
+    def test_coalesce_updates(
+        self, renders: list[bool], screen: _t.Callable[[], list[str]]
+    ):
+        task = yuio.io.Task("task")
+        for i in range(1000):
+            task.progress(i, 1000)
+        wait_for(lambda: "999/1000" in "\n".join(screen()))
+
+        assert len(renders) < 10
+
+        task.done()
+
+    def test_progress_does_not_block(
+        self, renders: list[bool], screen: _t.Callable[[], list[str]]
+    ):
+        task = yuio.io.Task("task")
+
+        locked = threading.Event()
+        release = threading.Event()
+
+        def hold_lock():
+            with yuio.io._IO_LOCK:
+                locked.set()
+                release.wait()
+
+        thread = threading.Thread(target=hold_lock)
+        thread.start()
+        locked.wait()
+        try:
+            for i in range(1000):
+                task.progress(i, 1000)
+                task.comment("item %s", i)
+        finally:
+            release.set()
+            thread.join()
+
+        wait_for(lambda: "999/1000 - item 999" in "\n".join(screen()))
+
+        task.done()
+
+    @pytest.mark.parametrize(
+        ("method", "args", "kwargs", "exc"),
+        [
+            ("progress", ("abc",), {}, TypeError),
+            ("progress", (1, "x"), {}, TypeError),
+            ("progress", (5, None), {}, TypeError),
+            ("progress", (None, 5), {}, TypeError),
+            ("progress", (1, 2), {"unit": 1}, TypeError),
+            ("progress", (1, 2), {"ndigits": 1.5}, TypeError),
+            ("progress", (), {}, ValueError),
+            ("progress_size", ("a", 1), {}, TypeError),
+            ("progress_size", (1, None), {}, TypeError),
+            ("progress_size", (1, 0), {}, ZeroDivisionError),
+            ("progress_scale", (1, "b"), {}, TypeError),
+            ("progress_scale", (1, 2), {"unit": None}, TypeError),
+            ("progress_scale", (1, 0), {}, ZeroDivisionError),
+            ("comment", (1,), {}, TypeError),
+        ],
+    )
+    def test_invalid_arguments(
+        self,
+        renders: list[bool],
+        screen: _t.Callable[[], list[str]],
+        method,
+        args,
+        kwargs,
+        exc,
+    ):
+        task = yuio.io.Task("task")
+        task.progress(1, 2)
+        task.comment("ok")
+
+        with pytest.raises(exc):
+            getattr(task, method)(*args, **kwargs)
+
+        # Invalid update is not stored, so rendering and finishing the task
+        # still work.
+        wait_for(lambda: "1/2 - ok" in "\n".join(screen()))
+        task.done()
+
+    def test_decimal_progress(
+        self,
+        renders: list[bool],
+        screen: _t.Callable[[], list[str]],
+    ):
+        import decimal
+
+        task = yuio.io.Task("task")
+        task.progress(decimal.Decimal("1.5"), decimal.Decimal(3), unit="Kg", ndigits=1)
+        wait_for(lambda: "1.5/3.0Kg" in "\n".join(screen()))
+
+        with pytest.raises(TypeError):
+            task.progress(1, complex(2, 0))
+
+        task.done()
+
+
+class TestTaskTree:
+    @pytest.fixture
+    def width(self):
+        return 40
+
+    @pytest.fixture
+    def height(self):
+        return 4
+
+    @pytest.fixture
+    def layouts(self, monkeypatch: pytest.MonkeyPatch) -> list[yuio.widget.Task]:
+        layouts = []
+        layout = yuio.widget.Task.layout
+
+        def _layout(self, rc):
+            layouts.append(self)
+            return layout(self, rc)
+
+        monkeypatch.setattr(yuio.widget.Task, "layout", _layout)
+        return layouts
+
+    def test_layout_changed_tasks_only(self, layouts: list[yuio.widget.Task]):
+        tasks = [yuio.io.Task("T%s", i) for i in range(100)]
+
+        layouts.clear()
+        tasks[50].progress(0.5)
+        assert layouts == [tasks[50]._widget]
+
+        layouts.clear()
+        tasks[10].comment("comment")
+        tasks[10].done()
+        assert layouts == [tasks[10]._widget]
+
+        for task in tasks:
+            task.done()
+
+    def test_relayout_on_resize(
+        self, layouts: list[yuio.widget.Task], monkeypatch: pytest.MonkeyPatch
+    ):
+        tasks = [yuio.io.Task("T%s", i) for i in range(10)]
+
+        layouts.clear()
+        yuio.io._manager()._rc._override_wh = (30, 4)
+        tasks[0].progress(0.5)
+        assert len(layouts) == 10
+
+        for task in tasks:
+            task.done()
+
+    def test_hide_tasks_on_update(self, screen: _t.Callable[[], list[str]]):
+        tasks = [yuio.io.Task("T%s", i, persistent=True) for i in range(1, 6)]
+        assert screen() == [
+            "+2 more                                 ",
+            "⣿ T3                                    ",
+            "⣿ T4                                    ",
+            "⣿ T5                                    ",
+        ]
+
+        tasks[3].done()
+        assert screen() == [
+            "+2 more                                 ",
+            "⣿ T3                                    ",
+            "+1 more                                 ",
+            "⣿ T5                                    ",
+        ]
+
+        tasks[0].comment("comment")
+        tasks[1].progress(0.5)
+        assert screen() == [
+            "+2 more                                 ",
+            "⣿ T3                                    ",
+            "+1 more                                 ",
+            "⣿ T5                                    ",
+        ]
+
+        tasks[4].done()
+        tasks[2].done()
+        assert screen() == [
+            "⣿ T1 - comment                          ",
+            "■■□□□ T2 - 50.00%                       ",
+            "+2 more                                 ",
+            "⣿ T5 - done                             ",
+        ]
+
+        for task in tasks:
+            task.done()
+
+
+class TestTaskTreeNonInteractive:
+    @pytest.fixture
+    def term(self, ostream: io.StringIO, istream: _t.TextIO) -> yuio.term.Term:
+        return yuio.term.Term(
+            ostream,
+            istream,
+            color_support=yuio.term.ColorSupport.ANSI_TRUE,
+            ostream_is_tty=False,
+            istream_is_tty=False,
+            is_unicode=True,
+        )
+
+    def test_changed_tasks_are_discarded(self):
+        for i in range(5000):
+            task = yuio.io.Task("T%s", i)
+            task.progress(0.5)
+            task.comment("comment")
+            task.done()
+
+        tasks_widget = yuio.io._manager()._tasks_widet
+        assert len(tasks_widget._changed_tasks) == 0
+        assert len(tasks_widget._changed_tasks_set) == 0
+
+
+class TestMetrics:
+    @pytest.fixture
+    def measure_writes(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr("yuio.io._MEASURE_WRITES", True)
+
+    def test_messages(self, ostream: io.StringIO, measure_writes):
+        yuio.io.reset_metrics()
+        yuio.io.raw("hello\n")
+        yuio.io.raw("привет\n")
+
+        metrics = yuio.io.get_metrics()
+        assert metrics.bytes_written == {
+            "<_MockedOStream>": len(ostream.getvalue().encode())
+        }
+        assert "привет" in ostream.getvalue()
+        assert metrics.frames_rendered == 0
+
+        yuio.io.reset_metrics()
+        assert yuio.io.get_metrics() == yuio.io.IoMetrics()
+
+    def test_tasks(self, ostream: io.StringIO, measure_writes):
+        yuio.io.reset_metrics()
+        with yuio.io.Task("task") as task:
+            task.progress(1, 2)
+
+        metrics = yuio.io.get_metrics()
+        assert metrics.frames_rendered > 0
+        assert metrics.layout_ns > 0
+        assert metrics.draw_ns > 0
+        assert metrics.render_ns > 0
+        assert metrics.bytes_written == {
+            "<_MockedOStream>": len(ostream.getvalue().encode())
+        }
+
+    def test_writes_not_measured(self, ostream: io.StringIO):
+        # Byte and time accounting is only done when `YUIO_IO_METRICS` is set.
+        yuio.io.reset_metrics()
+        with yuio.io.Task("task") as task:
+            task.progress(1, 2)
+            yuio.io.info("hello")
+
+        metrics = yuio.io.get_metrics()
+        assert "hello" in ostream.getvalue()
+        assert metrics.frames_rendered > 0
+        assert metrics.bytes_written == {}
+        assert metrics.write_ns == 0
+
+    def test_lock_wait(self):
+        # Lock contention is only measured when `YUIO_IO_METRICS` is set,
+        # so we test IO lock implementation directly.
+        lock = yuio.io._IoLock()
+        yuio.io.reset_metrics()
+        acquired = threading.Event()
+        release = threading.Event()
+
+        def hold_lock():
+            with lock:
+                acquired.set()
+                release.wait()
+
+        thread = threading.Thread(target=hold_lock)
+        thread.start()
+        acquired.wait()
+        threading.Timer(0.05, release.set).start()
+        with lock:
+            pass
+        thread.join()
+
+        metrics = yuio.io.get_metrics()
+        assert metrics.lock_waits == 1
+        assert metrics.lock_wait_ns >= 40_000_000
+
+    def test_summary(self):
+        metrics = yuio.io.IoMetrics(
+            frames_rendered=10,
+            frames_skipped=2,
+            bytes_written={"<stdout>": 5, "<stderr>": 100},
+            layout_ns=1_500_000,
+            lock_waits=1,
+        )
+        assert str(metrics) == textwrap.dedent(
+            """
+            yuio.io metrics:
+              frames rendered: 10, skipped: 2
+              layout: 1.500ms, draw: 0.000ms, render: 0.000ms
+              writing messages: 0.000ms
+              waiting for IO lock: 0.000ms (1 times)
+              bytes written to <stderr>: 100
+              bytes written to <stdout>: 5
+            """
+        ).strip("\n")
+
+    def test_print_at_exit(self):
+        import os
+        import subprocess
+
+        result = subprocess.run(
+            [sys.executable, "-c", "import yuio.io; yuio.io.info('hello')"],
+            env={**os.environ, "YUIO_IO_METRICS": "1"},
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        assert "hello" in result.stderr
+        assert "yuio.io metrics:" in result.stderr
+        assert "bytes written to <stderr>: 6" in result.stderr
+
+    def test_lock_measured_with_metrics(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.delenv("YUIO_IO_METRICS", raising=False)
+        assert type(yuio.io._make_io_lock()) is type(threading.RLock())
+        monkeypatch.setenv("YUIO_IO_METRICS", "1")
+        assert type(yuio.io._make_io_lock()) is yuio.io._IoLock
+
+
+@pytest.mark.bg_updates
+class TestEventLoop:
+    @pytest.fixture
+    def width(self):
+        return 40
+
+    def test_render_from_loop(self, screen: _t.Callable[[], list[str]]):
+        manager = yuio.io._manager()
+
+        async def main():
+            with yuio.io.attach_event_loop():
+                assert manager._thread is None
+
+                async with yuio.io.Task("task") as task:
+                    task.progress(1, 2)
+                    while "1/2" not in "".join(screen()):
+                        await asyncio.sleep(0.01)
+
+                    # Progress can be updated from other threads.
+                    thread = threading.Thread(target=task.progress, args=(2, 2))
+                    thread.start()
+                    thread.join()
+                    while "2/2" not in "".join(screen()):
+                        await asyncio.sleep(0.01)
+
+        asyncio.run(asyncio.wait_for(main(), timeout=5))
+
+        # Background thread is restored.
+        assert manager._thread is not None
+        assert manager._thread.is_alive()
+
+    def test_idle(self, ostream: io.StringIO, monkeypatch: pytest.MonkeyPatch):
+        manager = yuio.io._manager()
+        frames = []
+        loop_frame = manager._loop_frame
+
+        def _loop_frame():
+            frames.append(True)
+            loop_frame()
+
+        monkeypatch.setattr(manager, "_loop_frame", _loop_frame)
+
+        async def main():
+            with yuio.io.attach_event_loop():
+                await asyncio.sleep(0.6)
+
+        asyncio.run(main())
+        assert len(frames) <= 1
+
+    def test_batch_output(self, ostream: io.StringIO):
+        yuio.io.setup(batch_output=True, wrap_stdio=False)
+
+        async def main():
+            with yuio.io.attach_event_loop():
+                yuio.io.info("message")
+                assert "message" not in ostream.getvalue()
+                while "message" not in ostream.getvalue():
+                    await asyncio.sleep(0.01)
+
+        asyncio.run(asyncio.wait_for(main(), timeout=5))
+
+
+@pytest.mark.bg_updates
+class TestBatchOutput:
+    @pytest.fixture
+    def width(self):
+        return 40
+
+    @pytest.fixture(autouse=True)
+    def setup_batch_output(self):
+        yuio.io.setup(batch_output=True, wrap_stdio=False)
+
+    @pytest.fixture
+    def renders(self, monkeypatch: pytest.MonkeyPatch) -> list[bool]:
+        manager = yuio.io._manager()
+        renders = []
+        render = manager.rc.render
+
+        def _render(*args, **kwargs):
+            renders.append(True)
+            render(*args, **kwargs)
+
+        monkeypatch.setattr(manager.rc, "render", _render)
+        return renders
+
+    def test_flush(
+        self,
+        ostream: io.StringIO,
+        renders: list[bool],
+        screen: _t.Callable[[], list[str]],
+    ):
+        task = yuio.io.Task("task")
+
+        with yuio.io._IO_LOCK:
+            # Background thread can't write messages while we're holding the lock.
+            n_renders = len(renders)
+            for i in range(100):
+                yuio.io.info("message %s", i)
+            assert "message" not in ostream.getvalue()
+
+            yuio.io.flush()
+            assert len(renders) == n_renders + 1
+
+        assert screen() == [
+            *[f"message {i}".ljust(40) for i in range(100)],
+            "⣿ task                                  ",
+        ]
+
+        task.done()
+
+    def test_background(self, ostream: io.StringIO):
+        yuio.io.info("message")
+        wait_for(lambda: "message" in ostream.getvalue())
+
+    def test_suspend(self, ostream: io.StringIO, screen: _t.Callable[[], list[str]]):
+        with yuio.io._IO_LOCK:
+            yuio.io.info("before")
+            with yuio.io.SuspendOutput() as s:
+                assert "before" in ostream.getvalue()
+                yuio.io.info("suspended")
+                s.info("during")
+            yuio.io.info("after")
+            yuio.io.flush()
+
+        assert screen() == [
+            "before                                  ",
+            "during                                  ",
+            "suspended                               ",
+            "after                                   ",
+        ]
+
+    def test_many_lines(self, ostream: io.StringIO):
+        with yuio.io._IO_LOCK:
+            for i in range(yuio.io._IoManager.MAX_PENDING_LINES):
+                yuio.io.info("message %s", i)
+            assert "message 0" in ostream.getvalue()
+
+    def test_stop(self, ostream: io.StringIO):
+        yuio.io.info("message")
+        yuio.io._manager().stop()
+        assert "message" in ostream.getvalue()
+
+        yuio.io.info("after stop")
+        assert "after stop" in ostream.getvalue()
+
+
 class TestMessageChannel:
     @pytest.mark.parametrize("enabled", [True, False])
     @pytest.mark.parametrize(("meth", "args", "kwargs", "expected"), MESSAGE_CASES)
@@ -3098,6 +3828,54 @@ class TestSuspendOutput:
                 getattr(yuio.io, meth)(*args, **kwargs)
                 io_mocker.mark()
 
+    def test_deferred_formatting(self, ostream: io.StringIO):
+        n_calls = 0
+
+        class Lazy:
+            def __str__(self):
+                nonlocal n_calls
+                n_calls += 1
+                return "lazy"
+
+        with yuio.io.SuspendOutput() as out:
+            yuio.io.info("Foo %s.", Lazy())
+            assert n_calls == 0
+            assert ostream.getvalue() == ""
+
+            out.info("Bar %s.", Lazy())
+            assert n_calls == 1
+
+        assert n_calls == 2
+        assert RcCompare.from_commands(ostream.getvalue()) == RcCompare(
+            [
+                "Bar lazy.           ",
+                "Foo lazy.           ",
+            ],
+        )
+
+    def test_deferred_formatting_error(self, screen: _t.Callable[[], list[str]]):
+        class Interrupted:
+            def __str__(self):
+                # Regular exceptions are rendered into the message,
+                # but interrupts propagate.
+                raise KeyboardInterrupt()
+
+        task = yuio.io.Task("task")
+        items = [1, 2]
+        with pytest.raises(KeyboardInterrupt):
+            with yuio.io.SuspendOutput():
+                yuio.io.info("Foo %r.", items)
+                yuio.io.info("Bar %s.", Interrupted())
+                items.append(3)
+
+        # Tasks are drawn again even though resume failed.
+        assert screen() == [
+            "Foo [1, 2, 3].      ",
+            "⣿ task              ",
+        ]
+
+        task.done()
+
     @pytest.mark.parametrize(
         "meth",
         [
@@ -3406,3 +4184,400 @@ class TestLog:
             self.logger.error(
                 "m2 `%s`", yuio.io.WithBaseColor("arg", base_color="bold")
             )
+
+    @pytest.mark.parametrize(
+        "fmt",
+        [
+            "%(name)s %(levelname)s %(colMessage)s",
+            "<c b>%(name)s</c> `%(levelname)-10s` %(colMessage)s %% %(message)s",
+            "%(lineno)d %(lineno)5d %(lineno)s %(add_data)s %(add_data_2).2s",
+            "[%(levelname)8.3s] %(extra_data)s %(name)s",
+            "%(colMessage)s%(extra_data)s<c b>%(extra_data)s</c>",
+        ],
+    )
+    @pytest.mark.parametrize("args", [(), ("arg",), (yuio.io.Repr("arg"),)])
+    def test_compiled_format(
+        self,
+        theme: yuio.theme.Theme,
+        monkeypatch: pytest.MonkeyPatch,
+        fmt: str,
+        args: tuple[object, ...],
+    ):
+        import logging
+
+        theme.set_color("log", "yellow")
+        theme.set_color("log:info", "cyan")
+        theme.set_color("log/add_data:info", "red")
+        theme.set_color("log/name:info", "green")
+        theme.set_color("log/lineno", "bold")
+        theme.set_color("log/colMessage:info", "magenta")
+
+        formatter = yuio.io.Formatter(
+            fmt, defaults={"add_data": 10, "add_data_2": "asd"}
+        )
+
+        def format(level: int) -> str:
+            record = logging.LogRecord(
+                "yuio.test.test_log",
+                level,
+                __file__,
+                10,
+                "msg" + " %s" * len(args),
+                args,
+                None,
+            )
+            record.extra_data = yuio.io.WithBaseColor("extra", base_color="blue")
+            return formatter.format(record)
+
+        fast = [format(logging.INFO), format(logging.ERROR)]
+        monkeypatch.setattr(yuio.io, "_compile_log_format", lambda *_: None)
+        formatter = yuio.io.Formatter(
+            fmt, defaults={"add_data": 10, "add_data_2": "asd"}
+        )
+        slow = [format(logging.INFO), format(logging.ERROR)]
+
+        assert fast == slow
+
+    def test_compiled_format_theme_change(self, theme: yuio.theme.Theme):
+        import logging
+
+        formatter = yuio.io.Formatter("%(name)s")
+        record = logging.LogRecord(
+            "yuio.test.test_log", logging.INFO, __file__, 10, "msg", (), None
+        )
+
+        assert formatter.format(record) == "yuio.test.test_log"
+        theme.set_color("log/name", "red")
+        assert formatter.format(record) == "\x1b[;31myuio.test.test_log\x1b[m"
+
+
+class TestQueuedHandler:
+    @pytest.fixture
+    def logger(self):
+        import logging
+
+        logger = logging.getLogger("yuio.test.test_queued_log")
+        logger.setLevel(logging.DEBUG)
+        logger.propagate = False
+
+        yield logger
+
+        for handler in logger.handlers[:]:
+            logger.removeHandler(handler)
+            handler.close()
+
+    def test_simple(self, logger, ostream: io.StringIO):
+        handler = yuio.io.QueuedHandler()
+        logger.addHandler(handler)
+
+        for i in range(100):
+            logger.info("msg %s", i)
+        handler.flush()
+
+        value = ostream.getvalue()
+        assert "yuio.test.test_queued_log INFO msg 0" in value
+        assert "yuio.test.test_queued_log INFO msg 99" in value
+        positions = [value.index(f"msg {i}\n") for i in range(100)]
+        assert positions == sorted(positions)
+
+    def test_does_not_block(self, logger, ostream: io.StringIO):
+        handler = yuio.io.QueuedHandler()
+        logger.addHandler(handler)
+
+        with yuio.io._IO_LOCK:
+            # Main thread holds IO lock, so writer thread can't write anything.
+            logger.info("msg 1")
+            logger.info("msg 2")
+            assert "msg" not in ostream.getvalue()
+
+        handler.flush()
+
+        value = ostream.getvalue()
+        assert "INFO msg 1" in value
+        assert "INFO msg 2" in value
+
+    @staticmethod
+    def block_writer(logger, handler: yuio.io.QueuedHandler) -> threading.Event:
+        # Makes writer thread take a single record and block while formatting it.
+        started = threading.Event()
+        release = threading.Event()
+
+        class BlockingFormatter(yuio.io.Formatter):
+            def format(self, record):
+                if record.getMessage() == "block":
+                    started.set()
+                    release.wait()
+                return super().format(record)
+
+        handler.setFormatter(BlockingFormatter())
+        logger.info("block")
+        started.wait()
+        return release
+
+    def test_drop(self, logger, ostream: io.StringIO):
+        handler = yuio.io.QueuedHandler(
+            max_size=5, overflow=yuio.io.QueuedHandler.Overflow.DROP
+        )
+        logger.addHandler(handler)
+
+        release = self.block_writer(logger, handler)
+        for i in range(20):
+            logger.info("msg %s", i)
+        release.set()
+        handler.flush()
+
+        value = ostream.getvalue()
+        assert handler.dropped == 15
+        assert "INFO msg 4\n" in value
+        assert "INFO msg 5\n" not in value
+        assert "15 log records were dropped because logging queue was full" in value
+
+    def test_drop_oldest(self, logger, ostream: io.StringIO):
+        handler = yuio.io.QueuedHandler(
+            max_size=5, overflow=yuio.io.QueuedHandler.Overflow.DROP_OLDEST
+        )
+        logger.addHandler(handler)
+
+        release = self.block_writer(logger, handler)
+        for i in range(20):
+            logger.info("msg %s", i)
+        release.set()
+        handler.flush()
+
+        value = ostream.getvalue()
+        assert handler.dropped == 15
+        assert "INFO msg 14\n" not in value
+        assert "INFO msg 15\n" in value
+        assert "INFO msg 19\n" in value
+        assert "15 log records were dropped because logging queue was full" in value
+
+    def test_drop_oldest_stop_marker(
+        self, logger, ostream: io.StringIO, monkeypatch: pytest.MonkeyPatch
+    ):
+        import logging
+
+        handler = yuio.io.QueuedHandler(
+            max_size=2, overflow=yuio.io.QueuedHandler.Overflow.DROP_OLDEST
+        )
+        logger.addHandler(handler)
+        records = handler._QueuedHandler__queue  # type: ignore
+
+        release = self.block_writer(logger, handler)
+        # Handler is being closed: stop marker is the oldest record.
+        records.put_nowait(None)
+        logger.info("msg 1")
+
+        emit = yuio.io.Handler.emit
+
+        def emit_and_fill_queue(self, record):
+            emit(self, record)
+            # Another thread fills the queue before the stop marker is put back.
+            records.put_nowait(
+                logging.LogRecord("x", logging.INFO, __file__, 10, "msg 3", (), None)
+            )
+
+        try:
+            with monkeypatch.context() as m:
+                m.setattr(yuio.io.Handler, "emit", emit_and_fill_queue)
+                self.run_with_timeout(lambda: logger.info("msg 2"))
+        finally:
+            release.set()
+        handler.close()
+
+        value = ostream.getvalue()
+        assert "INFO msg 2\n" in value
+        assert "INFO msg 3\n" in value
+        assert handler.dropped == 1
+
+    def test_close(self, logger, ostream: io.StringIO):
+        handler = yuio.io.QueuedHandler()
+        logger.addHandler(handler)
+
+        with yuio.io._IO_LOCK:
+            logger.info("msg 1")
+
+        handler.close()
+        assert "INFO msg 1" in ostream.getvalue()
+
+        # After closing, records are written synchronously.
+        logger.info("msg 2")
+        assert "INFO msg 2" in ostream.getvalue()
+
+    @staticmethod
+    def run_with_timeout(fn):
+        # Runs `fn` in a daemon thread, so that a deadlock fails the test
+        # instead of hanging it.
+        thread = threading.Thread(target=fn, daemon=True)
+        thread.start()
+        thread.join(timeout=5)
+        assert not thread.is_alive(), "deadlock"
+
+    @pytest.mark.parametrize("close", [False, True])
+    def test_block_under_io_lock(self, logger, ostream: io.StringIO, close):
+        handler = yuio.io.QueuedHandler(max_size=2)
+        logger.addHandler(handler)
+
+        def log():
+            with yuio.io._IO_LOCK:
+                # Queue overflows, and writer thread can't drain it
+                # while we're holding IO lock.
+                for i in range(50):
+                    logger.info("msg %s", i)
+                if close:
+                    handler.close()
+                else:
+                    handler.flush()
+
+        self.run_with_timeout(log)
+        self.run_with_timeout(handler.flush)
+
+        value = ostream.getvalue()
+        for i in range(50):
+            assert f"INFO msg {i}\n" in value
+
+    def test_close_with_blocked_producers(self, logger, ostream: io.StringIO):
+        # Logging handler lock lets only one producer wait on the queue.
+        handler = yuio.io.QueuedHandler(max_size=1)
+        logger.addHandler(handler)
+
+        records = handler._QueuedHandler__queue  # type: ignore
+        closing = threading.Event()
+
+        class WaitForRefillFormatter(yuio.io.Formatter):
+            def format(self, record):
+                if closing.is_set():
+                    # Queue was drained; wait until producers fill it again.
+                    closing.clear()
+                    deadline = time.monotonic() + 1
+                    while not records.full() and time.monotonic() < deadline:
+                        time.sleep(0.01)
+                return super().format(record)
+
+        handler.setFormatter(WaitForRefillFormatter())
+
+        def close():
+            with yuio.io.SuspendOutput(), yuio.io._IO_LOCK:
+                # Writer thread is blocked on IO lock, queue is full, and producers
+                # are blocked on the queue. They will fill it as soon as we start
+                # draining it.
+                producers = [
+                    threading.Thread(target=logger.info, args=("msg %s", i))
+                    for i in range(8)
+                ]
+                for producer in producers:
+                    producer.start()
+                time.sleep(0.1)
+                closing.set()
+                handler.close()
+            for producer in producers:
+                producer.join()
+
+        self.run_with_timeout(close)
+
+        value = ostream.getvalue()
+        for i in range(8):
+            assert f"INFO msg {i}\n" in value
+
+
+def _worker_task(i: int):
+    with yuio.io.Task("item %r", [i]) as task:
+        for j in range(10_000):
+            task.progress(j, 10_000)
+        yuio.io.info("done with %s", i)
+
+
+def _worker_nested_tasks():
+    with yuio.io.Task("outer", persistent=True) as task:
+        with task.subtask("inner"):
+            yuio.io.info("message from inner")
+
+
+class TestWorkerTasks:
+    @pytest.fixture(params=["fork", "spawn"])
+    def mp_context(self, request):
+        import multiprocessing
+
+        return multiprocessing.get_context(request.param)
+
+    def test_tasks_and_messages(self, ostream: io.StringIO, mp_context):
+        from concurrent.futures import ProcessPoolExecutor
+
+        with yuio.io.Task("parent") as parent:
+            with yuio.io.WorkerTasks(parent, mp_context=mp_context) as worker_tasks:
+                with ProcessPoolExecutor(
+                    2, mp_context=mp_context, initializer=worker_tasks.initializer
+                ) as pool:
+                    list(pool.map(_worker_task, range(4)))
+
+        value = ostream.getvalue()
+        for i in range(4):
+            assert f"item [{i}]" in value
+            assert f"done with {i}\x1b[m\n" in value
+
+    def test_nested_tasks(self, ostream: io.StringIO):
+        from concurrent.futures import ProcessPoolExecutor
+
+        parent = yuio.io.Task("parent")
+        with yuio.io.WorkerTasks(parent) as worker_tasks:
+            with ProcessPoolExecutor(1, initializer=worker_tasks.initializer) as pool:
+                pool.submit(_worker_nested_tasks).result()
+
+        [outer] = parent._get_children()
+        assert isinstance(outer, yuio.io.Task)
+        assert outer._widget._msg == "outer"
+        assert outer._widget.status == yuio.widget.Task.Status.DONE
+        [inner] = outer._get_children()
+        assert isinstance(inner, yuio.io.Task)
+        assert inner._widget._msg == "inner"
+        assert inner._widget.status == yuio.widget.Task.Status.DONE
+        assert "message from inner\x1b[m\n" in ostream.getvalue()
+        parent.done()
+
+    def test_updates_are_coalesced(self, monkeypatch):
+        from concurrent.futures import ProcessPoolExecutor
+
+        n_frames = 0
+        apply = yuio.io.WorkerTasks._WorkerTasks__apply  # type: ignore
+
+        def counting_apply(self, *args):
+            nonlocal n_frames
+            n_frames += 1
+            apply(self, *args)
+
+        monkeypatch.setattr(yuio.io.WorkerTasks, "_WorkerTasks__apply", counting_apply)
+
+        with yuio.io.WorkerTasks() as worker_tasks:
+            with ProcessPoolExecutor(1, initializer=worker_tasks.initializer) as pool:
+                pool.submit(_worker_task, 0).result()
+
+        # 10000 progress updates, but only a handful of frames.
+        assert 0 < n_frames < 100
+
+
+def test_lazy_imports():
+    import subprocess
+
+    code = textwrap.dedent(
+        """
+        import sys
+        import yuio.io
+        yuio.io.info("hello")
+        print(",".join(sorted(sys.modules)))
+        """
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    modules = set(result.stdout.strip().split(","))
+
+    # These are only needed to ask questions, highlight tracebacks
+    # or run subprocesses, and are imported on first use.
+    for module in [
+        "yuio.complete",
+        "yuio.hl",
+        "yuio.json_schema",
+        "yuio.parse",
+        "subprocess",
+        "tempfile",
+    ]:
+        assert module not in modules
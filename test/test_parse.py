@@ -4,6 +4,9 @@ import math
 import os.path
 import pathlib
 import re
+import signal
+import threading
+import time
 from dataclasses import dataclass
 from decimal import Decimal
 from fractions import Fraction
@@ -398,6 +401,15 @@ class TestStr:
                 _t.Annotated[str, yuio.parse.Str(), yuio.parse.Str()]
             )
 
+    def test_from_type_hint_annotated_error_origin(self):
+        parser = yuio.parse.Str()  # Origin of the error.
+        with pytest.raises(TypeError) as exc_info:
+            yuio.parse.from_type_hint(_t.Annotated[str, yuio.parse.Str(), parser])
+        stack_summary_text = getattr(exc_info.value, "__yuio_stack_summary_text__")
+        assert "test_from_type_hint_annotated_error_origin" in stack_summary_text
+        assert "# Origin of the error." in stack_summary_text
+        assert "yuio/parse.py" not in stack_summary_text
+
 
 class TestInt:
     def test_basics(self):
@@ -3291,3 +3303,167 @@ class TestSecret:
             match=r"^In \$\[1\]:\n  Expected int, got str$",
         ):
             parser.parse_config([10, "xxx", 12])
+
+
+class TestFromTypeHintCache:
+    @pytest.fixture(autouse=True)
+    def setup_cache(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(
+            yuio.parse,
+            "_FROM_TYPE_HINT_CALLBACKS",
+            list(yuio.parse._FROM_TYPE_HINT_CALLBACKS),
+        )
+        monkeypatch.setattr(yuio.parse, "_FROM_TYPE_HINT_CACHE", {})
+
+    def test_cached(self):
+        parser = yuio.parse.from_type_hint(list[pathlib.Path])
+        assert yuio.parse.from_type_hint(list[pathlib.Path]) is parser
+        assert yuio.parse.from_type_hint(dict[str, int]) is not parser
+
+    def test_union_order(self):
+        parser = yuio.parse.from_type_hint(int | str)
+        assert parser.describe() == "{<int>|<str>}"
+        parser = yuio.parse.from_type_hint(str | int)
+        assert parser.describe() == "{<str>|<int>}"
+        parser = yuio.parse.from_type_hint(list[str | int])
+        assert parser.describe() == "{<str>|<int>}[ {<str>|<int>}[ ...]]"
+
+    def test_literal_types(self):
+        parser = yuio.parse.from_type_hint(_t.Literal[1])
+        assert type(parser.parse("1")) is int
+        parser = yuio.parse.from_type_hint(_t.Literal[True])
+        assert type(parser.parse("1")) is bool
+
+    def test_delimiter_depth(self):
+        parser = yuio.parse.from_type_hint(list[int])
+        assert parser._delimiter is None  # type: ignore
+        parser = yuio.parse.from_type_hint(list[list[int]])
+        assert parser._delimiter is None  # type: ignore
+        assert parser._inner._delimiter == ","  # type: ignore
+
+    def test_annotated(self):
+        hint = _t.Annotated[int, yuio.parse.Ge(0)]
+        parser = yuio.parse.from_type_hint(hint)
+        assert yuio.parse.from_type_hint(hint) is parser
+        parser_2 = yuio.parse.from_type_hint(_t.Annotated[int, yuio.parse.Ge(0)])
+        assert parser_2 is not parser
+
+    @pytest.mark.parametrize(
+        ("ty", "annotation", "value", "expected"),
+        [
+            (
+                dict[str, int],
+                yuio.parse.Dict(pair_delimiter="="),
+                "a:1 b:2",
+                {"a": 1, "b": 2},
+            ),
+            (
+                dict[str, int],
+                yuio.parse.Dict(delimiter=","),
+                "a:1 b:2",
+                {"a": 1, "b": 2},
+            ),
+            (list[int], yuio.parse.List(delimiter=","), "1 2", [1, 2]),
+            (tuple[int, str], yuio.parse.Tuple(delimiter=","), "1 a", (1, "a")),
+            (int, yuio.parse.Ge(0), "-1", -1),
+            (str, yuio.parse.Map(str.lower), "ABC", "ABC"),
+            (list[int], yuio.parse.LenLe(1), "1 2", [1, 2]),
+        ],
+    )
+    def test_annotated_does_not_change_cached_parser(
+        self, ty, annotation, value, expected
+    ):
+        parser = yuio.parse.from_type_hint(ty)
+        description = parser.describe()
+        yuio.parse.from_type_hint(_t.Annotated[ty, annotation])
+        assert yuio.parse.from_type_hint(ty) is parser
+        assert parser.describe() == description
+        assert parser.parse(value) == expected
+
+    def test_unhashable(self):
+        hint = _t.Annotated[int, yuio.parse.Ge(0), ["unhashable"]]
+        parser = yuio.parse.from_type_hint(hint)
+        assert parser.parse("10") == 10
+        assert yuio.parse.from_type_hint(hint) is not parser
+
+    def test_invalidated(self):
+        class MyType:
+            pass
+
+        parser = yuio.parse.from_type_hint(int)
+        assert yuio.parse._FROM_TYPE_HINT_CACHE
+
+        yuio.parse.register_type_hint_conversion(
+            lambda ty, origin, args: yuio.parse.Str() if ty is MyType else None
+        )
+        assert not yuio.parse._FROM_TYPE_HINT_CACHE
+        assert yuio.parse.from_type_hint(int) is not parser
+        assert isinstance(yuio.parse.from_type_hint(MyType), yuio.parse.Str)
+
+    def test_errors_not_cached(self):
+        class MyType:
+            pass
+
+        with pytest.raises(TypeError, match=r"unsupported type"):
+            yuio.parse.from_type_hint(list[MyType])
+
+        yuio.parse.register_type_hint_conversion(
+            lambda ty, origin, args: yuio.parse.Str() if ty is MyType else None
+        )
+        parser = yuio.parse.from_type_hint(list[MyType])
+        assert isinstance(parser, yuio.parse.List)
+
+    def test_bounded(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(yuio.parse, "_FROM_TYPE_HINT_CACHE_SIZE", 2)
+
+        parser = yuio.parse.from_type_hint(int)
+        yuio.parse.from_type_hint(str)
+        assert yuio.parse.from_type_hint(int) is parser
+        yuio.parse.from_type_hint(float)
+        assert len(yuio.parse._FROM_TYPE_HINT_CACHE) == 2
+        assert yuio.parse.from_type_hint(int) is parser
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="requires fork")
+    def test_fork_while_locked(self):
+        locked = threading.Event()
+        release = threading.Event()
+
+        def worker():
+            with yuio.parse._FROM_TYPE_HINT_CACHE_LOCK:
+                locked.set()
+                release.wait()
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        locked.wait()
+        threading.Timer(0.1, release.set).start()
+        try:
+            pid = os.fork()
+            if pid == 0:  # pragma: no cover
+                code = 1
+                try:
+                    yuio.parse.from_type_hint(list[int])
+                    code = 0
+                finally:
+                    os._exit(code)
+            deadline = time.monotonic() + 10
+            while True:
+                wpid, status = os.waitpid(pid, os.WNOHANG)
+                if wpid != 0:
+                    break
+                if time.monotonic() > deadline:
+                    os.kill(pid, signal.SIGKILL)
+                    os.waitpid(pid, 0)
+                    pytest.fail("forked process deadlocked")
+                time.sleep(0.01)
+            assert os.waitstatus_to_exitcode(status) == 0
+        finally:
+            release.set()
+            thread.join()
+
+    def test_annotated_does_not_override_type_hint(self):
+        parser = yuio.parse.from_type_hint(int)
+        yuio.parse.from_type_hint(_t.Annotated[int, "some annotation"])
+        assert parser._Parser__typehint is int  # type: ignore
+        with pytest.raises(TypeError, match=r"annotating int with Str conflicts"):
+            yuio.parse.from_type_hint(_t.Annotated[int, yuio.parse.Str()])
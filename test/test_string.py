@@ -10,6 +10,8 @@ import yuio.theme
 from yuio.color import Color
 from yuio.string import NO_WRAP_END, NO_WRAP_START, Esc, LinkMarker, ReprContext
 
+from .conftest import RcCompare
+
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -175,6 +177,43 @@ def test_width_and_len(text, width, length):
     assert bool(text) is (len(text) > 0)
 
 
+def _reference_line_width(s: str) -> int:
+    import unicodedata
+
+    return sum(
+        (unicodedata.east_asian_width(c) in "WF") + 1
+        for c in s
+        if unicodedata.category(c)[0] not in "MC"
+    )
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "",
+        "abc",
+        "\u00e9t\u00e9\u00ad\u0085",
+        "e\u0301",
+        "привет",
+        "日本語のテキスト",
+        "👩🏽\u200d💻",
+        "\u200b\ufeff\x00",
+        "mixed текст 混合 テキスト 👻" * 20,
+        "long " * 100 + "日本",
+    ],
+)
+def test_line_width(text):
+    assert yuio.string.line_width(text) == _reference_line_width(text)
+    # Second time result comes from cache.
+    assert yuio.string.line_width(text) == _reference_line_width(text)
+
+
+def test_line_width_code_points():
+    for cp in [*range(0x80, 0x3400), *range(0x3400, 0x110000, 97)]:
+        c = chr(cp)
+        assert yuio.string.line_width(c) == _reference_line_width(c), hex(cp)
+
+
 @pytest.mark.parametrize(
     ("l", "r", "expected"),
     [
@@ -192,6 +231,119 @@ def test_eq(l, r, expected):
     assert (l != r) is (not expected)
 
 
+def test_as_code():
+    s = _s(
+        Color.FORE_RED,
+        "a",
+        Color.FORE_RED | Color.STYLE_BOLD,
+        "b",
+        LinkMarker("https://example.com"),
+        Color.FORE_GREEN,
+        "c",
+    )
+    ansi = yuio.color.ColorSupport.ANSI
+    assert s.as_code(ansi) == [
+        "\x1b[;31m",
+        "a",
+        "\x1b[;31;1m",
+        "b",
+        "\x1b]8;;",
+        "https://example.com",
+        "\x1b\\",
+        "\x1b[;32m",
+        "c",
+        "\x1b[m",
+        "\x1b]8;;\x1b\\",
+    ]
+    assert s.as_code(ansi, delta=True) == [
+        "\x1b[;31m",
+        "a",
+        "\x1b[1m",
+        "b",
+        "\x1b]8;;",
+        "https://example.com",
+        "\x1b\\",
+        "\x1b[;32m",
+        "c",
+        "\x1b[m",
+        "\x1b]8;;\x1b\\",
+    ]
+    assert s.as_code(yuio.color.ColorSupport.NONE, delta=True) == ["a", "b", "c"]
+
+
+@pytest.mark.parametrize("max_parts", [1, 2, 3, 5, 1000])
+@pytest.mark.parametrize(
+    "color_support", [yuio.color.ColorSupport.NONE, yuio.color.ColorSupport.ANSI]
+)
+def test_iter_as_code(max_parts, color_support):
+    parts = [
+        NO_WRAP_START,
+        _s(Color.FORE_RED, "a", Color.FORE_GREEN, "b"),
+        "\n",
+        _s(Color.FORE_GREEN, "c", LinkMarker("https://example.com"), "d"),
+        "\n",
+        _s(LinkMarker("https://example.com"), "e", Color.FORE_BLUE, "f"),
+        NO_WRAP_END,
+        Color.NONE,
+        "\n",
+    ]
+    chunks = list(yuio.string._iter_as_code(parts, color_support, max_parts))
+    if max_parts < 5:
+        assert len(chunks) > 1
+        # First color of every chunk is a full code, the rest are deltas.
+        for chunk in chunks:
+            codes = [part for part in chunk if part.startswith("\x1b[")]
+            if codes:
+                assert codes[0] == "\x1b[m" or codes[0].startswith("\x1b[;")
+        assert RcCompare.from_commands("".join(sum(chunks, []))) == (
+            RcCompare.from_commands("".join(_s(*parts).as_code(color_support)))
+        )
+    else:
+        assert sum(chunks, []) == _s(*parts).as_code(color_support, delta=True)
+
+    if color_support == yuio.color.ColorSupport.NONE:
+        chunks = list(yuio.string._iter_plain(parts, max_parts))
+        assert sum(chunks, []) == _s(*parts).as_code(color_support)
+
+
+def test_copies_are_independent():
+    s1 = _s(Color.FORE_RED, "red", yuio.string.NO_WRAP_START, "nowrap")
+    s2 = s1.copy()
+    s3 = _s(s1)
+    s4 = _s()
+    s4 += s1
+    s5 = s1 + ""
+
+    s1 += "more"
+    s2.end_no_wrap()
+    s3 += Color.FORE_GREEN
+    s3 += "green"
+    s4.start_link("https://example.com")
+    s4 += "link"
+
+    assert s1._parts == [Color.FORE_RED, "red", NO_WRAP_START, "nowrap", "more"]
+    assert s2._parts == [Color.FORE_RED, "red", NO_WRAP_START, "nowrap", NO_WRAP_END]
+    assert s3._parts == [
+        Color.FORE_RED,
+        "red",
+        NO_WRAP_START,
+        "nowrap",
+        Color.FORE_GREEN,
+        "green",
+    ]
+    assert s4._parts == [
+        Color.FORE_RED,
+        "red",
+        NO_WRAP_START,
+        "nowrap",
+        NO_WRAP_END,
+        LinkMarker("https://example.com"),
+        Color.NONE,
+        "link",
+    ]
+    assert s5._parts == [Color.FORE_RED, "red", NO_WRAP_START, "nowrap"]
+
+
 @pytest.mark.parametrize(
     ("text", "expected"),
     [
@@ -526,6 +678,40 @@ def test_colorize(text, kwargs, expect, ctx):
     assert formatted._parts == expect
 
 
+def test_colorize_cached(ctx):
+    s1 = yuio.string.colorize("<c red>hello</c>", ctx=ctx)
+    s1 += " world"
+    s2 = yuio.string.colorize("<c red>hello</c>", ctx=ctx)
+    assert s2._parts == [Color.FORE_RED, "hello"]
+
+    f1 = yuio.string.colorize("<c red>%s</c> `%d`", "x", 1, ctx=ctx)
+    f2 = yuio.string.colorize("<c red>%s</c> `%d`", "y", 2, ctx=ctx)
+    assert f1._parts == [
+        Color.FORE_RED,
+        "x",
+        Color.NONE,
+        " ",
+        NO_WRAP_START,
+        Color.FORE_MAGENTA,
+        "1",
+        NO_WRAP_END,
+    ]
+    assert f2._parts == [
+        Color.FORE_RED,
+        "y",
+        Color.NONE,
+        " ",
+        NO_WRAP_START,
+        Color.FORE_MAGENTA,
+        "2",
+        NO_WRAP_END,
+    ]
+
+    ctx.theme.set_color("red", Color.FORE_GREEN)
+    s3 = yuio.string.colorize("<c red>hello</c>", ctx=ctx)
+    assert s3._parts == [Color.FORE_GREEN, "hello"]
+
+
 @pytest.mark.parametrize(
     ("text", "expect"),
     [
@@ -2709,6 +2895,36 @@ def test_wrap(text, width, kwargs, expect):
     raw = [line._parts for line in wrapped]
     assert raw == expect
 
+    wrapped = _s(text).iter_wrap(width, **kwargs)
+    raw = [line._parts for line in wrapped]
+    assert raw == expect
+
+
+@pytest.mark.parametrize("preserve_newlines", [True, False])
+def test_iter_wrap_single_part(preserve_newlines):
+    wrapper = yuio.string._TextWrapper(
+        10,
+        preserve_spaces=False,
+        preserve_newlines=preserve_newlines,
+        break_long_words=True,
+        break_long_nowrap_words=False,
+        overflow=False,
+        indent=0,
+        continuation_indent=None,
+    )
+    text = _s("word word\n" * 1000)
+
+    lines = []
+    for line in wrapper.iter_wrap(text):
+        # Lines are handed out as soon as they're finished, even though
+        # the whole text is a single part.
+        assert len(wrapper.lines) <= 1
+        lines.append(line._parts)
+
+    expect = text.wrap(10, preserve_newlines=preserve_newlines)
+    assert lines == [line._parts for line in expect]
+    assert len(lines) >= 1000
+
 
 @pytest.mark.parametrize(
     ("text", "indent", "continuation_indent", "expect"),
@@ -4547,6 +4763,62 @@ def test_colorized_repr(value, expected, multiline, highlighted, max_depth, ctx)
     ) == _join_consecutive_strings(expected)
 
 
+@pytest.mark.parametrize(
+    ("value", "kwargs", "expected"),
+    [
+        pytest.param(
+            list(range(10)),
+            {"max_items": 3},
+            "[0, 1, 2, …(7 more)]",
+            id="list",
+        ),
+        pytest.param(
+            list(range(3)),
+            {"max_items": 3},
+            "[0, 1, 2]",
+            id="list-fits",
+        ),
+        pytest.param(
+            {"a": 1, "b": 2, "c": 3},
+            {"max_items": 1},
+            "{'a': 1, …(2 more)}",
+            id="dict",
+        ),
+        pytest.param(
+            collections.deque(range(10), maxlen=20),
+            {"max_items": 2},
+            "deque([0, 1, …(8 more)], maxlen=20)",
+            id="deque",
+        ),
+        pytest.param(
+            [list(range(5)), list(range(5))],
+            {"max_items": 2, "multiline": True},
+            "[\n  [\n    0,\n    1,\n    …(3 more)\n  ],\n  [\n    0,\n    1,\n    …(3 more)\n  ]\n]",
+            id="nested-multiline",
+        ),
+        pytest.param(
+            [list(range(10))] * 3,
+            {"max_chars": 20},
+            "[[0, 1, 2, 3, 4, 5, 6, …(3 more)], …(2 more)]",
+            id="chars",
+        ),
+        pytest.param(
+            list(range(1_000_000)),
+            {"max_chars": 10},
+            "[0, 1, 2, 3, …(999996 more)]",
+            id="chars-huge",
+        ),
+    ],
+)
+def test_colorized_repr_budget(value, kwargs, expected, ctx):
+    assert str(ctx.repr(value, **kwargs)) == expected
+
+
+def test_colorized_repr_budget_ascii():
+    ctx = yuio.string.ReprContext.make_dummy(is_unicode=False)
+    assert str(ctx.repr([1, 2, 3], max_items=1)) == "[1, ...(2 more)]"
+
+
 @yuio.string.repr_from_rich
 class RFREmpty:
     def __rich_repr__(self):
@@ -1,6 +1,10 @@
 import dataclasses
+import os
 import pathlib
+import signal
 import textwrap
+import threading
+import time
 import warnings
 
 import pytest
@@ -265,6 +269,140 @@ class TestColors:
         assert a.get_color("x/y") == yuio.color.Color.FORE_RED
         assert a.get_color("z") == yuio.color.Color.FORE_BLUE
 
+    def test_precompile_colors(self):
+        class A(yuio.theme.Theme):
+            colors = {
+                "x": yuio.color.Color.STYLE_BOLD,
+                "y": yuio.color.Color.FORE_RED,
+                "z": "x y",
+            }
+
+        a = A()
+        a._precompile_colors()
+
+        assert (
+            a.get_color("z") == yuio.color.Color.FORE_RED | yuio.color.Color.STYLE_BOLD
+        )
+        assert a.get_color("x y") == a.get_color("z")
+
+        a.set_color("y", yuio.color.Color.FORE_BLUE)
+
+        assert (
+            a.get_color("z") == yuio.color.Color.FORE_BLUE | yuio.color.Color.STYLE_BOLD
+        )
+        assert a.get_color("x y") == a.get_color("z")
+
+    def test_precompile_colors_while_setting_colors(self):
+        theme = yuio.theme.DefaultTheme(yuio.term.Term.make_dummy())
+        errors = []
+        done = threading.Event()
+
+        def worker():
+            while not done.is_set():
+                try:
+                    theme._precompile_colors()
+                except Exception as e:
+                    errors.append(e)
+                    return
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        try:
+            for i in range(500):
+                theme.set_color(f"x{i}", yuio.color.Color.FORE_RED)
+        finally:
+            done.set()
+            thread.join()
+
+        assert errors == []
+        assert theme.get_color("x499") == yuio.color.Color.FORE_RED
+
+    def test_precompile_colors_stops_on_change(self, monkeypatch):
+        class A(yuio.theme.Theme):
+            colors = {f"x{i}": yuio.color.Color.FORE_RED for i in range(100)}
+
+        a = A()
+        paths = []
+        get_color = a.get_color
+
+        def get_color_and_change(path):
+            paths.append(path)
+            a.set_color("y", yuio.color.Color.FORE_BLUE)
+            return get_color(path)
+
+        monkeypatch.setattr(a, "get_color", get_color_and_change)
+        a._precompile_colors()
+
+        assert paths == ["x0"]
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="requires fork")
+    def test_fork_while_precompiling_colors(self):
+        theme = yuio.theme.DefaultTheme(yuio.term.Term.make_dummy())
+        done = threading.Event()
+
+        def worker():
+            while not done.is_set():
+                theme.set_color("x", yuio.color.Color.NONE)  # Drop cached colors.
+                theme._precompile_colors()
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        try:
+            for _ in range(20):
+                pid = os.fork()
+                if pid == 0:  # pragma: no cover
+                    code = 1
+                    try:
+                        with warnings.catch_warnings():
+                            warnings.simplefilter(
+                                "error", yuio.theme.RecursiveThemeWarning
+                            )
+                            for path in theme.colors:
+                                theme.get_color(path)
+                        code = 0
+                    finally:
+                        os._exit(code)
+
+                deadline = time.monotonic() + 10
+                while True:
+                    wpid, status = os.waitpid(pid, os.WNOHANG)
+                    if wpid != 0:
+                        break
+                    if time.monotonic() > deadline:
+                        os.kill(pid, signal.SIGKILL)
+                        os.waitpid(pid, 0)
+                        pytest.fail("forked process deadlocked")
+                    time.sleep(0.01)
+                assert os.waitstatus_to_exitcode(status) == 0
+        finally:
+            done.set()
+            thread.join()
+
+    def test_get_color_from_threads(self):
+        theme = yuio.theme.DefaultTheme(yuio.term.Term.make_dummy())
+        expected = {path: theme.get_color(path) for path in theme.colors}
+        theme.set_color("x", yuio.color.Color.NONE)  # Drop cached colors.
+
+        barrier = threading.Barrier(8)
+        results = []
+
+        def worker():
+            barrier.wait()
+            results.append({path: theme.get_color(path) for path in theme.colors})
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", yuio.theme.RecursiveThemeWarning)
+            threads = [threading.Thread(target=worker) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        assert len(results) == 8
+        for result in results:
+            del result["x"]
+            assert result == expected
+
     def test_set_color_if_not_overridden_error_outside_of_init(self):
         class A(yuio.theme.Theme):
             colors = {
@@ -611,7 +749,12 @@ class TestDefaultTheme:
 
 class TestLoad:
     @pytest.fixture(autouse=True)
-    def setup_theme_file(self, tmp_path: pathlib.Path):
+    def setup_theme_file(self, tmp_path: pathlib.Path, monkeypatch):
+        self.cache = tmp_path / "cache"
+        monkeypatch.setenv("XDG_CACHE_HOME", str(self.cache))
+        monkeypatch.setenv("LOCALAPPDATA", str(self.cache))
+        monkeypatch.delenv("YUIO_THEME_CACHE", raising=False)
+
         self.ok = tmp_path / "ok.json"
         self.ok.write_text(
             textwrap.dedent(
@@ -717,3 +860,70 @@ class TestLoad:
         with pytest.warns(yuio.theme.ThemeWarning):
             theme = yuio.theme.load(term)
         assert theme.progress_bar_width == 15
+
+    def test_cached(self, term, monkeypatch):
+        monkeypatch.setenv("YUIO_THEME_PATH", str(self.include))
+        yuio.theme.load(term)
+        assert list(self.cache.glob("yuio/themes/*.json"))
+
+        def fail(*args):
+            raise AssertionError("theme should be loaded from cache")
+
+        monkeypatch.setattr(yuio.theme, "_load_theme_data", fail)
+        theme = yuio.theme.load(term)
+
+        assert theme.progress_bar_width == 25
+        assert theme.get_color("red") == yuio.color.Color.fore_from_rgb(
+            0xFF, 0x00, 0x00
+        )
+        assert theme.get_color("green") == yuio.color.Color.fore_from_rgb(
+            0x55, 0xFF, 0x55
+        )
+        assert theme.msg_decorations_unicode["heading/1"] == "=> "
+
+    def test_cache_invalidated(self, term, monkeypatch):
+        monkeypatch.setenv("YUIO_THEME_PATH", str(self.include))
+        theme = yuio.theme.load(term)
+        assert theme.progress_bar_width == 25
+
+        # Change an included file, cache should notice.
+        self.ok.write_text('{"progress_bar_width": 30}')
+        theme = yuio.theme.load(term)
+        assert theme.progress_bar_width == 30
+        assert theme.get_color("red") == yuio.color.Color.fore_from_rgb(
+            0xFF, 0x00, 0x00
+        )
+
+    def test_cache_disabled(self, term, monkeypatch):
+        monkeypatch.setenv("YUIO_THEME_PATH", str(self.ok))
+        monkeypatch.setenv("YUIO_THEME_CACHE", "0")
+        theme = yuio.theme.load(term)
+        assert theme.progress_bar_width == 25
+        assert not self.cache.exists()
+
+    def test_invalid_not_cached(self, term, monkeypatch):
+        monkeypatch.setenv("YUIO_THEME_PATH", str(self.invalid))
+        with pytest.warns(yuio.theme.ThemeWarning):
+            yuio.theme.load(term)
+        with pytest.warns(yuio.theme.ThemeWarning):
+            theme = yuio.theme.load(term)
+        assert theme.progress_bar_width == 15
+        assert not list(self.cache.glob("yuio/themes/*.json"))
+
+    def test_broken_cache(self, term, monkeypatch):
+        monkeypatch.setenv("YUIO_THEME_PATH", str(self.ok))
+        yuio.theme.load(term)
+        for cache_file in self.cache.glob("yuio/themes/*.json"):
+            cache_file.write_text("broken json")
+        theme = yuio.theme.load(term)
+        assert theme.progress_bar_width == 25
+
+    def test_include_cycle(self, term, monkeypatch, tmp_path: pathlib.Path):
+        a = tmp_path / "a.json"
+        b = tmp_path / "b.json"
+        a.write_text('{"include": "b.json", "progress_bar_width": 20}')
+        b.write_text('{"include": "a.json", "fallback_width": 70}')
+        monkeypatch.setenv("YUIO_THEME_PATH", str(a))
+        theme = yuio.theme.load(term)
+        assert theme.progress_bar_width == 20
+        assert theme.fallback_width == 70
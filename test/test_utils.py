@@ -1,3 +1,8 @@
+import importlib.util
+import pathlib
+import sys
+import textwrap
+
 import pytest
 
 import yuio
@@ -142,6 +147,90 @@ def test_find_docs(obj, expected):
     assert yuio.util.find_docs(obj) == expected
 
 
+class TestFindDocsCache:
+    SOURCE = textwrap.dedent(
+        """
+        import sys
+
+        class Docs:
+            #: Doc for foo.
+            foo: int
+
+            class Nested:
+                bar: int
+                \"\"\"Doc for bar.\"\"\"
+
+        def docs_fn(
+            #: Doc for baz.
+            baz,
+        ): ...
+
+        if sys.version_info >= (3, 0):
+            class Twice:
+                #: First.
+                qux: int
+        else:
+            class Twice:
+                #: Second.
+                qux: int
+        """
+    )
+
+    @pytest.fixture(autouse=True)
+    def setup_module(self, tmp_path: pathlib.Path, monkeypatch):
+        self.cache = tmp_path / "cache"
+        monkeypatch.setenv("XDG_CACHE_HOME", str(self.cache))
+        monkeypatch.setenv("LOCALAPPDATA", str(self.cache))
+        monkeypatch.setenv("YUIO_DOCS_CACHE", "1")
+        monkeypatch.setattr(yuio.util, "_MODULE_DOCS_CACHE", {})
+        self.monkeypatch = monkeypatch
+
+        self.path = tmp_path / "docs_module.py"
+        self.path.write_text(self.SOURCE)
+
+    def load_module(self):
+        spec = importlib.util.spec_from_file_location("docs_module", self.path)
+        assert spec is not None
+        assert spec.loader is not None
+        module = importlib.util.module_from_spec(spec)
+        self.monkeypatch.setitem(sys.modules, "docs_module", module)
+        spec.loader.exec_module(module)
+        return module
+
+    def test_find_docs(self):
+        module = self.load_module()
+        assert yuio.util.find_docs(module.Docs) == {"foo": "Doc for foo."}
+        assert yuio.util.find_docs(module.Docs.Nested) == {"bar": "Doc for bar."}
+        assert yuio.util.find_docs(module.docs_fn) == {"baz": "Doc for baz."}
+
+        # Ambiguous definitions are inspected separately.
+        assert yuio.util.find_docs(module.Twice) == {"qux": "First."}
+        assert yuio.util._find_module_docs(str(self.path))["Twice"] is None  # type: ignore
+
+    def test_cached(self, monkeypatch):
+        module_docs = yuio.util._find_module_docs(str(self.path))
+        assert list(self.cache.glob("yuio/docs/*.json"))
+
+        def fail(*args):
+            raise AssertionError("docs should be loaded from cache")
+
+        monkeypatch.setattr(yuio.util, "_MODULE_DOCS_CACHE", {})
+        monkeypatch.setattr(yuio.util, "_find_def_docs", fail)
+        assert yuio.util._find_module_docs(str(self.path)) == module_docs
+
+    def test_cache_invalidated(self):
+        yuio.util._find_module_docs(str(self.path))
+
+        self.path.write_text(self.SOURCE.replace("Doc for foo.", "New doc."))
+        yuio.util._MODULE_DOCS_CACHE.clear()
+        assert yuio.util.find_docs(self.load_module().Docs) == {"foo": "New doc."}
+
+    def test_cache_disabled(self, monkeypatch):
+        monkeypatch.setenv("YUIO_DOCS_CACHE", "0")
+        assert yuio.util.find_docs(self.load_module().Docs) == {"foo": "Doc for foo."}
+        assert not self.cache.exists()
+
+
 @pytest.mark.parametrize(
     ("doc", "expected"),
     [
@@ -1,5 +1,9 @@
+import asyncio
 import io
+import os
 import string
+import threading
+import time
 
 import pytest
 
@@ -544,6 +548,42 @@ class TestRenderContext:
         # so we can use a CSI code to move down 5 lines at once.
         assert s == "\x1b[4B22\x1b[4A\x1b[1G"
 
+    def test_unchanged_rows(self, ostream: io.StringIO, rc: yuio.widget.RenderContext):
+        rc.write("11")
+        rc.new_line()
+        rc.write("22")
+        rc.render()
+
+        l = len(ostream.getvalue())
+
+        # Nothing changed, nothing is redrawn.
+        rc.prepare()
+        rc.write("11")
+        rc.new_line()
+        rc.write("22")
+        rc.render()
+
+        assert ostream.getvalue()[l:] == ""
+
+        # Only the second row is redrawn.
+        rc.prepare()
+        rc.write("11")
+        rc.new_line()
+        rc.write("23")
+        rc.render()
+
+        assert ostream.getvalue()[l:] == "\x1b[1B\x1b[2G3\x1b[1A\x1b[1G"
+
+        assert RcCompare.from_commands(ostream.getvalue()) == RcCompare(
+            [
+                "11                  ",
+                "23                  ",
+                "                    ",
+                "                    ",
+                "                    ",
+            ]
+        )
+
     def test_write_text(self, ostream: io.StringIO, rc: yuio.widget.RenderContext):
         rc.set_pos(1, 1)
         rc.write_text(["Hello,", "world!"])
@@ -4499,15 +4539,90 @@ class TestInputWithCompletion:
         ),
     ],
 )
+@pytest.mark.parametrize("is_async", [False, True])
 def test_event_stream(
     keycodes: list[str],
     expected: list[yuio.widget.KeyboardEvent],
+    is_async: bool,
     monkeypatch,
 ):
     keycode_iter = iter(keycodes)
-    monkeypatch.setattr("yuio.term._read_keycode", lambda *_: next(keycode_iter, "$"))
+    monkeypatch.setattr(
+        "yuio.term._read_keycode", lambda *_, **__: next(keycode_iter, "$")
+    )
+
+    if is_async:
+
+        async def read_events(n):
+            stream = yuio.widget._async_event_stream(None, None)  # type: ignore
+            return [await stream.__anext__() for _ in range(n)]
+
+        events = asyncio.run(read_events(len(expected) + 1))
+        assert events == [*expected, yuio.widget.KeyboardEvent("$")]
+    else:
+        stream = yuio.widget._event_stream(None, None)  # type: ignore
+        for event in expected:
+            assert next(stream) == event
+        assert next(stream) == yuio.widget.KeyboardEvent("$")
+
+
+@pytest.mark.skipif(os.name != "posix", reason="requires pipes with add_reader")
+def test_async_event_stream_reader():
+    read_fd, write_fd = os.pipe()
+    with open(read_fd) as istream:
+
+        async def main():
+            loop = asyncio.get_running_loop()
+            stream = yuio.widget._async_event_stream(None, istream)  # type: ignore
+
+            # Event loop isn't blocked while we're waiting for input.
+            loop.call_later(0.05, os.write, write_fd, b"a\x1b[A")
+            assert await stream.__anext__() == yuio.widget.KeyboardEvent("a")
+            assert await stream.__anext__() == yuio.widget.KeyboardEvent(
+                yuio.widget.Key.ARROW_UP
+            )
+
+            # Paste is split between reads.
+            loop.call_later(0.05, os.write, write_fd, b"\x1b[200~ab")
+            loop.call_later(0.1, os.write, write_fd, b"c\x1b[201~")
+            assert await stream.__anext__() == yuio.widget.KeyboardEvent(
+                yuio.widget.Key.PASTE, paste_str="abc"
+            )
+
+            await stream.aclose()
+
+        try:
+            asyncio.run(asyncio.wait_for(main(), timeout=5))
+        finally:
+            os.close(write_fd)
+
+
+def test_async_event_stream_thread_cancelled(monkeypatch):
+    input_ready = threading.Event()
+    consumed = []
+
+    def read_keycode(*_, timeout: float = 0, **__):
+        if not input_ready.wait(timeout):
+            raise TimeoutError()
+        consumed.append("a")
+        return "a"
+
+    monkeypatch.setattr("yuio.term._read_keycode", read_keycode)
+
+    async def main():
+        # Stream has no file descriptor, so input is read in a thread.
+        stream = yuio.widget._async_event_stream(None, None)  # type: ignore
+        task = asyncio.ensure_future(stream.__anext__())
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(asyncio.wait_for(main(), timeout=5))
 
-    stream = yuio.widget._event_stream(None, None)  # type: ignore
-    for event in expected:
-        assert next(stream) == event
-    assert next(stream) == yuio.widget.KeyboardEvent("$")
+    # Worker thread stops after cancellation, and doesn't consume input
+    # meant for other readers.
+    time.sleep(0.3)
+    input_ready.set()
+    time.sleep(0.2)
+    assert consumed == []
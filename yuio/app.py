@@ -429,7 +429,6 @@ import yuio
 import yuio.cli
 import yuio.complete
 import yuio.config
-import yuio.dbg
 import yuio.doc
 import yuio.io
 import yuio.parse
@@ -470,6 +469,9 @@ if TYPE_CHECKING:
 else:
     from yuio import _typing as _t
 
+if TYPE_CHECKING:
+    import yuio.dbg
+
 __all__ = [
     "MISC_GROUP",
     "OPTS_GROUP",
@@ -1249,7 +1251,8 @@ class App(_t.Generic[C]):
         if "--yuio-custom-completer--" in args:
             index = args.index("--yuio-custom-completer--")
             _run_custom_completer(
-                self._make_cli_command(prog, is_root=True),
+                self,
+                prog,
                 args[index + 1],
                 args[index + 2],
             )
@@ -1515,31 +1518,49 @@ def _command_from_callable_run_impl(
     return run
 
 
-def _run_custom_completer(command: yuio.cli.Command[_t.Any], raw_data: str, word: str):
+def _run_custom_completer(app: App[_t.Any], prog: str, raw_data: str, word: str):
+    # This runs on every TAB press, so we only load subcommands that lie
+    # on the completed path, and only build CLI commands we need to find the option.
     data = json.loads(raw_data)
     path: str = data["path"]
     flags: set[str] = set(data["flags"])
     index: int = data["index"]
 
-    root = command
+    apps: list[tuple[App[_t.Any], str, str | yuio.Disabled | None]] = [
+        (app, prog, None)
+    ]
     for name in path.split("/"):
         if not name:
             continue
-        if name not in command.subcommands:
+        subcommand_data = apps[-1][0]._subcommands.get(name)
+        if subcommand_data is None:
             return
-        root = command.subcommands[name].load()
-
-    positional_index = 0
-    for option in root.options:
-        option_flags = option.flags
-        if option_flags is yuio.POSITIONAL:
-            option_flags = [str(positional_index)]
-            positional_index += 1
-        if flags.intersection(option_flags):
-            completer, is_many = option.get_completer()
-            break
-    else:
-        completer, is_many = None, False
+        apps.append(
+            (subcommand_data.load(), subcommand_data.name, subcommand_data.help)
+        )
+
+    # Options of parent commands are inherited by subcommands, so if the option
+    # is not found in the target command, we look for it in its parents,
+    # nearest first.
+    completer, is_many = None, False
+    for i in range(len(apps) - 1, -1, -1):
+        command_app, name, help = apps[i]
+        command = command_app._make_cli_command(name, help, is_root=i == 0)
+        is_target = i == len(apps) - 1
+        positional_index = 0
+        for option in command.options:
+            option_flags = option.flags
+            if option_flags is yuio.POSITIONAL:
+                if not is_target:
+                    continue
+                option_flags = [str(positional_index)]
+                positional_index += 1
+            if flags.intersection(option_flags):
+                completer, is_many = option.get_completer()
+                break
+        else:
+            continue
+        break
 
     if completer:
         yuio.complete._run_completer_at_index(completer, is_many, index, word)
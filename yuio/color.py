@@ -380,6 +380,11 @@ class Color:
 
     """
 
+    # Escape codes for every level of color support, filled lazily by `as_code`.
+    _codes: list[str | None] | None = dataclasses.field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     def __or__(self, other: Color, /):
         return Color(
             other.fore if other.fore is not None else self.fore,
@@ -537,6 +542,88 @@ class Color:
         if color_support == ColorSupport.NONE:
             return ""
 
+        cache = self._codes
+        if cache is None:
+            cache = _t.cast(list[str | None], [None] * len(ColorSupport))
+            object.__setattr__(self, "_codes", cache)
+        code = cache[color_support]
+        if code is None:
+            code = cache[color_support] = self._make_code(color_support)
+        return code
+
+    def as_code_from(self, prev: Color, color_support: ColorSupport, /) -> str:
+        """
+        Convert this color into an ANSI escape code that switches a terminal
+        from `prev` color to this one.
+
+        Unlike :meth:`~Color.as_code`, which resets all attributes before setting
+        new ones, this method only emits attributes that differ between the two colors.
+        If this doesn't produce a shorter code, falls back to :meth:`~Color.as_code`.
+
+        :param prev:
+            color that was previously set in a terminal.
+        :param color_support:
+            level of color support of a terminal.
+        :returns:
+            either ANSI escape code for this color or an empty string.
+        :example:
+            ::
+
+                >>> color = Color.FORE_RED | Color.STYLE_BOLD
+                >>> color.as_code_from(Color.STYLE_BOLD, ColorSupport.ANSI)
+                '\\x1b[31m'
+                >>> Color.FORE_RED.as_code_from(color, ColorSupport.ANSI)
+                '\\x1b[22m'
+
+        """
+
+        if color_support == ColorSupport.NONE or prev is self:
+            return ""
+
+        code = self.as_code(color_support)
+        if code == prev.as_code(color_support):
+            return ""
+        if any(
+            value is not None and isinstance(value.data, str)
+            for value in (self.fore, self.back, prev.fore, prev.back)
+        ):
+            # Raw codes can contain anything, we can't compute a delta for them.
+            return code
+
+        codes = []
+        fore = self.fore._as_fore(color_support) if self.fore else "39"
+        if fore != (prev.fore._as_fore(color_support) if prev.fore else "39"):
+            codes.append(fore)
+        back = self.back._as_back(color_support) if self.back else "49"
+        if back != (prev.back._as_back(color_support) if prev.back else "49"):
+            codes.append(back)
+        if (prev.bold and not self.bold) or (prev.dim and not self.dim):
+            # There's no separate code to disable bold or dim.
+            codes.append("22")
+            if self.bold:
+                codes.append("1")
+            if self.dim:
+                codes.append("2")
+        else:
+            if self.bold and not prev.bold:
+                codes.append("1")
+            if self.dim and not prev.dim:
+                codes.append("2")
+        for attr, on, off in (
+            ("italic", "3", "23"),
+            ("underline", "4", "24"),
+            ("blink", "5", "25"),
+            ("inverse", "7", "27"),
+        ):
+            if getattr(self, attr) and not getattr(prev, attr):
+                codes.append(on)
+            elif getattr(prev, attr) and not getattr(self, attr):
+                codes.append(off)
+
+        delta = "\x1b[" + ";".join(codes) + "m"
+        return delta if len(delta) < len(code) else code
+
+    def _make_code(self, color_support: ColorSupport, /) -> str:
         codes = []
         if self.fore:
             codes.append(self.fore._as_fore(color_support))
@@ -562,7 +649,7 @@ class Color:
     def __repr__(self):
         res = "<Color"
         for field in dataclasses.fields(self):
-            if (value := getattr(self, field.name)) is not None:
+            if field.repr and (value := getattr(self, field.name)) is not None:
                 res += f" {field.name}={value!r}"
         res += ">"
         return res
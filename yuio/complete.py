@@ -782,7 +782,7 @@ class Completer(abc.ABC):
         collector = CompletionCollector(text, pos)
         with collector.save_state():
             self._process(collector)
-        completions = collector.finalize()
+        completions = collector.finalize(derive_common_prefix=derive_common_prefix)
         if completions or not do_corrections:
             return completions
 
@@ -1440,7 +1440,7 @@ def _run_completer_at_index(completer: Completer, is_many: bool, index: int, wor
     completer_at_index = model.get_completer_at_index(registrar, index)
     if completer_at_index:
         # It's up to user's shell to do corrections and derive common prefix.
-        completions = completer.complete(
+        completions = completer_at_index.complete(
             word, len(word), do_corrections=False, derive_common_prefix=False
         )
         for completion in completions:
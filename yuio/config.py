@@ -688,7 +688,7 @@ def field(
 @_t.overload
 @_t.deprecated(
     "prefer using positional-only function arguments instead",
-    category=yuio.YuioPendingDeprecationWarning,
+    category=None,
 )
 def field(
     *,
@@ -708,7 +708,7 @@ def field(
 @_t.deprecated(
     "passing flags=yuio.POSITIONAL is discouraged, "
     "prefer using positional-only function arguments instead",
-    category=yuio.YuioPendingDeprecationWarning,
+    category=None,
 )
 def field(
     *,
@@ -732,7 +732,7 @@ def field(
 @_t.deprecated(
     "passing flags=yuio.POSITIONAL is discouraged, "
     "prefer using positional-only function arguments instead",
-    category=yuio.YuioPendingDeprecationWarning,
+    category=None,
 )
 def field(
     *,
@@ -963,7 +963,7 @@ def positional(
 
 @_t.deprecated(
     "prefer using positional-only function arguments instead",
-    category=yuio.YuioPendingDeprecationWarning,
+    category=None,
 )
 def positional(
     *,
@@ -983,6 +983,14 @@ def positional(
 
     """
 
+    # Runtime wrapper from `deprecated` imports `asyncio`, which is too costly
+    # for an import-time decorator, so we emit the warning ourselves.
+    warnings.warn(
+        "prefer using positional-only function arguments instead",
+        yuio.YuioPendingDeprecationWarning,
+        stacklevel=2,
+    )
+
     return _FieldSettings(
         default=default,
         parser=parser,
@@ -22,6 +22,21 @@ will do it for you, though, so you don't need to worry about it.
 
 .. autofunction:: setup
 
+.. autofunction:: flush
+
+.. autofunction:: attach_event_loop
+
+To see how much time your program spends on rendering tasks and printing messages,
+use the following functions. You can also set environment variable
+``YUIO_IO_METRICS`` to print a summary when the program exits.
+
+.. autofunction:: get_metrics
+
+.. autofunction:: reset_metrics
+
+.. autoclass:: IoMetrics
+    :members:
+
 To introspect the current state of Yuio's initialization, use the following functions:
 
 .. autofunction:: get_term
@@ -238,6 +253,12 @@ of some task.
 .. autoclass:: Task
     :members:
 
+If you use :class:`~concurrent.futures.ProcessPoolExecutor`, tasks and messages
+from worker processes can be displayed in the main process:
+
+.. autoclass:: WorkerTasks
+    :members:
+
 
 Querying user input
 -------------------
@@ -248,6 +269,13 @@ If you need to get something from the user, :func:`ask` is the way to do it.
 
 .. autofunction:: wait_for_user
 
+In :mod:`asyncio` applications, use async versions of these functions.
+They read user input without blocking the event loop:
+
+.. autofunction:: ask_async
+
+.. autofunction:: wait_for_user_async
+
 You can also prompt the user to edit something with the :func:`edit` function:
 
 .. autofunction:: edit
@@ -283,6 +311,9 @@ you can add a :class:`Handler`:
 
 .. autoclass:: Handler
 
+.. autoclass:: QueuedHandler
+    :members:
+
 .. autoclass:: Formatter
 
 
@@ -402,15 +433,20 @@ from __future__ import annotations
 
 import abc
 import atexit
+import collections
+import contextlib
+import dataclasses
+import enum
 import functools
+import itertools
 import logging
+import numbers
 import os
+import queue
 import re
 import shutil
 import string
-import subprocess
 import sys
-import tempfile
 import textwrap
 import threading
 import time
@@ -419,8 +455,6 @@ import types
 from logging import LogRecord
 
 import yuio.color
-import yuio.hl
-import yuio.parse
 import yuio.string
 import yuio.term
 import yuio.theme
@@ -454,6 +488,12 @@ from typing import TYPE_CHECKING
 from typing import ClassVar as _ClassVar
 
 if TYPE_CHECKING:
+    import asyncio
+    import multiprocessing.context
+    import multiprocessing.queues
+
+    import yuio.parse
+
     import typing_extensions as _t
 else:
     from yuio import _typing as _t
@@ -468,6 +508,7 @@ __all__ = [
     "Hl",
     "Hr",
     "Indent",
+    "IoMetrics",
     "JoinRepr",
     "JoinStr",
     "Link",
@@ -476,6 +517,7 @@ __all__ = [
     "Or",
     "Ordinal",
     "Plural",
+    "QueuedHandler",
     "Repr",
     "Rst",
     "Stack",
@@ -485,8 +527,11 @@ __all__ = [
     "TypeRepr",
     "UserIoError",
     "WithBaseColor",
+    "WorkerTasks",
     "Wrap",
     "ask",
+    "ask_async",
+    "attach_event_loop",
     "br",
     "detect_editor",
     "detect_shell",
@@ -495,6 +540,8 @@ __all__ = [
     "error_with_tb",
     "failure",
     "failure_with_tb",
+    "flush",
+    "get_metrics",
     "get_term",
     "get_theme",
     "heading",
@@ -506,6 +553,7 @@ __all__ = [
     "orig_stderr",
     "orig_stdout",
     "raw",
+    "reset_metrics",
     "restore_streams",
     "rst",
     "setup",
@@ -513,6 +561,7 @@ __all__ = [
     "streams_wrapped",
     "success",
     "wait_for_user",
+    "wait_for_user_async",
     "warning",
     "wrap_streams",
 ]
@@ -532,7 +581,60 @@ Exception information as returned by :func:`sys.exc_info`.
 """
 
 
-_IO_LOCK = threading.RLock()
+class _IoLock:
+    # Reentrant lock that measures time spent waiting for it. Implements
+    # private methods of `threading.RLock` that are used by `threading.Condition`.
+    # Only used when metrics are printed, see `_make_io_lock`.
+
+    __slots__ = ("_lock",)
+
+    def __init__(self):
+        self._lock = threading.RLock()
+
+    def acquire(self, blocking: bool = True, timeout: float = -1) -> bool:
+        if self._lock.acquire(False):
+            return True
+        if not blocking:
+            return False
+        start_ns = time.perf_counter_ns()
+        acquired = self._lock.acquire(True, timeout)
+        if acquired:
+            _METRICS.lock_wait_ns += time.perf_counter_ns() - start_ns
+            _METRICS.lock_waits += 1
+        return acquired
+
+    def release(self):
+        self._lock.release()
+
+    __enter__ = acquire
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._lock.release()
+
+    def _is_owned(self) -> bool:
+        return self._lock._is_owned()  # type: ignore
+
+    def _release_save(self) -> _t.Any:
+        return self._lock._release_save()  # type: ignore
+
+    def _acquire_restore(self, state: _t.Any):
+        self._lock._acquire_restore(state)  # type: ignore
+
+
+def _make_io_lock() -> _IoLock | threading.RLock:
+    # Measuring lock contention adds a python-level call to every use of the lock,
+    # so we only do it when metrics will be printed.
+    if os.environ.get("YUIO_IO_METRICS"):
+        return _IoLock()
+    else:
+        return threading.RLock()
+
+
+# Measuring time and counting bytes adds overhead to every message,
+# so we only do it when metrics will be printed.
+_MEASURE_WRITES = bool(os.environ.get("YUIO_IO_METRICS"))
+
+_IO_LOCK = _make_io_lock()
 _IO_MANAGER: _IoManager | None = None
 _STREAMS_WRAPPED: bool = False
 _ORIG_STDERR: _t.TextIO | None = None
@@ -563,6 +665,7 @@ def setup(
         yuio.theme.Theme | _t.Callable[[yuio.term.Term], yuio.theme.Theme] | None
     ) = None,
     wrap_stdio: bool = True,
+    batch_output: bool | None = None,
 ):
     """
     Initial setup of the logging facilities.
@@ -588,6 +691,25 @@ def setup(
            If you're working with some other library that wraps :data:`sys.stdout`
            and :data:`sys.stderr`, such as colorama_, initialize it before Yuio.
 
+    :param batch_output:
+        if set to :data:`True`, messages are not written immediately. Instead,
+        they're buffered and written once per task refresh interval, with a single
+        re-render of tasks and a single flush. This reduces terminal traffic
+        when printing thousands of messages per second.
+
+        Order of messages is preserved. Buffered messages are written
+        when output is suspended, when streams are restored, at exit,
+        and when :func:`flush` is called.
+
+        If not passed, the current setting is not changed; the default is to write
+        messages immediately.
+
+        .. note::
+
+           Messages written to :data:`sys.stdout` and :data:`sys.stderr`
+           bypass the buffer unless streams are wrapped. Call :func:`flush` before
+           writing to unwrapped streams directly.
+
     .. _colorama: https://github.com/tartley/colorama
 
     .. warning::
@@ -604,12 +726,210 @@ def setup(
             if not (manager := _IO_MANAGER):
                 _IO_MANAGER = _IoManager(term, theme)
     if manager is not None:
-        manager.setup(term, theme)
+        manager.setup(term, theme, batch_output)
 
     if wrap_stdio:
         wrap_streams()
 
 
+def flush():
+    """
+    Write all messages that were buffered because of
+    :func:`setup(batch_output=True) <setup>`.
+
+    If output batching is disabled, this function has no effect.
+
+    """
+
+    if _IO_MANAGER is not None:
+        _IO_MANAGER.flush()
+
+
+@contextlib.contextmanager
+def attach_event_loop(loop: asyncio.AbstractEventLoop | None = None):
+    """
+    Render tasks from an :mod:`asyncio` event loop instead of a background thread.
+
+    While this context manager is active, Yuio doesn't run its own thread
+    for updating tasks. Instead, task updates and buffered messages
+    (see :func:`setup`) are rendered from callbacks scheduled on the event loop.
+    Tasks can still be updated from other threads.
+
+    This context manager should be entered and exited from the event loop's thread.
+
+    :param loop:
+        event loop to attach to. Default is the running event loop.
+    :example:
+        .. code-block:: python
+
+            async def main():
+                with yuio.io.attach_event_loop():
+                    async with yuio.io.Task("Fetching data") as t:
+                        async for item in t.iter(fetch_items()):
+                            ...
+
+    """
+
+    if loop is None:
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+
+    manager = _manager()
+    manager.attach_loop(loop)
+    try:
+        yield
+    finally:
+        manager.detach_loop(loop)
+
+
+@dataclasses.dataclass
+class IoMetrics:
+    """
+    Statistics about rendering tasks and writing messages, see :func:`get_metrics`.
+
+    """
+
+    frames_rendered: int = 0
+    """
+    Number of times tasks were rendered to the terminal.
+
+    """
+
+    frames_skipped: int = 0
+    """
+    Number of times tasks weren't rendered because the previous frame
+    was rendered less than one update interval ago,
+    or because rendering took too long.
+
+    """
+
+    bytes_written: dict[str, int] = dataclasses.field(default_factory=dict)
+    """
+    Number of bytes written to each stream, including rendered tasks.
+    Keys are stream names, i.e. ``"<stderr>"``.
+
+    Only measured when environment variable ``YUIO_IO_METRICS`` is set.
+
+    """
+
+    layout_ns: int = 0
+    """
+    Time spent on laying out tasks, in nanoseconds.
+
+    """
+
+    draw_ns: int = 0
+    """
+    Time spent on drawing tasks, in nanoseconds.
+
+    """
+
+    render_ns: int = 0
+    """
+    Time spent on comparing frames and writing them to the terminal, in nanoseconds.
+
+    """
+
+    write_ns: int = 0
+    """
+    Time spent on writing messages to output streams, in nanoseconds.
+
+    Only measured when environment variable ``YUIO_IO_METRICS`` is set.
+
+    """
+
+    lock_wait_ns: int = 0
+    """
+    Time spent on waiting for the global IO lock, in nanoseconds.
+
+    Only measured when environment variable ``YUIO_IO_METRICS`` is set.
+
+    """
+
+    lock_waits: int = 0
+    """
+    Number of times a thread had to wait for the global IO lock.
+
+    Only measured when environment variable ``YUIO_IO_METRICS`` is set.
+
+    """
+
+    def __str__(self) -> str:
+        lines = [
+            "yuio.io metrics:",
+            f"  frames rendered: {self.frames_rendered}, skipped: {self.frames_skipped}",
+            f"  layout: {self.layout_ns / 1e6:.3f}ms, "
+            f"draw: {self.draw_ns / 1e6:.3f}ms, "
+            f"render: {self.render_ns / 1e6:.3f}ms",
+            f"  writing messages: {self.write_ns / 1e6:.3f}ms",
+            f"  waiting for IO lock: {self.lock_wait_ns / 1e6:.3f}ms "
+            f"({self.lock_waits} times)",
+        ]
+        for name, n_bytes in sorted(self.bytes_written.items()):
+            lines.append(f"  bytes written to {name}: {n_bytes}")
+        return "\n".join(lines)
+
+    def _add_bytes(self, stream: _t.TextIO, n_bytes: int):
+        name = getattr(stream, "name", None)
+        if not isinstance(name, str):
+            name = f"<{type(stream).__name__}>"
+        self.bytes_written[name] = self.bytes_written.get(name, 0) + n_bytes
+
+    def _add_lines(self, stream: _t.TextIO, lines: list[str]):
+        self._add_bytes(
+            stream,
+            sum(
+                len(line) if line.isascii() else len(line.encode(errors="replace"))
+                for line in lines
+            ),
+        )
+
+
+_METRICS = IoMetrics()
+
+
+def get_metrics() -> IoMetrics:
+    """
+    Get statistics about rendering tasks and writing messages
+    since the program started or since the last call to :func:`reset_metrics`.
+
+    This is useful to see how much time your program spends on displaying
+    progress, and to tune
+    :attr:`Theme.spinner_update_rate_ms <yuio.theme.Theme.spinner_update_rate_ms>`.
+
+    If environment variable ``YUIO_IO_METRICS`` is set, these metrics
+    are printed to :func:`orig_stderr` when the program exits.
+
+    :returns:
+        a copy of the current metrics.
+
+    """
+
+    with _IO_LOCK:
+        return dataclasses.replace(_METRICS, bytes_written=dict(_METRICS.bytes_written))
+
+
+def reset_metrics():
+    """
+    Reset all metrics returned by :func:`get_metrics` to zero.
+
+    """
+
+    global _METRICS
+
+    with _IO_LOCK:
+        _METRICS = IoMetrics()
+
+
+def _print_metrics():
+    print(get_metrics(), file=orig_stderr(), flush=True)
+
+
+if os.environ.get("YUIO_IO_METRICS"):
+    atexit.register(_print_metrics)
+
+
 def get_term() -> yuio.term.Term:
     """
     Get the global instance of :class:`~yuio.term.Term` that is used
@@ -650,6 +970,8 @@ def make_repr_context(
     highlighted: bool | None = None,
     max_depth: int | None = None,
     width: int | None = None,
+    max_items: int | None = None,
+    max_chars: int | None = None,
 ) -> yuio.string.ReprContext:
     """
     Create new :class:`~yuio.string.ReprContext` for the given term and theme.
@@ -688,6 +1010,12 @@ def make_repr_context(
         :attr:`Theme.fallback_width <yuio.theme.Theme.fallback_width>`
         depending on whether `term` is attached to a TTY device and whether colors
         are supported by the target terminal.
+    :param max_items:
+        sets initial value for
+        :attr:`ReprContext.max_items <yuio.string.ReprContext.max_items>`.
+    :param max_chars:
+        sets initial value for
+        :attr:`ReprContext.max_chars <yuio.string.ReprContext.max_chars>`.
 
     """
 
@@ -721,6 +1049,8 @@ def make_repr_context(
         highlighted=highlighted,
         max_depth=max_depth,
         width=width,
+        max_items=max_items,
+        max_chars=max_chars,
     )
 
 
@@ -781,6 +1111,8 @@ def restore_streams():
         if not _STREAMS_WRAPPED:  # pragma: no cover
             return
 
+        flush()
+
         if _ORIG_STDOUT is not None:
             sys.stdout = _ORIG_STDOUT
             _ORIG_STDOUT = None
@@ -1300,58 +1632,115 @@ def raw(
             width=width,
         )
 
+    if exc_info is True:
+        exc_info = sys.exc_info()
+    elif exc_info is False or exc_info is None:
+        exc_info = None
+    elif isinstance(exc_info, BaseException):
+        exc_info = (type(exc_info), exc_info, exc_info.__traceback__)
+    elif not isinstance(exc_info, tuple) or len(exc_info) != 3:
+        raise ValueError(f"invalid exc_info {exc_info!r}")
+    if exc_info is not None and exc_info != (None, None, None):
+        tb = "".join(traceback.format_exception(*exc_info))
+    else:
+        tb = None
+
+    chunks = _render_raw(msg, ctx, tag, wrap, add_newline, tb)
+    if ignore_suspended or not manager._suspended:
+        # Render the first chunk before acquiring IO lock. This makes sure that
+        # the message itself is formatted outside of the lock; short messages
+        # are fully rendered at this point. If output is suspended, we don't
+        # render anything: the message will be formatted when output is resumed.
+        chunks = itertools.chain([next(chunks)], chunks)
+
+    manager.print_iter(
+        chunks,
+        ctx.term,
+        ignore_suspended=ignore_suspended,
+        heading=heading,
+    )
+
+
+def _highlight_traceback(
+    tb: str, theme: yuio.theme.Theme
+) -> yuio.string.ColorizedString:
+    # Highlighters are only needed for tracebacks, so we import them lazily.
+    import yuio.hl
+
+    highlighter, syntax_name = yuio.hl.get_highlighter("python-traceback")
+    return highlighter.highlight(tb, theme=theme, syntax=syntax_name)
+
+
+def _render_raw(
+    msg: yuio.string.Colorable,
+    ctx: yuio.string.ReprContext,
+    tag: str | None,
+    wrap: bool,
+    add_newline: bool,
+    tb: str | None,
+) -> _t.Iterator[list[str]]:
+    # This is a generator, so nothing is formatted until the message
+    # is actually written.
+
+    # When colors are not supported, we don't resolve message colors,
+    # and we write string parts directly without building the full string.
+    plain = ctx.term.color_support == yuio.color.ColorSupport.NONE
+
+    indent: yuio.string.AnyString
     if tag and (decoration := ctx.get_msg_decoration(tag)):
-        indent = yuio.string.ColorizedString(
-            [ctx.get_color(f"msg/decoration:{tag}"), decoration]
-        )
-        continuation_indent = " " * indent.width
+        if plain:
+            indent = decoration
+        else:
+            indent = yuio.string.ColorizedString(
+                [ctx.get_color(f"msg/decoration:{tag}"), decoration]
+            )
+        continuation_indent = " " * yuio.string.line_width(decoration)
     else:
         indent = ""
         continuation_indent = ""
 
-    if tag:
+    if tag and not plain:
         msg = yuio.string.WithBaseColor(
             msg, base_color=ctx.get_color(f"msg/text:{tag}")
         )
 
+    lines: _t.Iterable[yuio.string.AnyString]
     if wrap:
-        msg = yuio.string.Wrap(
+        # Wrapped lines are rendered and printed one chunk at a time, so that we
+        # don't have to keep all of them in memory.
+        lines = yuio.string.Wrap(
             msg,
             indent=indent,
             continuation_indent=continuation_indent,
-        )
+        )._iter_parts(ctx)
     elif indent or continuation_indent:
-        msg = yuio.string.Indent(
-            msg,
-            indent=indent,
-            continuation_indent=continuation_indent,
-        )
+        lines = [
+            ctx.str(
+                yuio.string.Indent(
+                    msg,
+                    indent=indent,
+                    continuation_indent=continuation_indent,
+                )
+            )
+        ]
+    else:
+        lines = [ctx.str(msg)]
 
-    msg = ctx.str(msg)
+    tail: list[yuio.string.AnyString] = []
 
     if add_newline:
-        msg.append_color(yuio.color.Color.NONE)
-        msg.append_str("\n")
+        tail.append(yuio.color.Color.NONE)
+        tail.append("\n")
 
-    if exc_info is True:
-        exc_info = sys.exc_info()
-    elif exc_info is False or exc_info is None:
-        exc_info = None
-    elif isinstance(exc_info, BaseException):
-        exc_info = (type(exc_info), exc_info, exc_info.__traceback__)
-    elif not isinstance(exc_info, tuple) or len(exc_info) != 3:
-        raise ValueError(f"invalid exc_info {exc_info!r}")
-    if exc_info is not None and exc_info != (None, None, None):
-        tb = "".join(traceback.format_exception(*exc_info))
-        highlighter, syntax_name = yuio.hl.get_highlighter("python-traceback")
-        msg += highlighter.highlight(tb, theme=ctx.theme, syntax=syntax_name).indent()
+    if tb is not None:
+        tail.append(_highlight_traceback(tb, ctx.theme).indent())
 
-    manager.print(
-        msg.as_code(ctx.term.color_support),
-        ctx.term,
-        ignore_suspended=ignore_suspended,
-        heading=heading,
-    )
+    if plain:
+        yield from yuio.string._iter_plain(itertools.chain(lines, tail))
+    else:
+        yield from yuio.string._iter_as_code(
+            itertools.chain(lines, tail), ctx.term.color_support
+        )
 
 
 class _AskWidget(yuio.widget.Widget[T], _t.Generic[T]):
@@ -1363,6 +1752,8 @@ class _AskWidget(yuio.widget.Widget[T], _t.Generic[T]):
         self._inner = widget
 
     def event(self, e: yuio.widget.KeyboardEvent, /) -> yuio.widget.Result[T] | None:
+        import yuio.parse
+
         try:
             result = self._inner.event(e)
         except yuio.parse.ParsingError as err:
@@ -1427,14 +1818,19 @@ class _AskMeta(type):
     ) -> S | M: ...
     def __call__(cls, *args, **kwargs):
         if "parser" not in kwargs:
+            import yuio.parse
+
             hint = cls.__hint
             if hint is None:
                 hint = str
             kwargs["parser"] = yuio.parse.from_type_hint(hint)
-        return _ask(*args, **kwargs)
+        return cls._run(_ask(*args, **kwargs))
+
+    def _run(cls, interaction: _t.Generator[_Interaction, _t.Any, _t.Any]):
+        return _interact(interaction)
 
     def __getitem(cls, ty):
-        return _AskMeta("ask", (), {"_AskMeta__hint": ty})
+        return type(cls)(cls.__name__, (), {"_AskMeta__hint": ty})
 
     # A dirty hack to hide `__getitem__` from type checkers. `ask` should look like
     # an ordinary class with overloaded `__new__` for the magic to work.
@@ -1549,6 +1945,124 @@ class ask(_t.Generic[S], metaclass=_AskMeta):
         def __new__(cls: _t.Any, *_, **__) -> _t.Any: ...
 
 
+class _AskAsyncMeta(_AskMeta):
+    def _run(cls, interaction: _t.Generator[_Interaction, _t.Any, _t.Any]):
+        return _interact_async(interaction)
+
+
+@_t.final
+class ask_async(_t.Generic[S], metaclass=_AskAsyncMeta):
+    """ask_async[T](msg: typing.LiteralString, /, *args, parser: ~yuio.parse.Parser[T] | None = None, default: U, default_non_interactive: U, input_description: str | None = None, default_description: str | None = None) -> typing.Awaitable[T | U]
+    ask_async[T](msg: str, /, *, parser: ~yuio.parse.Parser[T] | None = None, default: U, default_non_interactive: U, input_description: str | None = None, default_description: str | None = None) -> typing.Awaitable[T | U]
+
+    Like :func:`ask`, but doesn't block the running :mod:`asyncio` event loop
+    while waiting for user input.
+
+    :example:
+        .. code-block:: python
+
+            answer = await yuio.io.ask_async[bool]("Continue?", default=True)
+
+    """
+
+    if TYPE_CHECKING:
+
+        @_t.overload
+        def __new__(
+            cls: type[ask_async[S]],
+            msg: _t.LiteralString,
+            /,
+            *args,
+            default: M | yuio.Missing = yuio.MISSING,
+            default_non_interactive: _t.Any = yuio.MISSING,
+            parser: yuio.parse.Parser[S] | None = None,
+            input_description: str | None = None,
+            default_description: str | None = None,
+        ) -> _t.Awaitable[S | M]: ...
+        @_t.overload
+        def __new__(
+            cls: type[ask_async[S]],
+            msg: str,
+            /,
+            *,
+            default: M | yuio.Missing = yuio.MISSING,
+            default_non_interactive: _t.Any = yuio.MISSING,
+            parser: yuio.parse.Parser[S] | None = None,
+            input_description: str | None = None,
+            default_description: str | None = None,
+        ) -> _t.Awaitable[S | M]: ...
+        def __new__(cls: _t.Any, *_, **__) -> _t.Any: ...
+
+
+class _RunWidget(_t.NamedTuple):
+    widget: yuio.widget.Widget[_t.Any]
+    term: yuio.term.Term
+    theme: yuio.theme.Theme
+
+
+# Functions that interact with user are written as generators that yield
+# requests for user input, and receive results. This way, the same code
+# can be run synchronously or from an async event loop.
+#
+# Callables read input in a blocking way. When called from an event loop,
+# they run in a thread and receive a `cancelled` event, which is set once
+# the awaiting task is cancelled.
+_Interaction: _t.TypeAlias = (
+    "_RunWidget | _t.Callable[[threading.Event | None], _t.Any]"
+)
+
+
+def _interact(interaction: _t.Generator[_Interaction, _t.Any, T]) -> T:
+    result: _t.Any = None
+    error: BaseException | None = None
+    while True:
+        try:
+            if error is not None:
+                request = interaction.throw(error)
+            else:
+                request = interaction.send(result)
+        except StopIteration as e:
+            return e.value
+        result = error = None
+        try:
+            if isinstance(request, _RunWidget):
+                result = request.widget.run(request.term, request.theme)
+            else:
+                result = request(None)
+        except BaseException as e:
+            error = e
+
+
+async def _interact_async(interaction: _t.Generator[_Interaction, _t.Any, T]) -> T:
+    import asyncio
+
+    result: _t.Any = None
+    error: BaseException | None = None
+    while True:
+        try:
+            if error is not None:
+                request = interaction.throw(error)
+            else:
+                request = interaction.send(result)
+        except StopIteration as e:
+            return e.value
+        result = error = None
+        try:
+            if isinstance(request, _RunWidget):
+                result = await request.widget.run_async(request.term, request.theme)
+            else:
+                # Blocking input is read in a thread.
+                cancelled = threading.Event()
+                try:
+                    result = await asyncio.get_running_loop().run_in_executor(
+                        None, request, cancelled
+                    )
+                finally:
+                    cancelled.set()
+        except BaseException as e:
+            error = e
+
+
 def _ask(
     msg: _t.LiteralString,
     /,
@@ -1558,7 +2072,10 @@ def _ask(
     default_non_interactive: _t.Any = yuio.MISSING,
     input_description: str | None = None,
     default_description: str | None = None,
-) -> _t.Any:
+) -> _t.Generator[_Interaction, _t.Any, _t.Any]:
+    # No need to import `yuio.parse` here: we've got a parser,
+    # so it's already loaded.
+
     ctx = make_repr_context(term=yuio.term.get_tty())
 
     if not _can_query_user(ctx.term):
@@ -1618,7 +2135,7 @@ def _ask(
         widget = _AskWidget(prompt, inner_widget)
         with SuspendOutput() as s:
             try:
-                result = widget.run(ctx.term, ctx.theme)
+                result = yield _RunWidget(widget, ctx.term, ctx.theme)
             except (OSError, EOFError) as e:  # pragma: no cover
                 raise UserIoError("Unexpected end of input") from e
 
@@ -1661,7 +2178,7 @@ def _ask(
         with SuspendOutput() as s:
             while True:
                 try:
-                    answer = do_input(ctx.term, prompt)
+                    answer = yield functools.partial(do_input, ctx.term, prompt)
                 except (OSError, EOFError) as e:  # pragma: no cover
                     raise UserIoError("Unexpected end of input") from e
                 if not answer and default is not yuio.MISSING:
@@ -1679,28 +2196,63 @@ if os.name == "posix":
     # Getpass implementation is based on the standard `getpass` module, with a few
     # Yuio-specific modifications.
 
+    def _wait_for_input(
+        term: yuio.term.Term, cancelled: threading.Event | None
+    ) -> bool:
+        # When reading from a worker thread, poll input with a timeout, so that
+        # the thread stops soon after the awaiting task is cancelled, and doesn't
+        # consume input meant for other readers. TTY is in canonical mode,
+        # so input becomes readable once user enters a whole line.
+        if cancelled is None:
+            return True
+
+        import select
+
+        try:
+            fd = term.istream.fileno()
+        except (AttributeError, ValueError, OSError):
+            # Can't poll this stream, just block on it.
+            return True
+
+        while not cancelled.is_set():
+            if select.select([fd], [], [], yuio.widget._INPUT_POLL_TIMEOUT)[0]:
+                return True
+        return False
+
     def _getpass_fallback(
-        term: yuio.term.Term, prompt: yuio.string.ColorizedString
+        term: yuio.term.Term,
+        prompt: yuio.string.ColorizedString,
+        cancelled: threading.Event | None,
     ) -> str:
         warning(
             "Warning: Password input may be echoed.", term=term, ignore_suspended=True
         )
-        return _read(term, prompt)
+        return _read(term, prompt, cancelled)
 
-    def _read(term: yuio.term.Term, prompt: yuio.string.ColorizedString) -> str:
-        info(
+    def _read(
+        term: yuio.term.Term,
+        prompt: yuio.string.ColorizedString,
+        cancelled: threading.Event | None,
+    ) -> str:
+        info(
             prompt, add_newline=False, tag="question", term=term, ignore_suspended=True
         )
+        if not _wait_for_input(term, cancelled):
+            return ""
         return term.istream.readline().rstrip("\r\n")
 
-    def _getpass(term: yuio.term.Term, prompt: yuio.string.ColorizedString) -> str:
+    def _getpass(
+        term: yuio.term.Term,
+        prompt: yuio.string.ColorizedString,
+        cancelled: threading.Event | None,
+    ) -> str:
         import termios
 
         try:
             fd = term.istream.fileno()
         except (AttributeError, ValueError):
             # We can't control the tty or stdin. Give up and use normal IO.
-            return _getpass_fallback(term, prompt)
+            return _getpass_fallback(term, prompt, cancelled)
 
         result: str | None = None
 
@@ -1718,7 +2270,10 @@ if os.name == "posix":
                     term=term,
                     ignore_suspended=True,
                 )
-                result = term.istream.readline().rstrip("\r\n")
+                if _wait_for_input(term, cancelled):
+                    result = term.istream.readline().rstrip("\r\n")
+                else:
+                    result = ""
                 term.ostream.write("\n")
                 term.ostream.flush()
             finally:
@@ -1730,15 +2285,31 @@ if os.name == "posix":
                 raise
             else:
                 # We can't control the tty or stdin. Give up and use normal IO.
-                return _getpass_fallback(term, prompt)
+                return _getpass_fallback(term, prompt, cancelled)
 
         assert result is not None
         return result
 
 elif os.name == "nt":
 
+    def _wait_for_input(cancelled: threading.Event | None) -> bool:
+        # When reading from a worker thread, poll console with a timeout, so that
+        # the thread stops soon after the awaiting task is cancelled.
+        import msvcrt
+
+        if cancelled is None:
+            return True
+        while not cancelled.is_set():
+            if msvcrt.kbhit():
+                return True
+            time.sleep(yuio.widget._INPUT_POLL_TIMEOUT)
+        return False
+
     def _do_read(
-        term: yuio.term.Term, prompt: yuio.string.ColorizedString, echo: bool
+        term: yuio.term.Term,
+        prompt: yuio.string.ColorizedString,
+        cancelled: threading.Event | None,
+        echo: bool,
     ) -> str:
         import msvcrt
 
@@ -1755,10 +2326,15 @@ elif os.name == "nt":
                 msvcrt.putwch(c)
 
         if term.ostream_is_tty and echo:
+            # Once user starts typing, we can't cancel reading a line.
+            if not _wait_for_input(cancelled):
+                return ""
             return term.istream.readline().rstrip("\r\n")
         else:
             result = ""
             while True:
+                if not _wait_for_input(cancelled):
+                    return ""
                 c = msvcrt.getwch()
                 if c == "\0" or c == "\xe0":
                     # Read key scan code and ignore it.
@@ -1785,21 +2361,39 @@ elif os.name == "nt":
 
         return result
 
-    def _read(term: yuio.term.Term, prompt: yuio.string.ColorizedString):
-        return _do_read(term, prompt, echo=True)
+    def _read(
+        term: yuio.term.Term,
+        prompt: yuio.string.ColorizedString,
+        cancelled: threading.Event | None,
+    ):
+        return _do_read(term, prompt, cancelled, echo=True)
 
-    def _getpass(term: yuio.term.Term, prompt: yuio.string.ColorizedString):
-        return _do_read(term, prompt, echo=False)
+    def _getpass(
+        term: yuio.term.Term,
+        prompt: yuio.string.ColorizedString,
+        cancelled: threading.Event | None,
+    ):
+        return _do_read(term, prompt, cancelled, echo=False)
 
 else:
+    # Input can't be polled here, so a worker thread keeps waiting for input
+    # after `ask_async` is cancelled.
 
-    def _getpass(term: yuio.term.Term, prompt: yuio.string.ColorizedString) -> str:
+    def _getpass(
+        term: yuio.term.Term,
+        prompt: yuio.string.ColorizedString,
+        cancelled: threading.Event | None,
+    ) -> str:
         warning(
             "Warning: Password input may be echoed.", term=term, ignore_suspended=True
         )
-        return _read(term, prompt)
+        return _read(term, prompt, cancelled)
 
-    def _read(term: yuio.term.Term, prompt: yuio.string.ColorizedString) -> str:
+    def _read(
+        term: yuio.term.Term,
+        prompt: yuio.string.ColorizedString,
+        cancelled: threading.Event | None,
+    ) -> str:
         info(
             prompt, add_newline=False, tag="question", term=term, ignore_suspended=True
         )
@@ -1851,6 +2445,31 @@ def wait_for_user(
 
     """
 
+    _interact(_wait_for_user(msg, *args))
+
+
+async def wait_for_user_async(
+    msg: _t.LiteralString = "Press <c note>enter</c> to continue",
+    /,
+    *args,
+):
+    """
+    Like :func:`wait_for_user`, but doesn't block the running :mod:`asyncio`
+    event loop while waiting for user input.
+
+    :param msg:
+        prompt to display to user.
+    :param args:
+        arguments for ``%``\\ - formatting the prompt.
+
+    """
+
+    await _interact_async(_wait_for_user(msg, *args))
+
+
+def _wait_for_user(
+    msg: _t.LiteralString, /, *args
+) -> _t.Generator[_Interaction, _t.Any, None]:
     ctx = make_repr_context(term=yuio.term.get_tty())
 
     if not _can_query_user(ctx.term):
@@ -1877,9 +2496,9 @@ def wait_for_user(
     with SuspendOutput():
         try:
             if ctx.term.can_run_widgets:
-                _WaitForUserWidget(prompt).run(ctx.term, ctx.theme)
+                yield _RunWidget(_WaitForUserWidget(prompt), ctx.term, ctx.theme)
             else:
-                _read(ctx.term, prompt)
+                yield functools.partial(_read, ctx.term, prompt)
         except (OSError, EOFError):  # pragma: no cover
             return
 
@@ -2030,6 +2649,9 @@ def edit(
         )
         yuio.term._pause()
 
+    import subprocess
+    import tempfile
+
     fd, filepath = tempfile.mkstemp(text=True, suffix=file_ext)
     try:
         with open(fd, "w") as file:
@@ -2148,6 +2770,9 @@ def shell(
     args = [shell]
     env = os.environ.copy()
 
+    import subprocess
+    import tempfile
+
     rcpath = None
     rcpath_is_dir = False
     if prompt_marker:
@@ -2647,6 +3272,12 @@ class SuspendOutput(MessageChannel):
         1. This message is suspended; it will be printed when output is resumed.
         2. This message bypasses suspension; it will be printed immediately.
 
+    .. note::
+
+        Messages printed while output is suspended are formatted only when output
+        is resumed, so objects passed as message arguments should not be mutated
+        in the meantime.
+
     """
 
     def __init__(self, initial_channel: MessageChannel | None = None, /):
@@ -2683,7 +3314,9 @@ class _IterTask(_t.Generic[T]):
         self._iter = iter(collection)
         self._task = task
         self._unit = unit
-        self._ndigits = ndigits
+        # Counters are ints, so `None` renders the same as `0`, and lets
+        # `Task.progress` skip building keyword arguments.
+        self._ndigits = ndigits or None
 
         self._i = 0
         self._len = len(collection)
@@ -2698,6 +3331,36 @@ class _IterTask(_t.Generic[T]):
         return self
 
 
+class _AsyncIterTask(_t.Generic[T]):
+    def __init__(
+        self, collection: _t.AsyncIterable[T], task: Task, unit: str, ndigits: int
+    ):
+        self._iter = collection.__aiter__()
+        self._task = task
+        self._unit = unit
+        # Counters are ints, so `None` renders the same as `0`, and lets
+        # `Task.progress` skip building keyword arguments.
+        self._ndigits = ndigits or None
+
+        self._i = 0
+        try:
+            self._len: int | None = len(collection)  # type: ignore
+        except TypeError:
+            self._len = None
+
+    async def __anext__(self) -> T:
+        if self._len is not None:
+            self._task.progress(
+                self._i, self._len, unit=self._unit, ndigits=self._ndigits
+            )
+            if self._i < self._len:
+                self._i += 1
+        return await self._iter.__anext__()
+
+    def __aiter__(self) -> _AsyncIterTask[T]:
+        return self
+
+
 class TaskBase:
     """
     Base class for tasks and other objects that you might show to the user.
@@ -2744,6 +3407,7 @@ class TaskBase:
                 self.__parent.__children.remove(self)
             self.__parent = parent
             parent.__children.append(self)
+            _manager()._tasks_widet.tree_changed()
             self._request_update()
 
     def detach(self):
@@ -2756,6 +3420,7 @@ class TaskBase:
             if self.__parent is not None:
                 self.__parent.__children.remove(self)
                 self.__parent = None
+                _manager()._tasks_widet.tree_changed()
                 self._request_update()
 
     @property
@@ -2813,7 +3478,9 @@ class TaskBase:
 
         """
 
-        _manager()._update_tasks(immediate_render or not streams_wrapped())
+        manager = _manager()
+        manager._tasks_widet.task_changed(self)
+        manager._update_tasks(immediate_render or not streams_wrapped())
 
     def _widgets_are_displayed(self) -> bool:
         """
@@ -2970,6 +3637,15 @@ class Task(TaskBase):
 
         self._widget = self._widget_class(msg, *args, comment=comment)
         self._persistent = persistent
+
+        # Slots for updates that were made without taking the IO lock.
+        # Writers replace them with new tuples; the renderer applies them
+        # before formatting the task. See `_apply_deferred_updates`.
+        self._deferred_progress: _DeferredUpdate | None = None
+        self._applied_progress: _DeferredUpdate | None = None
+        self._deferred_comment: _DeferredUpdate | None = None
+        self._applied_comment: _DeferredUpdate | None = None
+
         with self._lock:
             self.set_status(initial_status)
             self.attach(parent)
@@ -3010,8 +3686,10 @@ class Task(TaskBase):
         .. note::
 
             Tasks are updated asynchronously once every ~100ms, so calling this method
-            is relatively cheap. It still requires acquiring a global lock, though:
-            contention could be an issue in multi-threaded applications.
+            is cheap. When tasks are rendered from a background thread, new progress
+            is stored without acquiring a global lock, and it is picked up
+            by the next frame. This makes it safe to call this method
+            from hot loops in multiple threads.
 
         :param progress:
             a percentage between ``0`` and ``1``, or :data:`None`
@@ -3039,9 +3717,30 @@ class Task(TaskBase):
 
         """
 
-        with self._lock:
-            self._widget.progress(*args, unit=unit, ndigits=ndigits)  # type: ignore
-            self._request_update()
+        if not 1 <= len(args) <= 2:
+            raise ValueError(
+                f"Task.progress() takes between one and two arguments "
+                f"({len(args)} given)"
+            )
+        # Widget will fail to compute progress; make sure that the error
+        # is raised here and not in the background thread. `None` is only
+        # allowed as a single argument.
+        if len(args) == 1:
+            if not isinstance(args[0], (int, float)) and args[0] is not None:
+                _check_progress_number("Task.progress", args[0])
+        else:
+            for arg in args:
+                if not isinstance(arg, (int, float)):
+                    _check_progress_number("Task.progress", arg)
+        if unit != "" or ndigits is not None:
+            _check_progress_format("Task.progress", unit, ndigits)
+            kwargs = {"unit": unit, "ndigits": ndigits}
+        else:
+            # This method is called in hot loops, save on creating a dict.
+            kwargs = _NO_KWARGS
+
+        self._deferred_progress = (self._widget.progress, args, kwargs)
+        self._request_deferred_update()
 
     def progress_size(
         self,
@@ -3074,9 +3773,22 @@ class Task(TaskBase):
 
         """
 
-        with self._lock:
-            self._widget.progress_size(done, total, ndigits=ndigits)
-            self._request_update()
+        # Widget will fail to compute progress; make sure that the error
+        # is raised here and not in the background thread.
+        if not isinstance(done, (int, float)):
+            _check_progress_number("Task.progress_size", done)
+        if not isinstance(total, (int, float)):
+            _check_progress_number("Task.progress_size", total)
+        _check_progress_format("Task.progress_size", "", ndigits)
+        if not total:
+            raise ZeroDivisionError("division by zero")
+
+        self._deferred_progress = (
+            self._widget.progress_size,
+            (done, total),
+            {"ndigits": ndigits},
+        )
+        self._request_deferred_update()
 
     def progress_scale(
         self,
@@ -3113,10 +3825,24 @@ class Task(TaskBase):
 
         """
 
-        with self._lock:
-            self._widget.progress_scale(done, total, unit=unit, ndigits=ndigits)
-            self._request_update()
+        # Widget will fail to compute progress; make sure that the error
+        # is raised here and not in the background thread.
+        if not isinstance(done, (int, float)):
+            _check_progress_number("Task.progress_scale", done)
+        if not isinstance(total, (int, float)):
+            _check_progress_number("Task.progress_scale", total)
+        _check_progress_format("Task.progress_scale", unit, ndigits)
+        if not total:
+            raise ZeroDivisionError("division by zero")
+
+        self._deferred_progress = (
+            self._widget.progress_scale,
+            (done, total),
+            {"unit": unit, "ndigits": ndigits},
+        )
+        self._request_deferred_update()
 
+    @_t.overload
     def iter(
         self,
         collection: _t.Collection[T],
@@ -3124,13 +3850,34 @@ class Task(TaskBase):
         *,
         unit: str = "",
         ndigits: int = 0,
-    ) -> _t.Iterable[T]:
+    ) -> _t.Iterable[T]: ...
+    @_t.overload
+    def iter(
+        self,
+        collection: _t.AsyncIterable[T],
+        /,
+        *,
+        unit: str = "",
+        ndigits: int = 0,
+    ) -> _t.AsyncIterator[T]: ...
+    def iter(
+        self,
+        collection: _t.Collection[T] | _t.AsyncIterable[T],
+        /,
+        *,
+        unit: str = "",
+        ndigits: int = 0,
+    ) -> _t.Iterable[T] | _t.AsyncIterator[T]:
         """
         Helper for updating progress automatically
         while iterating over a collection.
 
         :param collection:
             an iterable collection. Should support returning its length.
+
+            Can also be an async iterable, in which case this method returns
+            an async iterator. If async iterable doesn't support returning its length,
+            task will only show a spinner.
         :param unit:
             unit for measuring progress.
         :param ndigits:
@@ -3154,7 +3901,12 @@ class Task(TaskBase):
 
         """
 
-        return _IterTask(collection, self, unit, ndigits)
+        if hasattr(collection, "__aiter__"):
+            return _AsyncIterTask(
+                _t.cast(_t.AsyncIterable[T], collection), self, unit, ndigits
+            )
+        else:
+            return _IterTask(_t.cast(_t.Collection[T], collection), self, unit, ndigits)
 
     def comment(self, comment: str | None, /, *args):
         """
@@ -3186,9 +3938,17 @@ class Task(TaskBase):
 
         """
 
-        with self._lock:
-            self._widget.comment(comment, *args)
-            self._request_update()
+        if comment is not None and not isinstance(comment, str):
+            if not isinstance(comment, yuio.string._Template):
+                raise TypeError(
+                    f"Task.comment() argument must be str or None, "
+                    f"not {type(comment).__name__!r}"
+                )
+            elif args:
+                raise TypeError("args can't be given with template")
+
+        self._deferred_comment = (self._widget.comment, (comment, *args), {})
+        self._request_deferred_update()
 
     def set_status(self, status: Task.Status):
         """
@@ -3200,6 +3960,8 @@ class Task(TaskBase):
         """
 
         with self._lock:
+            self._apply_deferred_updates()
+
             if self._widget.status == status:
                 return
 
@@ -3311,47 +4073,539 @@ class Task(TaskBase):
         else:
             self.error()
 
+    async def __aenter__(self):
+        return self.__enter__()
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self.__exit__(exc_type, exc_val, exc_tb)
+
     def _get_widget(self) -> yuio.widget.Widget[_t.Never]:
+        self._apply_deferred_updates()
         return self._widget
 
     def _get_priority(self) -> int:
         return 1 if self._widget.status is yuio.widget.Task.Status.RUNNING else 0
 
+    def _request_deferred_update(self):
+        manager = _manager()
+        if manager._enable_bg_updates and streams_wrapped():
+            # Background thread will pick up changes on its next frame.
+            manager._update_tasks_deferred(self)
+        else:
+            with self._lock:
+                self._apply_deferred_updates()
+                self._request_update()
+
+    def _apply_deferred_updates(self):
+        # Each slot is read exactly once, so a concurrent write either gets applied
+        # now, or stays in the slot until the next frame.
+        if (progress := self._deferred_progress) is not self._applied_progress:
+            self._applied_progress = progress
+            if progress is not None:
+                fn, args, kwargs = progress
+                fn(*args, **kwargs)
+        if (comment := self._deferred_comment) is not self._applied_comment:
+            self._applied_comment = comment
+            if comment is not None:
+                fn, args, kwargs = comment
+                fn(*args, **kwargs)
+
+
+_DeferredUpdate: _t.TypeAlias = tuple[
+    _t.Callable[..., None], tuple[_t.Any, ...], dict[str, _t.Any]
+]
+
+_NO_KWARGS: dict[str, _t.Any] = {}
+
+
+def _check_progress_number(name: str, value: _t.Any):
+    # Callers check for `int` and `float` inline; `numbers.Real` covers
+    # `fractions`, `numpy`, etc.
+    if isinstance(value, numbers.Real):
+        return
+    # `decimal.Decimal` is only registered as `numbers.Number`,
+    # but it can still be formatted and divided.
+    if isinstance(value, numbers.Number) and not isinstance(value, numbers.Complex):
+        try:
+            float(value)  # type: ignore
+        except (TypeError, ValueError):
+            pass
+        else:
+            return
+    raise TypeError(
+        f"{name}() argument must be a real number, not {type(value).__name__!r}"
+    )
+
+
+def _check_progress_format(name: str, unit: _t.Any, ndigits: _t.Any):
+    if not isinstance(unit, str):
+        raise TypeError(f"{name}() unit must be str, not {type(unit).__name__!r}")
+    if ndigits is not None and not isinstance(ndigits, int):
+        raise TypeError(f"{name}() ndigits must be int, not {type(ndigits).__name__!r}")
+
+
+class WorkerTasks:
+    """
+    Collects tasks and messages from worker processes, and displays them
+    in this process.
+
+    By default, each process renders its own tasks, so tasks from workers
+    of a :class:`~concurrent.futures.ProcessPoolExecutor` would garble
+    the terminal. Instead, pass :attr:`~WorkerTasks.initializer` to the pool.
+    In worker processes, all tasks, messages and logs from :mod:`yuio.io`
+    are sent to this process, and tasks are displayed as subtasks of `parent`.
+
+    Workers send updates once per frame, so calling :meth:`Task.progress`
+    from hot loops in many workers is still cheap.
+
+    :param parent:
+        task that will be used as a parent for all top-level tasks of the workers.
+        Default is to attach them to the root of the task tree.
+    :param mp_context:
+        :mod:`multiprocessing` context that will be used to start worker processes.
+    :example:
+        .. code-block:: python
+
+            def process(path):
+                with yuio.io.Task("Processing %s", path) as task:
+                    ...
+                    task.progress(done, total)
+
+
+            with yuio.io.Task("Processing files") as task:
+                with yuio.io.WorkerTasks(task) as worker_tasks:
+                    with ProcessPoolExecutor(
+                        initializer=worker_tasks.initializer
+                    ) as pool:
+                        pool.map(process, paths)
+
+    .. note::
+
+        Workers use the theme constructor that was passed to :func:`setup`,
+        as long as it can be pickled. Otherwise, they use the default theme.
+
+        Formatting arguments for task headings and comments
+        are converted to strings in workers, unless they are primitive types.
+
+    """
+
+    def __init__(
+        self,
+        parent: TaskBase | None = None,
+        *,
+        mp_context: multiprocessing.context.BaseContext | None = None,
+    ):
+        import multiprocessing
+
+        self.__parent = parent
+        self.__queue: multiprocessing.queues.SimpleQueue[_WorkerFrame | None] = (
+            mp_context or multiprocessing.get_context()
+        ).SimpleQueue()
+        self.__tasks: dict[tuple[int, int], Task] = {}
+        self.__thread: threading.Thread | None = None
+
+    @functools.cached_property
+    def initializer(self) -> _t.Callable[[], None]:
+        """
+        Initializer function for worker processes.
+
+        If your pool needs its own initializer, pass this function
+        in initializer's arguments, and call it from the worker:
+
+        .. code-block:: python
+
+            def init_worker(init_yuio):
+                init_yuio()
+                ...
+
+
+            ProcessPoolExecutor(
+                initializer=init_worker,
+                initargs=(worker_tasks.initializer,),
+            )
+
+        """
+
+        import pickle
+
+        manager = _manager()
+
+        theme_ctor = manager._theme_ctor
+        try:
+            pickle.dumps(theme_ctor)
+        except Exception:
+            theme_ctor = None
+
+        return functools.partial(
+            _init_worker,
+            _WorkerConfig(
+                queue=self.__queue,
+                color_support=manager.term.color_support,
+                ostream_is_tty=manager.term.ostream_is_tty,
+                is_unicode=manager.term.is_unicode,
+                terminal_theme=manager.term.terminal_theme,
+                theme_ctor=theme_ctor,  # type: ignore
+            ),
+        )
+
+    def start(self):
+        """
+        Start receiving updates from workers.
+
+        """
+
+        if self.__thread is None:
+            self.__thread = threading.Thread(
+                target=self.__run, name="yuio_io_worker_tasks", daemon=True
+            )
+            self.__thread.start()
+
+    def close(self):
+        """
+        Process all updates that were sent by workers, and stop receiving updates.
+
+        This method should be called after all workers have exited.
+        Tasks that are still running in workers are removed from the task tree.
+
+        """
+
+        if (thread := self.__thread) is not None:
+            self.__queue.put(None)
+            thread.join()
+            self.__thread = None
+
+        with _IO_LOCK:
+            for task in self.__tasks.values():
+                if task._widget.status in (Task.Status.RUNNING, Task.Status.PENDING):
+                    task.detach()
+            self.__tasks.clear()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __run(self):
+        while (frame := self.__queue.get()) is not None:
+            try:
+                self.__apply(*frame)
+            except Exception:
+                yuio._logger.critical("exception in worker tasks", exc_info=True)
+
+    def __apply(self, pid: int, chunks: list[_WorkerChunk]):
+        with _IO_LOCK:
+            for updates, lines in chunks:
+                self.__apply_updates(pid, updates)
+                self.__print_lines(lines)
+
+    def __apply_updates(self, pid: int, updates: list[_WorkerTaskUpdate]):
+        manager = _manager()
+
+        for task_id, parent_id, is_attached, state in updates:
+            (
+                msg,
+                args,
+                comment,
+                comment_args,
+                status,
+                progress,
+                progress_done,
+                progress_total,
+            ) = state
+            status = Task.Status(status)
+            if parent_id is None:
+                parent = self.__parent or manager.tasks_root
+            else:
+                parent = self.__tasks.get((pid, parent_id), self.__parent)
+                parent = parent or manager.tasks_root
+
+            if (task := self.__tasks.get((pid, task_id))) is None:
+                task = Task(
+                    msg,
+                    *args,
+                    persistent=True,
+                    initial_status=status,
+                    parent=parent,
+                )
+                self.__tasks[pid, task_id] = task
+            task._widget.comment(comment, *comment_args)
+            task._widget._progress = progress
+            task._widget._progress_done = progress_done
+            task._widget._progress_total = progress_total
+            task.set_status(status)
+
+            if not is_attached:
+                task.detach()
+                del self.__tasks[pid, task_id]
+            elif task._get_parent() is not parent:
+                task.attach(parent)
+            else:
+                task._request_update()
+
+    def __print_lines(self, lines: list[tuple[bool, list[str]]]):
+        manager = _manager()
+
+        for to_stdout, stream_lines in lines:
+            term = manager.out_term if to_stdout else manager.term
+            manager.print_direct_lines(stream_lines, term.ostream)
+
+
+class _WorkerConfig(_t.NamedTuple):
+    queue: multiprocessing.queues.SimpleQueue[_WorkerFrame | None]
+    color_support: yuio.term.ColorSupport
+    ostream_is_tty: bool
+    is_unicode: bool
+    terminal_theme: yuio.term.TerminalTheme | None
+    theme_ctor: _t.Callable[[yuio.term.Term], yuio.theme.Theme] | None
+
+
+# Task message, args, comment, comment args, status, progress, progress done,
+# progress total.
+_WorkerTaskState: _t.TypeAlias = tuple[
+    str,
+    tuple[object, ...],
+    str | None,
+    tuple[object, ...],
+    str,
+    float | None,
+    str | None,
+    str | None,
+]
+
+# Task id, parent id, is attached, task state.
+_WorkerTaskUpdate: _t.TypeAlias = tuple[int, int | None, bool, _WorkerTaskState]
+
+# Task updates, followed by lines that were printed after these updates.
+# Each line is marked with a flag that indicates whether it goes to stdout.
+_WorkerChunk: _t.TypeAlias = tuple[
+    list[_WorkerTaskUpdate], list[tuple[bool, list[str]]]
+]
+
+# Worker's pid and a list of chunks.
+_WorkerFrame: _t.TypeAlias = tuple[int, list[_WorkerChunk]]
+
+
+class _WorkerArg:
+    # Formatting argument that can't be sent to the parent process as is.
+
+    __slots__ = ("_repr", "_str")
+
+    def __init__(self, value: object):
+        self._str = str(value)
+        self._repr = repr(value)
+
+    def __str__(self) -> str:
+        return self._str
+
+    def __repr__(self) -> str:
+        return self._repr
+
+
+def _to_worker_args(args: tuple[object, ...] | None) -> tuple[object, ...]:
+    if not args:
+        return ()
+    return tuple(
+        arg if arg is None or type(arg) in (str, int, float, bool) else _WorkerArg(arg)
+        for arg in args
+    )
+
+
+def _init_worker(config: _WorkerConfig):
+    global _IO_LOCK, _IO_MANAGER
+
+    # With `fork` start method, IO lock could've been copied in a locked state.
+    _IO_LOCK = _make_io_lock()
+    if _IO_MANAGER is not None:
+        _IO_MANAGER._reset_signals()
+    _IO_MANAGER = None
+
+    wrap_streams()
+    _IO_MANAGER = _WorkerIoManager(config)
+
 
 class _TaskTree(yuio.widget.Widget[_t.Never]):
+    # Task tree is updated incrementally. We keep a flattened copy of the tree
+    # along with widgets, priorities and layouts for every task. This copy is rebuilt
+    # when tasks are attached or detached. When a task changes, it is added
+    # to `_changed_tasks`, and only its layout and priority are recalculated.
+    # Finally, we only decide which tasks to hide when any layout or priority
+    # has changed. Thus, when a single task updates its progress, we only lay out
+    # this task, and re-draw tasks that are visible.
+
     def __init__(self, root: TaskBase):
         super().__init__()
 
         self._root = root
 
+        self._tree_changed = True
+        # These can be appended to without holding a lock. The set makes sure that
+        # each task is queued at most once. When tasks are not displayed,
+        # the queue is drained by `discard_changed_tasks`.
+        self._changed_tasks: collections.deque[TaskBase] = collections.deque()
+        self._changed_tasks_set: set[TaskBase] = set()
+        self._layout_key: tuple[yuio.widget.RenderContext, int, int] | None = None
+
+        # Flattened tree, in order of drawing.
+        self._nodes: list[TaskBase] = []
+        self._indices: dict[TaskBase, int] = {}
+        self._parents: list[int | None] = []
+        self._levels: list[int] = []
+        self._widgets: list[yuio.widget.Widget[_t.Never]] = []
+        self._priorities: list[int] = []
+        self._layouts: list[tuple[int, int]] = []
+
+        # Widgets that are actually displayed: widget, min_h, max_h, level.
+        self._displayed_changed = True
+        self.__displayed: list[tuple[yuio.widget.Widget[_t.Never], int, int, int]] = []
+        self.__min_h = 0
+        self.__max_h = 0
+
+    def task_changed(self, task: TaskBase):
+        """
+        Mark task as changed. Can be called without holding the IO lock.
+
+        """
+
+        if task not in self._changed_tasks_set:
+            self._changed_tasks_set.add(task)
+            self._changed_tasks.append(task)
+
+    def discard_changed_tasks(self):
+        """
+        Forget about changed tasks when they're not displayed. Next time the tree
+        is displayed, it will be laid out from scratch.
+
+        """
+
+        if self._changed_tasks:
+            self._pop_changed_tasks()
+            self._layout_key = None
+
+    def tree_changed(self):
+        """
+        Mark that tasks were attached or detached.
+
+        """
+
+        self._tree_changed = True
+
     def layout(self, rc: yuio.widget.RenderContext) -> tuple[int, int]:
-        widgets: list[yuio.widget.Widget[_t.Never]] = []  # widget
-        tree: dict[
-            int, tuple[int | None, int, int]
-        ] = {}  # index -> parent, level, priority
+        layout_key = (rc, rc.width, rc.height)
+
+        if self._layout_key != layout_key:
+            self._tree_changed = False
+            self._pop_changed_tasks()
+            self._build_tree()
+            self._layout_all(rc)
+        elif self._tree_changed:
+            self._tree_changed = False
+            self._rebuild_tree(rc)
+        else:
+            self._layout_changed(rc)
+        self._layout_key = layout_key
+
+        if self._displayed_changed:
+            self._displayed_changed = False
+            self._hide_tasks(rc)
+
+        return self.__min_h, self.__max_h
+
+    def _build_tree(self):
+        self._nodes.clear()
+        self._parents.clear()
+        self._levels.clear()
 
-        # Build widgets tree.
         to_visit: list[tuple[TaskBase, int, int | None]] = [(self._root, 0, None)]
         while to_visit:
             node, level, parent = to_visit.pop()
-            widget = node._get_widget()
-            tree[len(widgets)] = parent, level, node._get_priority()
             to_visit.extend(
-                (child, level + 1, len(widgets))
+                (child, level + 1, len(self._nodes))
                 for child in reversed(node._get_children())
             )
-            widgets.append(widget)
+            self._nodes.append(node)
+            self._parents.append(parent)
+            self._levels.append(level)
+
+        self._indices = {node: index for index, node in enumerate(self._nodes)}
+
+    def _rebuild_tree(self, rc: yuio.widget.RenderContext):
+        # Tasks that didn't change keep their layouts.
+        changed_tasks = set(self._pop_changed_tasks())
+        prev_indices = self._indices
+        prev_widgets = self._widgets
+        prev_layouts = self._layouts
+
+        self._build_tree()
+
+        self._widgets = []
+        self._priorities = [node._get_priority() for node in self._nodes]
+        self._layouts = []
+        for node in self._nodes:
+            index = prev_indices.get(node)
+            if index is None or node in changed_tasks:
+                widget = node._get_widget()
+                self._widgets.append(widget)
+                min_h, max_h = widget.layout(rc)
+                assert min_h <= max_h, "incorrect layout"
+                self._layouts.append((min_h, max_h))
+            else:
+                self._widgets.append(prev_widgets[index])
+                self._layouts.append(prev_layouts[index])
+        self._displayed_changed = True
+
+    def _layout_all(self, rc: yuio.widget.RenderContext):
+        self._widgets = [node._get_widget() for node in self._nodes]
+        self._priorities = [node._get_priority() for node in self._nodes]
+        self._layouts = []
+        for widget in self._widgets:
+            min_h, max_h = widget.layout(rc)
+            assert min_h <= max_h, "incorrect layout"
+            self._layouts.append((min_h, max_h))
+        self._displayed_changed = True
 
-        # Prepare layouts.
-        layouts: dict[yuio.widget.Widget[_t.Never], tuple[int, int, int]] = {}
-        self.__layouts = layouts
-        total_min_h = 0
-        total_max_h = 0
-        for index, widget in enumerate(widgets):
+    def _pop_changed_tasks(self) -> list[TaskBase]:
+        # Task is removed from the set before we read its state. If another thread
+        # changes task's state after this point, it will queue the task again.
+        changed_tasks: list[TaskBase] = []
+        while True:
+            try:
+                node = self._changed_tasks.popleft()
+            except IndexError:
+                break
+            self._changed_tasks_set.discard(node)
+            changed_tasks.append(node)
+        return changed_tasks
+
+    def _layout_changed(self, rc: yuio.widget.RenderContext):
+        for node in self._pop_changed_tasks():
+            index = self._indices.get(node)
+            if index is None:
+                continue  # Task was detached.
+
+            widget = node._get_widget()
+            priority = node._get_priority()
             min_h, max_h = widget.layout(rc)
             assert min_h <= max_h, "incorrect layout"
-            _, level, _ = tree[index]
-            layouts[widget] = min_h, max_h, level
+
+            if (
+                widget is not self._widgets[index]
+                or priority != self._priorities[index]
+                or (min_h, max_h) != self._layouts[index]
+            ):
+                self._widgets[index] = widget
+                self._priorities[index] = priority
+                self._layouts[index] = min_h, max_h
+                self._displayed_changed = True
+
+    def _hide_tasks(self, rc: yuio.widget.RenderContext):
+        widgets = self._widgets
+        levels = self._levels
+
+        total_min_h = 0
+        total_max_h = 0
+        for min_h, max_h in self._layouts:
             total_min_h += min_h
             total_max_h += max_h
 
@@ -3359,129 +4613,115 @@ class _TaskTree(yuio.widget.Widget[_t.Never]):
             # All widgets fit.
             self.__min_h = total_min_h
             self.__max_h = total_max_h
-            self.__widgets = widgets
-            return total_min_h, total_max_h
+            self.__displayed = [
+                (widget, min_h, max_h, level)
+                for widget, (min_h, max_h), level in zip(widgets, self._layouts, levels)
+            ]
+            return
 
         # Propagate priority upwards, ensure that parents are at least as important
         # as children.
-        for index, widget in enumerate(widgets):
-            parent, _, priority = tree[index]
+        priorities = self._priorities.copy()
+        for index, parent in enumerate(self._parents):
+            priority = priorities[index]
             while parent is not None:
-                grandparent, parent_level, parent_priority = tree[parent]
-                if parent_priority >= priority:
+                if priorities[parent] >= priority:
                     break
-                tree[parent] = grandparent, parent_level, priority
-                widget = parent
-                parent = grandparent
+                priorities[parent] = priority
+                parent = self._parents[parent]
 
         # Sort by (-priority, level, -index). Since we've propagated priorities, we can
         # be sure that parents are always included first. Hence in the loop below,
         # we will visit children before parents.
-        widgets_sorted = list(enumerate(widgets))
-        widgets_sorted.sort(key=lambda w: (-tree[w[0]][2], tree[w[0]][1], -w[0]))
+        indices_sorted = list(range(len(widgets)))
+        indices_sorted.sort(key=lambda i: (-priorities[i], levels[i], -i))
 
         # Decide which widgets to hide by introducing "holes" to widgets sequence.
         total_h = total_min_h
         holes = _DisjointSet[int]()
-        for index, widget in reversed(widgets_sorted):
+        for index in reversed(indices_sorted):
             if total_h <= rc.height:
                 break
 
-            min_h, max_h = widget.layout(rc)
-
             # We need to hide this widget.
-            _, level, _ = tree[index]
+            min_h, _ = self._layouts[index]
+            level = levels[index]
             holes.add(index)
             total_h -= min_h
             total_h += 1  # Size of a message.
 
             # Join this hole with the next one.
-            if index + 1 < len(widgets) and index + 1 in holes:
-                _, next_level, _ = tree[index + 1]
-                if next_level >= level:
-                    holes.union(index, index + 1)
-                    total_h -= 1
+            if (
+                index + 1 < len(widgets)
+                and index + 1 in holes
+                and levels[index + 1] >= level
+            ):
+                holes.union(index, index + 1)
+                total_h -= 1
             # Join this hole with the previous one.
-            if index - 1 >= 0 and index - 1 in holes:
-                _, prev_level, _ = tree[index - 1]
-                if prev_level <= level:
-                    holes.union(index, index - 1)
-                    total_h -= 1
+            if index - 1 >= 0 and index - 1 in holes and levels[index - 1] <= level:
+                holes.union(index, index - 1)
+                total_h -= 1
 
-        # Assemble the final sequence of widgets.
+        # Assemble the final sequence of widgets. Hidden widgets are never drawn,
+        # they're replaced with a single line for each hole.
         hole_color = rc.theme.get_color("task/hole")
         hole_num_color = rc.theme.get_color("task/hole/num")
-        prev_hole_id: int | None = None
-        prev_hole_size = 0
-        prev_hole_level: int | None = None
-        displayed_widgets: list[yuio.widget.Widget[_t.Never]] = []
-        for index, widget in enumerate(widgets):
-            if index in holes:
-                hole_id = holes.find(index)
-                if hole_id == prev_hole_id:
+
+        def make_hole_widget(size: int, level: int | None):
+            hole_widget = yuio.widget.Line(
+                yuio.string.ColorizedString(
+                    hole_num_color,
+                    "+",
+                    str(size),
+                    hole_color,
+                    " more",
+                )
+            )
+            return hole_widget, 1, 1, level or 1
+
+        prev_hole_id: int | None = None
+        prev_hole_size = 0
+        prev_hole_level: int | None = None
+        displayed: list[tuple[yuio.widget.Widget[_t.Never], int, int, int]] = []
+        for index, widget in enumerate(widgets):
+            if index in holes:
+                hole_id = holes.find(index)
+                if hole_id == prev_hole_id:
                     prev_hole_size += 1
                     if prev_hole_level is None:
-                        prev_hole_level = tree[index][1]
+                        prev_hole_level = levels[index]
                     else:
-                        prev_hole_level = min(prev_hole_level, tree[index][1])
+                        prev_hole_level = min(prev_hole_level, levels[index])
                 else:
                     if prev_hole_id is not None:
-                        hole_widget = yuio.widget.Line(
-                            yuio.string.ColorizedString(
-                                hole_num_color,
-                                "+",
-                                str(prev_hole_size),
-                                hole_color,
-                                " more",
-                            )
+                        displayed.append(
+                            make_hole_widget(prev_hole_size, prev_hole_level)
                         )
-                        displayed_widgets.append(hole_widget)
-                        layouts[hole_widget] = 1, 1, prev_hole_level or 1
                     prev_hole_id = hole_id
                     prev_hole_size = 1
-                    prev_hole_level = tree[index][1]
+                    prev_hole_level = levels[index]
             else:
                 if prev_hole_id is not None:
-                    hole_widget = yuio.widget.Line(
-                        yuio.string.ColorizedString(
-                            hole_num_color,
-                            "+",
-                            str(prev_hole_size),
-                            hole_color,
-                            " more",
-                        )
-                    )
-                    displayed_widgets.append(hole_widget)
-                    layouts[hole_widget] = 1, 1, prev_hole_level or 1
+                    displayed.append(make_hole_widget(prev_hole_size, prev_hole_level))
                 prev_hole_id = None
                 prev_hole_size = 0
                 prev_hole_level = None
-                displayed_widgets.append(widget)
+                min_h, max_h = self._layouts[index]
+                displayed.append((widget, min_h, max_h, levels[index]))
 
         if prev_hole_id is not None:
-            hole_widget = yuio.widget.Line(
-                yuio.string.ColorizedString(
-                    hole_num_color,
-                    "+",
-                    str(prev_hole_size),
-                    hole_color,
-                    " more",
-                )
-            )
-            displayed_widgets.append(hole_widget)
-            layouts[hole_widget] = 1, 1, prev_hole_level or 1
+            displayed.append(make_hole_widget(prev_hole_size, prev_hole_level))
 
         total_min_h = 0
         total_max_h = 0
-        for widget in displayed_widgets:
-            min_h, max_h, _ = layouts[widget]
+        for _, min_h, max_h, _ in displayed:
             total_min_h += min_h
             total_max_h += max_h
 
         self.__min_h = total_min_h
         self.__max_h = total_max_h
-        self.__widgets = displayed_widgets
-        return total_min_h, total_max_h
+        self.__displayed = displayed
 
     def draw(self, rc: yuio.widget.RenderContext):
         if rc.height <= self.__min_h:
@@ -3492,8 +4732,7 @@ class _TaskTree(yuio.widget.Widget[_t.Never]):
             scale = (rc.height - self.__min_h) / (self.__max_h - self.__min_h)
 
         y1 = 0.0
-        for widget in self.__widgets:
-            min_h, max_h, level = self.__layouts[widget]
+        for widget, min_h, max_h, level in self.__displayed:
             y2 = y1 + min_h + scale * (max_h - min_h)
 
             iy1 = round(y1)
@@ -3507,6 +4746,127 @@ class _TaskTree(yuio.widget.Widget[_t.Never]):
         rc.set_final_pos(0, round(y1))
 
 
+class _LogField(_t.NamedTuple):
+    # Mapping key of this field.
+    key: str
+    # Original format spec, i.e. `%(key)-10s`.
+    spec: str
+    # Format spec without mapping key, i.e. `%-10s`.
+    plain_spec: str
+    # Format spec is `%(key)s`.
+    is_plain_str: bool
+    # Format spec uses `s`, `r` or `a` conversion.
+    is_str: bool
+    # Color of the format string around this field.
+    base_color: yuio.color.Color
+    # Color from `log/{key}:{level}` path.
+    value_color: yuio.color.Color
+    # Color of this field, `base_color | value_color`.
+    color: yuio.color.Color
+    # Escape code for field's color.
+    code: str
+    # Escape code that sets field's color before the field,
+    # empty if it's already set.
+    start: str
+    # Escape code that sets field's color after a colorized value,
+    # empty if the following literal or field sets its own color.
+    restore: str
+
+
+def _compile_log_format(
+    fmt: str, level: str, ctx: yuio.string.ReprContext
+) -> list[str | _LogField] | None:
+    # Parses format string and splits it into a list of fields and literal strings.
+    # Literals are pre-rendered with escape codes for the given terminal.
+    # After each field, terminal's color is set to field's color.
+    # Returns `None` if format contains fields that we can't handle,
+    # i.e. positional arguments.
+
+    color_support = ctx.term.color_support
+    res: list[str | _LogField] = []
+    literal = ""
+    active_color = emitted_color = yuio.color.Color.NONE
+    # Index of the last field in `res` if nothing was emitted after it yet.
+    last_field: int | None = None
+
+    def set_restore(needed: bool):
+        # Colorized value can change terminal's color. We only need to restore it
+        # if whatever comes after the field relies on field's color being set.
+        nonlocal last_field
+        if last_field is not None:
+            field = _t.cast(_LogField, res[last_field])
+            res[last_field] = field._replace(restore=field.code if needed else "")
+            last_field = None
+
+    def append_literal(text: str):
+        nonlocal literal, emitted_color
+        if text:
+            set_restore(active_color == emitted_color)
+            if active_color != emitted_color:
+                literal += active_color.as_code(color_support)
+                emitted_color = active_color
+            literal += text
+
+    for part in yuio.string.colorize(fmt, default_color=f"log:{level}", ctx=ctx):
+        if isinstance(part, yuio.color.Color):
+            active_color = part
+            continue
+        elif not isinstance(part, str):
+            continue
+
+        pos = 0
+        for match in yuio.string._S_SYNTAX.finditer(part):
+            append_literal(part[pos : match.start()])
+            pos = match.end()
+
+            if match.group("format") == "%":
+                if match.group(0) != "%%":
+                    raise ValueError("unsupported format character '%'")
+                append_literal("%")
+                continue
+
+            key = match.group("mapping")
+            if not key or "*" in (match.group("width"), match.group("precision")):
+                return None
+
+            if literal:
+                res.append(literal)
+                literal = ""
+
+            spec = match.group(0)
+            value_color = ctx.get_color(f"log/{key}:{level}")
+            color = active_color | value_color
+            code = color.as_code(color_support)
+            set_restore(color == emitted_color)
+            last_field = len(res)
+            res.append(
+                _LogField(
+                    key=key,
+                    spec=spec,
+                    plain_spec=spec.replace(f"({key})", "", 1),
+                    is_plain_str=spec == f"%({key})s",
+                    is_str=match.group("format") in "rsa",
+                    base_color=active_color,
+                    value_color=value_color,
+                    color=color,
+                    code=code,
+                    start=code if color != emitted_color else "",
+                    restore="",
+                )
+            )
+            emitted_color = color
+
+        append_literal(part[pos:])
+
+    set_restore(emitted_color == yuio.color.Color.NONE)
+    if emitted_color != yuio.color.Color.NONE:
+        literal += yuio.color.Color.NONE.as_code(color_support)
+    if literal:
+        res.append(literal)
+
+    return res
+
+
 class Formatter(logging.Formatter):
     """
     Log formatter that uses ``%`` style with colorized string formatting
@@ -3544,34 +4904,99 @@ class Formatter(logging.Formatter):
             defaults=defaults,
         )
 
+        # Compiled templates for every log level. Invalidated when format,
+        # theme, or terminal changes.
+        self.__templates: tuple[
+            tuple[_t.Any, ...], dict[str, list[str | _LogField] | None]
+        ] = ((), {})
+
     def formatMessage(self, record):
         level = record.levelname.lower()
+        manager = _manager()
+        theme = manager.theme
+        color_support = manager.term.color_support
+        fmt = self._fmt or self.default_format
+
+        key = (fmt, theme, theme._color_version, color_support)
+        if (templates := self.__templates)[0] != key:
+            templates = self.__templates = (key, {})
+        try:
+            template = templates[1][level]
+        except KeyError:
+            template = templates[1][level] = _compile_log_format(
+                fmt, level, make_repr_context()
+            )
 
-        ctx = make_repr_context()
+        ctx = None
 
         if not hasattr(record, "colMessage"):
             msg = str(record.msg)
             if record.args:
+                ctx = make_repr_context()
                 msg = ColorizedString(msg).percent_format(record.args, ctx)
             setattr(record, "colMessage", msg)
 
-        if defaults := self._style._defaults:  # type: ignore
-            data = defaults | record.__dict__
-        else:
-            data = record.__dict__
-
-        data = {
-            k: yuio.string.WithBaseColor(v, base_color=f"log/{k}:{level}")
-            for k, v in data.items()
-        }
-
-        return "".join(
-            yuio.string.colorize(
-                self._fmt or self.default_format, default_color=f"log:{level}", ctx=ctx
+        defaults = self._style._defaults  # type: ignore
+
+        if template is None:
+            # Format has positional fields, use slow path.
+            data = defaults | record.__dict__ if defaults else record.__dict__
+            data = {
+                k: yuio.string.WithBaseColor(v, base_color=f"log/{k}:{level}")
+                for k, v in data.items()
+            }
+            ctx = ctx or make_repr_context()
+            return "".join(
+                yuio.string.colorize(fmt, default_color=f"log:{level}", ctx=ctx)
+                .percent_format(data, ctx)
+                .as_code(color_support)
             )
-            .percent_format(data, ctx)
-            .as_code(ctx.term.color_support)
-        )
+
+        data = record.__dict__
+        res: list[str] = []
+        for part in template:
+            if part.__class__ is str:
+                res.append(part)  # type: ignore
+                continue
+            field: _LogField = part  # type: ignore
+            if field.key in data:
+                value = data[field.key]
+            elif defaults:
+                value = defaults[field.key]
+            else:
+                raise KeyError(field.key)
+            if field.is_plain_str and value.__class__ in (str, int, float):
+                res += (field.start, str(value))
+            elif not field.is_str and not isinstance(value, WithBaseColor):
+                res += (field.start, field.plain_spec % (value,))
+            else:
+                if field.is_plain_str and isinstance(value, ColorizedString):
+                    colorized = value.with_base_color(field.color)
+                else:
+                    ctx = ctx or make_repr_context()
+                    value = WithBaseColor(value, base_color=field.value_color)
+                    colorized = (
+                        ColorizedString(field.spec)
+                        .percent_format({field.key: value}, ctx)
+                        .with_base_color(field.base_color)
+                    )
+                # Terminal's color is reset or restored after the field
+                # by the template itself.
+                codes = colorized._as_code(color_support, False, False)
+                parts = colorized._parts
+                if field.code and parts and isinstance(parts[0], yuio.color.Color):
+                    # Value starts with its own color.
+                    if not field.start and codes[0] == field.code:
+                        del codes[0]
+                else:
+                    res.append(field.start)
+                res += codes
+                if colorized._last_url is not None:
+                    res.append("\x1b]8;;\x1b\\")
+                last_color = colorized._last_color
+                if last_color is not None and last_color != field.color:
+                    res.append(field.restore)
+        return "".join(res)
 
     def formatException(self, ei):
         tb = "".join(traceback.format_exception(*ei)).rstrip()
@@ -3581,11 +5006,8 @@ class Formatter(logging.Formatter):
         manager = _manager()
         theme = manager.theme
         term = manager.term
-        highlighter, syntax_name = yuio.hl.get_highlighter("python-traceback")
         return "".join(
-            highlighter.highlight(stack_info, theme=theme, syntax=syntax_name)
-            .indent()
-            .as_code(term.color_support)
+            _highlight_traceback(stack_info, theme).indent().as_code(term.color_support)
         )
 
 
@@ -3604,6 +5026,292 @@ class Handler(logging.Handler):
         manager.print_direct(self.format(record).rstrip() + "\n", manager.term.ostream)
 
 
+class QueuedHandler(Handler):
+    """
+    A handler that redirects all log messages to Yuio without blocking
+    the logging thread.
+
+    Log records are put into a bounded queue. A background thread takes them
+    from the queue, formats them, and writes them in batches. All queued records
+    are written when the handler is flushed or closed, and at interpreter exit.
+
+    .. note::
+
+        Records are formatted in a background thread, so objects passed
+        as logging arguments should not be mutated after logging.
+
+    :param level:
+        logging level for this handler.
+    :param max_size:
+        maximum number of records in the queue.
+    :param overflow:
+        what to do when the queue is full.
+
+    """
+
+    class Overflow(enum.Enum):
+        """
+        Policy for handling queue overflows.
+
+        """
+
+        BLOCK = "block"
+        """
+        Block the logging thread until there's space in the queue.
+
+        If the logging thread holds Yuio's IO lock, queued records are written
+        in this thread instead, because writer thread can't proceed without
+        the lock.
+
+        """
+
+        DROP_OLDEST = "drop_oldest"
+        """
+        Remove the oldest record from the queue to make space for the new one.
+
+        """
+
+        DROP = "drop"
+        """
+        Drop the new record.
+
+        """
+
+    # Max number of records that are written at once.
+    _BATCH_SIZE = 1000
+
+    def __init__(
+        self,
+        level: int | str = 0,
+        *,
+        max_size: int = 10_000,
+        overflow: QueuedHandler.Overflow = Overflow.BLOCK,
+    ):
+        super().__init__(level)
+
+        self.__queue: queue.Queue[LogRecord | None] = queue.Queue(max_size)
+        self.__overflow = overflow
+        self.__dropped = 0
+        self.__dropped_reported = 0
+        self.__dropped_lock = threading.Lock()
+        self.__thread: threading.Thread | None = None
+        self.__thread_lock = threading.Lock()
+        self.__closed = False
+
+    @property
+    def dropped(self) -> int:
+        """
+        Total number of records that were dropped because the queue was full.
+
+        """
+
+        return self.__dropped
+
+    def emit(self, record: LogRecord):
+        if (thread := self.__thread) is None:
+            thread = self.__start_thread()
+        if thread is None or thread is threading.current_thread():
+            # Handler is closed, or this record was emitted while writing
+            # other records. Write it directly to avoid blocking on our own queue.
+            super().emit(record)
+            return
+
+        if self.__overflow is QueuedHandler.Overflow.BLOCK:
+            try:
+                self.__queue.put_nowait(record)
+            except queue.Full:
+                pass
+            else:
+                return
+            if not _IO_LOCK._is_owned():  # type: ignore
+                self.__queue.put(record)
+                return
+            # Writer thread needs IO lock to drain the queue, so we can't wait
+            # for it. Write queued records and this record in the current thread.
+            self.__drain()
+            super().emit(record)
+            return
+
+        while True:
+            try:
+                self.__queue.put_nowait(record)
+            except queue.Full:
+                pass
+            else:
+                return
+
+            if self.__overflow is QueuedHandler.Overflow.DROP_OLDEST:
+                try:
+                    oldest = self.__queue.get_nowait()
+                except queue.Empty:
+                    continue  # Queue was drained concurrently, try again.
+                self.__queue.task_done()
+                if oldest is None:
+                    # Handler was closed concurrently, and we've removed
+                    # the stop marker. Put it back.
+                    super().emit(record)
+                    self.__put_stop_marker()
+                    return
+            with self.__dropped_lock:
+                self.__dropped += 1
+            if self.__overflow is QueuedHandler.Overflow.DROP:
+                return
+
+    def __put_stop_marker(self):
+        # Other threads could fill the queue at any moment. Make space
+        # for the marker without blocking: drop the oldest records in `DROP_OLDEST`
+        # mode, or write them in the current thread otherwise.
+        while True:
+            try:
+                self.__queue.put_nowait(None)
+            except queue.Full:
+                pass
+            else:
+                return
+            if self.__overflow is not QueuedHandler.Overflow.DROP_OLDEST:
+                self.__drain()
+                continue
+            try:
+                self.__queue.get_nowait()
+            except queue.Empty:
+                continue
+            self.__queue.task_done()
+            with self.__dropped_lock:
+                self.__dropped += 1
+
+    def flush(self):
+        """
+        Wait until all queued records are written.
+
+        """
+
+        thread = self.__thread
+        if thread is None or thread is threading.current_thread():
+            return
+        if _IO_LOCK._is_owned():  # type: ignore
+            # Writer thread can't make progress while we're holding IO lock.
+            self.__drain()
+        else:
+            self.__queue.join()
+
+    def close(self):
+        """
+        Write all queued records and stop the background thread.
+
+        """
+
+        owns_io_lock = _IO_LOCK._is_owned()  # type: ignore
+        with self.__thread_lock:
+            self.__closed = True
+            thread, self.__thread = self.__thread, None
+            if thread is not None:
+                atexit.unregister(self.close)
+                if owns_io_lock:
+                    # Writer thread can't drain the queue while we're holding
+                    # IO lock, so we can't wait for it to make space for the stop
+                    # marker. Other threads could fill the queue after we've
+                    # drained it, so we put the marker without blocking.
+                    self.__drain()
+                    self.__put_stop_marker()
+                else:
+                    self.__queue.put(None)
+        if (
+            thread is not None
+            and thread is not threading.current_thread()
+            and not owns_io_lock
+        ):
+            thread.join()
+        super().close()
+
+    def __start_thread(self) -> threading.Thread | None:
+        with self.__thread_lock:
+            if self.__thread is None and not self.__closed:
+                self.__thread = threading.Thread(
+                    target=self.__run,
+                    args=(self.__queue,),
+                    name="yuio_io_log_writer",
+                    daemon=True,
+                )
+                self.__thread.start()
+                atexit.register(self.close)
+            return self.__thread
+
+    def __run(self, records: queue.Queue[LogRecord | None]):
+        while True:
+            batch = [records.get()]
+            while len(batch) < self._BATCH_SIZE:
+                try:
+                    batch.append(records.get_nowait())
+                except queue.Empty:
+                    break
+
+            try:
+                self.__write(batch)
+            finally:
+                for _ in batch:
+                    records.task_done()
+
+            if None in batch:
+                return
+
+    def __drain(self):
+        # Write all queued records in the current thread. Used when the current
+        # thread holds IO lock, and writer thread is blocked on it.
+        batch: list[LogRecord | None] = []
+        while True:
+            try:
+                batch.append(self.__queue.get_nowait())
+            except queue.Empty:
+                break
+
+        try:
+            self.__write(batch)
+        finally:
+            for _ in batch:
+                self.__queue.task_done()
+
+        if None in batch:
+            # Handler was closed concurrently, and we've removed the stop marker.
+            # Put it back.
+            self.__put_stop_marker()
+
+    def __write(self, batch: list[LogRecord | None]):
+        lines: list[str] = []
+        records: list[LogRecord] = []
+        for record in batch:
+            if record is None:
+                continue
+            try:
+                lines.append(self.format(record).rstrip() + "\n")
+            except Exception:
+                self.handleError(record)
+            else:
+                records.append(record)
+
+        if self.__dropped != self.__dropped_reported:
+            with self.__dropped_lock:
+                n_dropped = self.__dropped - self.__dropped_reported
+                self.__dropped_reported = self.__dropped
+            record = LogRecord(
+                "yuio",
+                logging.WARNING,
+                __file__,
+                0,
+                "%s log records were dropped because logging queue was full",
+                (n_dropped,),
+                None,
+            )
+            lines.append(self.format(record).rstrip() + "\n")
+            records.append(record)
+
+        if lines:
+            try:
+                manager = _manager()
+                manager.print_direct_lines(lines, manager.term.ostream)
+            except Exception:
+                self.handleError(records[0])
+
+
 class _IoManager(abc.ABC):
     # If we see that it took more than this time to render progress bars,
     # we assume that the process was suspended, meaning that we might've been moved
@@ -3613,6 +5321,10 @@ class _IoManager(abc.ABC):
     # rely on it.
     TASK_RENDER_TIMEOUT_NS = 250_000_000
 
+    # When output is batched, we write messages immediately if there's too many
+    # of them, even if the next frame hasn't come yet. This bounds memory usage.
+    MAX_PENDING_LINES = 1000
+
     def __init__(
         self,
         term: yuio.term.Term | None = None,
@@ -3638,31 +5350,45 @@ class _IoManager(abc.ABC):
         self._rc = yuio.widget.RenderContext(self._term, self._theme)
         self._rc.prepare()
 
+        # Background thread will resolve all theme colors in advance.
+        self._theme_to_precompile: yuio.theme.Theme | None = self._theme
+
         self._suspended: int = 0
-        self._suspended_lines: list[tuple[list[str], _t.TextIO]] = []
+        self._suspended_lines: list[tuple[_t.Iterable[list[str]], _t.TextIO]] = []
+
+        self._batch_output: bool = False
+        self._pending_lines: list[tuple[list[str], _t.TextIO]] = []
 
         self._tasks_root = _TasksRoot()
         self._tasks_widet = _TaskTree(self._tasks_root)
         self._printed_tasks: bool = False
         self._needs_update = False
+        self._spinner_displayed = False
         self._last_update_time_us = 0
         self._printed_some_lines = False
 
         self._stop = False
-        self._stop_condition = threading.Condition(_IO_LOCK)
+        self._stop_condition = threading.Condition(_IO_LOCK)  # type: ignore
         self._thread: threading.Thread | None = None
 
+        # Background thread sleeps on this queue until there's something to redraw.
+        # We use `SimpleQueue` because its `put` is reentrant, and thus can be
+        # safely called from signal handlers.
+        self._wakeup: queue.SimpleQueue[None] = queue.SimpleQueue()
+
+        # When attached to an event loop, frames are scheduled on the loop
+        # instead of the background thread.
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_frame_handle: asyncio.TimerHandle | None = None
+
         self._enable_bg_updates = enable_bg_updates
-        self._prev_sigcont_handler: (
-            None | yuio.Missing | int | _t.Callable[[int, types.FrameType | None], None]
-        ) = yuio.MISSING
+        self._prev_signal_handlers: dict[
+            int, None | int | _t.Callable[[int, types.FrameType | None], None]
+        ] = {}
         self._seen_sigcont: bool = False
         if enable_bg_updates:
-            self._setup_sigcont()
-            self._thread = threading.Thread(
-                target=self._bg_update, name="yuio_io_task_refresh", daemon=True
-            )
-            self._thread.start()
+            self._setup_signals()
+            self._start_thread()
 
             atexit.register(self.stop)
 
@@ -3696,10 +5422,15 @@ class _IoManager(abc.ABC):
         theme: (
             yuio.theme.Theme | _t.Callable[[yuio.term.Term], yuio.theme.Theme] | None
         ) = None,
+        batch_output: bool | None = None,
     ):
         with _IO_LOCK:
+            self._flush_pending_lines()
             self._clear_tasks()
 
+            if batch_output is not None:
+                self._batch_output = batch_output
+
             if term is not None:
                 self._term = term
                 if theme is None:
@@ -3711,56 +5442,108 @@ class _IoManager(abc.ABC):
                     self._theme = theme
                 else:
                     self._theme = yuio.theme.load(self._term, theme)
+                self._theme_to_precompile = self._theme
+                self._wake()
 
             self._rc = yuio.widget.RenderContext(self._term, self._theme)
             self._rc.prepare()
             self.__dict__.pop("_update_rate_us", None)  # type: ignore
             self._update_tasks()
 
-    def _setup_sigcont(self):
+    def _setup_signals(self):
         import signal
 
-        if not hasattr(signal, "SIGCONT"):
-            return
+        if hasattr(signal, "SIGCONT"):
+            self._setup_signal(signal.SIGCONT, self._on_sigcont)
+        if hasattr(signal, "SIGWINCH"):
+            self._setup_signal(signal.SIGWINCH, self._on_sigwinch)
+
+    def _setup_signal(
+        self, sig: int, handler: _t.Callable[[int, types.FrameType | None], None]
+    ):
+        import signal
 
-        self._prev_sigcont_handler = signal.getsignal(signal.SIGCONT)
-        signal.signal(signal.SIGCONT, self._on_sigcont)
+        self._prev_signal_handlers[sig] = signal.getsignal(sig)
+        signal.signal(sig, handler)
 
-    def _reset_sigcont(self):
+    def _reset_signals(self):
         import signal
 
-        if not hasattr(signal, "SIGCONT"):
-            return
+        for sig, handler in self._prev_signal_handlers.items():
+            signal.signal(sig, handler)
+        self._prev_signal_handlers.clear()
 
-        if self._prev_sigcont_handler is not yuio.MISSING:
-            signal.signal(signal.SIGCONT, self._prev_sigcont_handler)
+    def _call_prev_signal_handler(self, sig: int, frame: types.FrameType | None):
+        handler = self._prev_signal_handlers.get(sig)
+        if handler and not isinstance(handler, int):
+            handler(sig, frame)
 
     def _on_sigcont(self, sig: int, frame: types.FrameType | None):
+        # Note: signal handlers can't take locks, so we just set flags
+        # and wake up the background thread.
         self._seen_sigcont = True
-        if self._prev_sigcont_handler and not isinstance(
-            self._prev_sigcont_handler, int
-        ):
-            self._prev_sigcont_handler(sig, frame)
+        self._wake()
+        self._call_prev_signal_handler(sig, frame)
+
+    def _on_sigwinch(self, sig: int, frame: types.FrameType | None):
+        self._needs_update = True
+        self._wake()
+        self._call_prev_signal_handler(sig, frame)
+
+    def _start_thread(self):
+        self._thread = threading.Thread(
+            target=self._bg_update, name="yuio_io_task_refresh", daemon=True
+        )
+        self._thread.start()
+
+    def _wake(self):
+        if (loop := self._loop) is not None:
+            try:
+                loop.call_soon_threadsafe(self._schedule_loop_frame)
+            except RuntimeError:  # pragma: no cover
+                pass  # Loop is closed.
+        else:
+            self._wakeup.put(None)
 
     def _bg_update(self):
         while True:
             try:
+                if (theme := self._theme_to_precompile) is not None:
+                    self._theme_to_precompile = None
+                    theme._precompile_colors()
+                if (
+                    not self._needs_update
+                    and not self._spinner_displayed
+                    and not self._pending_lines
+                ):
+                    # Nothing to redraw, sleep until some task changes,
+                    # some message is printed, or until we receive a signal.
+                    self._wakeup.get()
+                while True:
+                    try:
+                        self._wakeup.get_nowait()
+                    except queue.Empty:
+                        break
+
                 with _IO_LOCK:
-                    while True:
-                        update_rate_us = self._update_rate_us
-                        start_ns = time.monotonic_ns()
-                        now_us = start_ns // 1_000
-                        sleep_us = update_rate_us - now_us % update_rate_us
-                        deadline_ns = (
-                            start_ns + 2 * sleep_us * 1000 + self.TASK_RENDER_TIMEOUT_NS
-                        )
+                    # Wait until the next frame; this coalesces all updates
+                    # that happen in the meantime into a single render.
+                    update_rate_us = self._update_rate_us
+                    start_ns = time.monotonic_ns()
+                    now_us = start_ns // 1_000
+                    sleep_us = update_rate_us - now_us % update_rate_us
+                    deadline_ns = (
+                        start_ns + 2 * sleep_us * 1000 + self.TASK_RENDER_TIMEOUT_NS
+                    )
 
-                        if self._stop_condition.wait_for(
-                            lambda: self._stop, timeout=sleep_us / 1_000_000
-                        ):
-                            return
+                    if self._stop_condition.wait_for(
+                        lambda: self._stop or self._loop is not None,
+                        timeout=sleep_us / 1_000_000,
+                    ):
+                        return
 
-                        self._show_tasks(deadline_ns=deadline_ns)
+                    self._flush_pending_lines()
+                    self._show_tasks(deadline_ns=deadline_ns)
             except Exception:
                 yuio._logger.critical("exception in bg updater", exc_info=True)
 
@@ -3773,13 +5556,81 @@ class _IoManager(abc.ABC):
 
             self._stop = True
             self._stop_condition.notify()
+            self._wakeup.put(None)
+            if self._loop_frame_handle is not None:
+                self._loop_frame_handle.cancel()
+                self._loop_frame_handle = None
+            self._flush_pending_lines()
             self._show_tasks(immediate_render=True)
 
         if self._thread:
             self._thread.join()
 
-        if self._prev_sigcont_handler is not yuio.MISSING:
-            self._reset_sigcont()
+        self._reset_signals()
+
+    def attach_loop(self, loop: asyncio.AbstractEventLoop):
+        with _IO_LOCK:
+            if self._loop is not None:
+                raise RuntimeError("yuio.io is already attached to an event loop")
+            if self._stop or not self._enable_bg_updates:
+                return
+
+            self._loop = loop
+            self._stop_condition.notify()
+            self._wakeup.put(None)
+            thread, self._thread = self._thread, None
+
+        # Background thread will see that `_loop` is set, and exit.
+        if thread is not None:
+            thread.join()
+
+        loop.call_soon(self._schedule_loop_frame)
+
+    def detach_loop(self, loop: asyncio.AbstractEventLoop):
+        with _IO_LOCK:
+            if self._loop is not loop:
+                return
+
+            self._loop = None
+            if self._loop_frame_handle is not None:
+                self._loop_frame_handle.cancel()
+                self._loop_frame_handle = None
+            self._flush_pending_lines()
+            self._show_tasks(immediate_render=True)
+
+            if not self._stop:
+                self._start_thread()
+
+    def _schedule_loop_frame(self):
+        # This function is called from the event loop.
+        if self._loop is None or self._loop_frame_handle is not None:
+            return
+
+        # Wait until the next frame; this coalesces all updates
+        # that happen in the meantime into a single render.
+        update_rate_us = self._update_rate_us
+        now_us = time.monotonic_ns() // 1_000
+        sleep_us = update_rate_us - now_us % update_rate_us
+        self._loop_frame_handle = self._loop.call_later(
+            sleep_us / 1_000_000, self._loop_frame
+        )
+
+    def _loop_frame(self):
+        # This function is called from the event loop.
+        self._loop_frame_handle = None
+
+        with _IO_LOCK:
+            if self._loop is None:
+                return
+
+            try:
+                self._flush_pending_lines()
+                self._show_tasks()
+            except Exception:
+                yuio._logger.critical("exception in task updater", exc_info=True)
+
+            if self._needs_update or self._spinner_displayed or self._pending_lines:
+                self._schedule_loop_frame()
 
     def print(
         self,
@@ -3798,6 +5649,23 @@ class _IoManager(abc.ABC):
             if heading:
                 self._printed_some_lines = False
 
+    def print_iter(
+        self,
+        msg: _t.Iterable[list[str]],
+        term: yuio.term.Term,
+        *,
+        ignore_suspended: bool = False,
+        heading: bool = False,
+    ):
+        with _IO_LOCK:
+            if heading and self.theme.separate_headings:
+                if self._printed_some_lines:
+                    msg = itertools.chain([["\n"]], msg)
+                msg = itertools.chain(msg, [["\n"]])
+            self._emit_lines_iter(msg, term.ostream, ignore_suspended)
+            if heading:
+                self._printed_some_lines = False
+
     def print_direct(
         self,
         msg: str,
@@ -3824,6 +5692,10 @@ class _IoManager(abc.ABC):
         with _IO_LOCK:
             self._resume()
 
+    def flush(self):
+        with _IO_LOCK:
+            self._flush_pending_lines()
+
     # Implementation.
     # These functions are always called under a lock.
 
@@ -3850,17 +5722,103 @@ class _IoManager(abc.ABC):
             return
         stream = stream or self._term.ostream
         if self._suspended and not ignore_suspended:
-            self._suspended_lines.append((list(lines), stream))
+            self._suspended_lines.append(([list(lines)], stream))
+        elif (
+            self._batch_output
+            and self._enable_bg_updates
+            and not self._suspended
+            and not self._stop
+        ):
+            # Background thread will write these lines on its next frame.
+            self._pending_lines.append((list(lines), stream))
+            if len(self._pending_lines) >= self.MAX_PENDING_LINES:
+                self._flush_pending_lines()
+            elif len(self._pending_lines) == 1:
+                self._wake()
         else:
+            self._flush_pending_lines()
             self._clear_tasks()
-            stream.writelines(lines)
+            self._write_lines(lines, stream)
             if lines and lines[-1].endswith("\n"):
                 self._update_tasks(immediate_render=True)
-            stream.flush()
+            self._flush_stream(stream)
 
         self._printed_some_lines = True
 
+    def _emit_lines_iter(
+        self,
+        chunks: _t.Iterable[list[str]],
+        stream: _t.TextIO | None = None,
+        ignore_suspended: bool = False,
+    ):
+        if self._suspended and not ignore_suspended:
+            # Suspended output may never be shown, so we don't render it
+            # until output is resumed.
+            self._suspended_lines.append((chunks, stream or self._term.ostream))
+            self._printed_some_lines = True
+            return
+        if self._batch_output and self._enable_bg_updates and not self._stop:
+            # Lines are buffered anyway, no point in streaming them.
+            for lines in chunks:
+                self._emit_lines(lines, stream, ignore_suspended)
+            return
+
+        stream = stream or self._term.ostream
+        last_line = None
+        for lines in chunks:
+            if not lines or not any(lines):
+                continue
+            if last_line is None:
+                self._flush_pending_lines()
+                self._clear_tasks()
+            self._write_lines(lines, stream)
+            last_line = lines[-1]
+        if last_line is None:
+            return
+        if last_line.endswith("\n"):
+            self._update_tasks(immediate_render=True)
+        self._flush_stream(stream)
+
+        self._printed_some_lines = True
+
+    def _write_lines(self, lines: list[str], stream: _t.TextIO):
+        if _MEASURE_WRITES:
+            start_ns = time.perf_counter_ns()
+            stream.writelines(lines)
+            _METRICS.write_ns += time.perf_counter_ns() - start_ns
+            _METRICS._add_lines(stream, lines)
+        else:
+            stream.writelines(lines)
+
+    def _flush_stream(self, stream: _t.TextIO):
+        if _MEASURE_WRITES:
+            start_ns = time.perf_counter_ns()
+            stream.flush()
+            _METRICS.write_ns += time.perf_counter_ns() - start_ns
+        else:
+            stream.flush()
+
+    def _flush_pending_lines(self):
+        if not self._pending_lines:
+            return
+
+        pending_lines, self._pending_lines = self._pending_lines, []
+
+        self._clear_tasks()
+        prev_stream: _t.TextIO | None = None
+        for lines, stream in pending_lines:
+            if prev_stream is not None and prev_stream is not stream:
+                # Preserve order of messages that go to different streams.
+                self._flush_stream(prev_stream)
+            self._write_lines(lines, stream)
+            prev_stream = stream
+        lines, stream = pending_lines[-1]
+        if lines[-1].endswith("\n"):
+            self._update_tasks(immediate_render=True)
+        self._flush_stream(stream)
+
     def _suspend(self):
+        self._flush_pending_lines()
         self._suspended += 1
 
         if self._suspended == 1:
@@ -3870,13 +5828,18 @@ class _IoManager(abc.ABC):
         self._suspended -= 1
 
         if self._suspended == 0:
-            for lines, stream in self._suspended_lines:
-                stream.writelines(lines)
-            if self._suspended_lines:
-                self._printed_some_lines = True
-            self._suspended_lines.clear()
-
-            self._update_tasks()
+            # Messages are formatted here, and formatting can fail. Detach
+            # the queue first, so that a failed message isn't written again
+            # on the next resume.
+            pending, self._suspended_lines = self._suspended_lines, []
+            try:
+                if pending:
+                    self._printed_some_lines = True
+                for chunks, stream in pending:
+                    for lines in chunks:
+                        self._write_lines(lines, stream)
+            finally:
+                self._update_tasks()
 
         if self._suspended < 0:
             yuio._logger.warning("unequal number of suspends and resumes")
@@ -3899,18 +5862,36 @@ class _IoManager(abc.ABC):
             self.rc.prepare(reset_term_pos=True)
             self._printed_tasks = False
             self._seen_sigcont = False
+            self._needs_update = True
 
         return should_draw_interactive_tasks
 
     def _clear_tasks(self):
         if self._should_draw_interactive_tasks() and self._printed_tasks:
+            start_ns = time.perf_counter_ns()
             self._rc.finalize()
+            _METRICS.render_ns += time.perf_counter_ns() - start_ns
+            if _MEASURE_WRITES:
+                _METRICS._add_bytes(self._term.ostream, self._rc._bytes_rendered)
             self._printed_tasks = False
 
+    def _update_tasks_deferred(self, task: TaskBase):
+        # This function is called without a lock. Races here are benign: at worst,
+        # we'll wake up background thread one extra time. Note that callers
+        # update their state before checking `_needs_update`, so the background
+        # thread will see new state even if it resets `_needs_update` concurrently.
+        self._tasks_widet.task_changed(task)
+        if not self._needs_update:
+            self._needs_update = True
+            self._wake()
+
     def _update_tasks(self, immediate_render: bool = False):
-        self._needs_update = True
         if immediate_render or not self._enable_bg_updates:
+            self._needs_update = True
             self._show_tasks(immediate_render)
+        elif not self._needs_update:
+            self._needs_update = True
+            self._wake()
 
     def _show_tasks(
         self, immediate_render: bool = False, deadline_ns: int | None = None
@@ -3930,6 +5911,7 @@ class _IoManager(abc.ABC):
                 next_update_us = self._last_update_time_us + self._update_rate_us
                 if now_us < next_update_us:
                     # Hard-limit update rate by `update_rate_ms`.
+                    _METRICS.frames_skipped += 1
                     return
                 next_spinner_update_us = (
                     self._last_update_time_us + self._spinner_update_rate_us
@@ -3944,17 +5926,190 @@ class _IoManager(abc.ABC):
             self._needs_update = False
 
             self._rc.prepare()
+            layout_start_ns = time.perf_counter_ns()
             self._tasks_widet.layout(self._rc)
+            draw_start_ns = time.perf_counter_ns()
             self._tasks_widet.draw(self._rc)
+            draw_end_ns = time.perf_counter_ns()
+            _METRICS.layout_ns += draw_start_ns - layout_start_ns
+            _METRICS.draw_ns += draw_end_ns - draw_start_ns
+            self._spinner_displayed = self._rc._spinner_state_used
 
             now_ns = time.monotonic_ns()
             if not self._seen_sigcont and now_ns < deadline_ns:
                 self._rc.render()
+                _METRICS.render_ns += time.perf_counter_ns() - draw_end_ns
+                _METRICS.frames_rendered += 1
+                if _MEASURE_WRITES:
+                    _METRICS._add_bytes(self._term.ostream, self._rc._bytes_rendered)
             else:
+                _METRICS.frames_skipped += 1
                 # We have to skip this render: the process was suspended while we were
                 # formatting tasks. Because of this, te position of the cursor
                 # could've changed, so we need to reset rendering context and re-render.
                 self._seen_sigcont = True
+                self._needs_update = True
+        else:
+            # Tasks will be redrawn when they change, or when we're resumed
+            # or brought to foreground; no need for background updates until then.
+            self._needs_update = False
+            self._spinner_displayed = False
+            self._tasks_widet.discard_changed_tasks()
+
+
+class _WorkerIoManager(_IoManager):
+    # IO manager for worker processes that were started with `WorkerTasks`.
+    # Instead of rendering tasks and writing messages, it sends them
+    # to the parent process once per frame.
+
+    def __init__(self, config: _WorkerConfig):
+        import multiprocessing.util
+        import weakref
+
+        self._queue = config.queue
+        self._task_ids: weakref.WeakKeyDictionary[Task, int] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._next_task_id = 0
+        self._pending_chunks: list[_WorkerChunk] = []
+        self._n_pending_lines = 0
+
+        term = yuio.term.Term(
+            orig_stderr(),
+            sys.stdin,
+            color_support=config.color_support,
+            ostream_is_tty=config.ostream_is_tty,
+            is_unicode=config.is_unicode,
+            terminal_theme=config.terminal_theme,
+        )
+        super().__init__(term, config.theme_ctor)
+        self._out_term = dataclasses.replace(term, ostream=orig_stdout())
+        self._err_term = term
+
+        # Worker processes don't run `atexit` hooks.
+        multiprocessing.util.Finalize(None, self.stop, exitpriority=100)
+
+    def _setup_signals(self):
+        pass
+
+    def _should_draw_interactive_tasks(self):
+        # Parent process decides how to display tasks.
+        return True
+
+    def _clear_tasks(self):
+        pass
+
+    def _update_tasks(self, immediate_render: bool = False):
+        # Never send updates immediately, wait for the next frame instead.
+        super()._update_tasks(immediate_render=self._stop)
+
+    def _emit_lines(
+        self,
+        lines: list[str],
+        stream: _t.TextIO | None = None,
+        ignore_suspended: bool = False,
+    ):
+        if not lines or not any(lines):
+            return
+
+        # Make sure that task updates and messages arrive in the same order
+        # as they were made.
+        self._collect_task_updates()
+        if not self._pending_chunks:
+            self._pending_chunks.append(([], []))
+        to_stdout = stream is not None and stream is self._out_term.ostream
+        self._pending_chunks[-1][1].append((to_stdout, list(lines)))
+        self._n_pending_lines += 1
+        self._printed_some_lines = True
+
+        if self._stop or self._n_pending_lines >= self.MAX_PENDING_LINES:
+            self._send_frame()
+        elif not self._needs_update:
+            self._needs_update = True
+            self._wake()
+
+    def _emit_lines_iter(
+        self,
+        chunks: _t.Iterable[list[str]],
+        stream: _t.TextIO | None = None,
+        ignore_suspended: bool = False,
+    ):
+        for lines in chunks:
+            self._emit_lines(lines, stream, ignore_suspended)
+
+    def _flush_pending_lines(self):
+        self._send_frame()
+
+    def _show_tasks(
+        self, immediate_render: bool = False, deadline_ns: int | None = None
+    ):
+        self._needs_update = False
+        self._send_frame()
+
+    def _send_frame(self):
+        self._collect_task_updates()
+        chunks, self._pending_chunks = self._pending_chunks, []
+        self._n_pending_lines = 0
+        if chunks:
+            try:
+                self._queue.put((os.getpid(), chunks))
+            except Exception:
+                yuio._logger.critical("can't send worker tasks", exc_info=True)
+
+    def _collect_task_updates(self):
+        updates: list[_WorkerTaskUpdate] = []
+        seen: set[Task] = set()
+        for task in self._tasks_widet._pop_changed_tasks():
+            if isinstance(task, Task):
+                self._collect_task_update(task, updates, seen)
+        if updates:
+            self._pending_chunks.append((updates, []))
+
+    def _collect_task_update(
+        self, task: Task, updates: list[_WorkerTaskUpdate], seen: set[Task]
+    ) -> int | None:
+        # Adds task's update to the list, making sure that its parent is sent first.
+        # Returns task's id, or `None` if task is not attached to the tree.
+
+        if task in seen:
+            return self._task_ids.get(task)
+        seen.add(task)
+
+        is_attached = True
+        parent_id = None
+        parent = task._get_parent()
+        while parent is not None and not isinstance(parent, Task):
+            parent = parent._get_parent()
+        if parent is not None:
+            parent_id = self._collect_task_update(parent, updates, seen)
+            is_attached = parent_id is not None
+        elif task._get_parent() is None:
+            is_attached = False
+
+        if (task_id := self._task_ids.get(task)) is None:
+            if not is_attached and task._widget.status is Task.Status.RUNNING:
+                # This task was never displayed.
+                return None
+            task_id = self._task_ids[task] = self._next_task_id
+            self._next_task_id += 1
+        if not is_attached:
+            del self._task_ids[task]
+
+        task._apply_deferred_updates()
+        widget = task._widget
+        state: _WorkerTaskState = (
+            widget._msg,
+            _to_worker_args(widget._args),
+            widget._comment,
+            _to_worker_args(widget._comment_args),
+            widget.status.value,
+            widget._progress,
+            widget._progress_done,
+            widget._progress_total,
+        )
+        updates.append((task_id, parent_id, is_attached, state))
+
+        return task_id if is_attached else None
 
 
 class _YuioOutputWrapper(_t.TextIO):  # pragma: no cover
@@ -3980,6 +6135,7 @@ class _YuioOutputWrapper(_t.TextIO):  # pragma: no cover
         return self.__wrapped.fileno()
 
     def flush(self):
+        _manager().flush()
         self.__wrapped.flush()
 
     def isatty(self) -> bool:
@@ -469,8 +469,10 @@ import enum
 import fractions
 import functools
 import json
+import os
 import pathlib
 import re
+import sys
 import threading
 import traceback
 from copy import copy as _copy
@@ -780,11 +782,21 @@ class PartialParser(abc.ABC):
     """
 
     def __init__(self):
-        self.__orig_traceback = traceback.extract_stack()
-        while self.__orig_traceback and self.__orig_traceback[-1].filename.endswith(
-            "yuio/parse.py"
-        ):
-            self.__orig_traceback.pop()
+        # Extracting a stack summary reads source lines for every frame, which is
+        # slow when building hundreds of parsers for a CLI. We only save frame
+        # locations, and build a stack summary if it's actually needed.
+        frame = sys._getframe()
+        while frame is not None and frame.f_code.co_filename.endswith("yuio/parse.py"):
+            frame = frame.f_back
+        orig_frames: list[tuple[str, int, str, str | None]] = []
+        while frame is not None:
+            code = frame.f_code
+            orig_frames.append(
+                (code.co_filename, frame.f_lineno or 0, code.co_name, None)
+            )
+            frame = frame.f_back
+        orig_frames.reverse()
+        self.__orig_frames = orig_frames
         super().__init__()
 
     def _get_orig_traceback(self) -> traceback.StackSummary:
@@ -793,7 +805,7 @@ class PartialParser(abc.ABC):
 
         """
 
-        return self.__orig_traceback  # pragma: no cover
+        return traceback.StackSummary.from_list(self.__orig_frames)
 
     @contextlib.contextmanager
     def _patch_stack_summary(self):
@@ -807,7 +819,7 @@ class PartialParser(abc.ABC):
             yield
         except Exception as e:
             stack_summary_text = "Traceback (most recent call last):\n" + "".join(
-                self.__orig_traceback.format()
+                self._get_orig_traceback().format()
             )
             e.args = (
                 f"{e}\n\nThe above error happened because of "
@@ -4011,8 +4023,12 @@ class Dict(CollectionParser[dict[K, V], tuple[K, V]], _t.Generic[K, V]):
         )
 
     def wrap(self, parser: Parser[_t.Any]) -> Parser[_t.Any]:
-        result = super().wrap(parser)
-        result._inner._delimiter = self._pair_delimiter  # pyright: ignore[reportAttributeAccessIssue]
+        # Skip `CollectionParser.wrap`: inner element parser can be shared
+        # with other parsers (i.e. cached by `from_type_hint`), so instead
+        # of changing its delimiter, we create a new one.
+        result = super(CollectionParser, self).wrap(parser)
+        key, value = parser._inner._inner  # type: ignore
+        result._inner = _DictElementParser(key, value, delimiter=self._pair_delimiter)
         return result
 
     @staticmethod
@@ -6086,6 +6102,25 @@ class _FromTypeHintDepth(threading.local):
 
 _FROM_TYPE_HINT_DEPTH: _FromTypeHintDepth = _FromTypeHintDepth()
 
+_FROM_TYPE_HINT_CACHE_SIZE = 1024
+_FROM_TYPE_HINT_CACHE: dict[_t.Hashable, Parser[object]] = {}
+_FROM_TYPE_HINT_CACHE_GENERATION = 0
+_FROM_TYPE_HINT_CACHE_LOCK = threading.Lock()
+
+
+def _reinit_from_type_hint_cache_lock():
+    # A forked process shouldn't inherit a locked lock.
+    global _FROM_TYPE_HINT_CACHE_LOCK
+    _FROM_TYPE_HINT_CACHE_LOCK = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(
+        before=lambda: _FROM_TYPE_HINT_CACHE_LOCK.acquire(),
+        after_in_parent=lambda: _FROM_TYPE_HINT_CACHE_LOCK.release(),
+        after_in_child=_reinit_from_type_hint_cache_lock,
+    )
+
 
 @_t.overload
 def from_type_hint(ty: type[T], /) -> Parser[T]: ...
@@ -6096,6 +6131,10 @@ def from_type_hint(ty: _t.Any, /) -> Parser[object]:
 
     Create parser from a type hint.
 
+    Created parsers are cached, so deriving a parser for the same type hint
+    multiple times is cheap. Cache is reset whenever a new conversion
+    is registered via :func:`register_type_hint_conversion`.
+
     :param ty:
         a type hint.
 
@@ -6114,11 +6153,47 @@ def from_type_hint(ty: _t.Any, /) -> Parser[object]:
 
     """
 
+    key = (_type_hint_cache_key(ty), _FROM_TYPE_HINT_DEPTH.depth)
+    try:
+        hash(key)
+    except TypeError:
+        # Type hint is not hashable, i.e. it has unhashable annotations.
+        key = None
+
+    generation = _FROM_TYPE_HINT_CACHE_GENERATION
+    if key is not None:
+        with _FROM_TYPE_HINT_CACHE_LOCK:
+            result = _FROM_TYPE_HINT_CACHE.pop(key, None)
+            if result is not None:
+                _FROM_TYPE_HINT_CACHE[key] = result
+                return result
+
     result = _from_type_hint(ty)
+    if getattr(result, "_Parser__typehint", None) is not None:
+        # Result came from a nested call, i.e. for `Annotated[int, "doc"]`,
+        # and is shared with other cache entries. Don't override its type hint.
+        result = _copy(result)
     setattr(result, "_Parser__typehint", ty)
+
+    if key is not None:
+        with _FROM_TYPE_HINT_CACHE_LOCK:
+            # If a new conversion was registered while we were building a parser,
+            # the result might be stale.
+            if generation == _FROM_TYPE_HINT_CACHE_GENERATION:
+                _FROM_TYPE_HINT_CACHE[key] = result
+                if len(_FROM_TYPE_HINT_CACHE) > _FROM_TYPE_HINT_CACHE_SIZE:
+                    del _FROM_TYPE_HINT_CACHE[next(iter(_FROM_TYPE_HINT_CACHE))]
+
     return result
 
 
+def _type_hint_cache_key(ty: _t.Any, /) -> _t.Hashable:
+    # Type hints compare equal regardless of order of union members,
+    # i.e. `int | str == str | int`, yet we derive different parsers for them.
+    # So we include ordered arguments into the key.
+    return type(ty), ty, tuple(_type_hint_cache_key(arg) for arg in _t.get_args(ty))
+
+
 def _from_type_hint(ty: _t.Any, /) -> Parser[object]:
     if isinstance(ty, (str, _t.ForwardRef)):
         raise TypeError(f"forward references are not supported here: {ty}")
@@ -6236,7 +6311,12 @@ def register_type_hint_conversion(
     """
 
     def registrar(cb: _FromTypeHintCallback):
-        _FROM_TYPE_HINT_CALLBACKS.append((cb, uses_delim))
+        global _FROM_TYPE_HINT_CACHE_GENERATION
+
+        with _FROM_TYPE_HINT_CACHE_LOCK:
+            _FROM_TYPE_HINT_CALLBACKS.append((cb, uses_delim))
+            _FROM_TYPE_HINT_CACHE.clear()
+            _FROM_TYPE_HINT_CACHE_GENERATION += 1
         return cb
 
     return registrar(cb) if cb is not None else registrar
@@ -259,6 +259,8 @@ import yuio._typing_ext as _tx
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    import yuio.hl
+
     import typing_extensions as _t
 else:
     from yuio import _typing as _t
@@ -367,13 +369,45 @@ def line_width(s: str, /) -> int:
         # Fast path. Note that our renderer replaces unprintable characters
         # with spaces, so ascii strings always have width equal to their length.
         return len(s)
+    elif len(s) == 1:
+        return _CHAR_WIDTHS[s]
+    elif len(s) <= _MAX_CACHED_WIDTH_LEN:
+        return _cached_line_width(s)
     else:
+        return sum(map(_CHAR_WIDTHS.__getitem__, s))
+
+
+class _CharWidths(dict[str, int]):
+    # Table of code point widths. Looking up a code point in a dict is several times
+    # faster than querying `unicodedata`, so we fill this table lazily; this way
+    # it stays small and always agrees with the `unicodedata` of the running Python.
+
+    def __init__(self):
+        super().__init__()
+
+        # Latin-1 is common enough to fill its part of the table upfront.
+        for c in range(0x80, 0x100):
+            self.__missing__(chr(c))
+
+    def __missing__(self, c: str) -> int:
         # Long path. It kinda works, but not always, but most of the times...
-        return sum(
-            (unicodedata.east_asian_width(c) in "WF") + 1
-            for c in s
-            if unicodedata.category(c)[0] not in "MC"
-        )
+        if unicodedata.category(c)[0] in "MC":
+            width = 0
+        else:
+            width = (unicodedata.east_asian_width(c) in "WF") + 1
+        self[c] = width
+        return width
+
+
+_CHAR_WIDTHS = _CharWidths()
+
+# Short strings, such as file names or task headings, are measured repeatedly.
+_MAX_CACHED_WIDTH_LEN = 256
+
+
+@functools.lru_cache(maxsize=1024)
+def _cached_line_width(s: str, /) -> int:
+    return sum(map(_CHAR_WIDTHS.__getitem__, s))
 
 
 RichReprResult: _t.TypeAlias = _t.Iterable[
@@ -677,6 +711,9 @@ class ColorizedString:
     # - no-wrap regions can't be nested.
     # - for every pair of (start-no-wrap, end-no-wrap) markers, there is a string
     #   between them (i.e. no empty no-wrap regions).
+    #
+    # Copies share `_parts` until one of them is modified; all modifications
+    # of `_parts` should go through `_own_parts`.
 
     def __init__(
         self,
@@ -686,7 +723,8 @@ class ColorizedString:
     ):
         if len(args) == 1 and isinstance(args[0], ColorizedString):
             content = args[0]
-            self._parts = content._parts.copy()
+            self._parts = content._parts
+            self._shared = content._shared = True
             self._last_color = content._last_color
             self._active_color = content._active_color
             self._last_url = content._last_url
@@ -698,6 +736,7 @@ class ColorizedString:
                 self.__dict__["width"] = width
         else:
             self._parts: list[_Color | NoWrapMarker | LinkMarker | str] = []
+            self._shared = False
             self._active_color = _Color.NONE
             self._last_color: _Color | None = None
             self._last_url: str | None = None
@@ -821,13 +860,19 @@ class ColorizedString:
 
         if not s:
             return
+        parts = self._own_parts() if self._shared else self._parts
         if self._last_url != self._active_url:
-            self._parts.append(LinkMarker(self._active_url))
+            parts.append(LinkMarker(self._active_url))
             self._last_url = self._active_url
-        if self._last_color != self._active_color:
-            self._parts.append(self._active_color)
+        # Colors are usually the same objects, identity check saves us
+        # a call to `Color.__eq__`.
+        if (
+            self._last_color is not self._active_color
+            and self._last_color != self._active_color
+        ):
+            parts.append(self._active_color)
             self._last_color = self._active_color
-        self._parts.append(s)
+        parts.append(s)
         self._len += len(s)
         self.__dict__.pop("width", None)
 
@@ -878,10 +923,16 @@ class ColorizedString:
         # We don't need to do this with colors because `parts` already starts with
         # a correct color.
         if self._last_url != self._active_url:
-            self._parts.append(LinkMarker(self._active_url))
+            self._own_parts().append(LinkMarker(self._active_url))
             self._last_url = self._active_url
 
-        self._parts.extend(parts)
+        if not self._parts and parts is s._parts:
+            # We're empty, and we don't need to modify appended parts,
+            # so we can share them instead of copying.
+            self._parts = s._parts
+            self._shared = s._shared = True
+        else:
+            self._own_parts().extend(parts)
 
         if not self._has_no_wrap and s._has_no_wrap:
             self._has_no_wrap = True
@@ -927,7 +978,7 @@ class ColorizedString:
             return
 
         self._has_no_wrap = True
-        self._parts.append(NO_WRAP_START)
+        self._own_parts().append(NO_WRAP_START)
 
     def end_no_wrap(self):
         """
@@ -940,9 +991,9 @@ class ColorizedString:
 
         if self._parts and self._parts[-1] is NO_WRAP_START:
             # Empty no-wrap sequence, just remove it.
-            self._parts.pop()
+            self._own_parts().pop()
         else:
-            self._parts.append(NO_WRAP_END)
+            self._own_parts().append(NO_WRAP_END)
 
         self._has_no_wrap = False
 
@@ -973,6 +1024,12 @@ class ColorizedString:
 
         return ColorizedString(self)
 
+    def _own_parts(self) -> list[_Color | NoWrapMarker | LinkMarker | str]:
+        if self._shared:
+            self._parts = self._parts.copy()
+            self._shared = False
+        return self._parts
+
     def _split_at(self, i: int, /) -> tuple[ColorizedString, ColorizedString]:
         l, r = ColorizedString(), ColorizedString()
         l.extend(self._parts[:i])
@@ -1030,22 +1087,36 @@ class ColorizedString:
 
         return res
 
-    def as_code(self, color_support: yuio.color.ColorSupport, /) -> list[str]:
+    def as_code(
+        self, color_support: yuio.color.ColorSupport, /, *, delta: bool = False
+    ) -> list[str]:
         """
         Convert colors in this string to ANSI escape sequences.
 
         :param color_support:
             desired level of color support.
+        :param delta:
+            if set to :data:`True`, every color except the first one is converted
+            using :meth:`Color.as_code_from() <yuio.color.Color.as_code_from>`,
+            i.e. only attributes that differ from the previous color are emitted.
+            This produces less output, but the returned parts can only be
+            printed all together, in order.
         :returns:
             raw parts of colorized string with all colors converted to ANSI
             escape sequences.
 
         """
 
+        return self._as_code(color_support, delta, True)
+
+    def _as_code(
+        self, color_support: yuio.color.ColorSupport, delta: bool, close: bool
+    ) -> list[str]:
         if color_support == yuio.color.ColorSupport.NONE:
             return [part for part in self._parts if isinstance(part, str)]
         else:
             parts: list[str] = []
+            prev_color: _Color | None = None
             for part in self:
                 if isinstance(part, LinkMarker):
                     parts.append("\x1b]8;;")
@@ -1054,13 +1125,29 @@ class ColorizedString:
                 elif isinstance(part, str):
                     parts.append(part)
                 elif isinstance(part, _Color):
-                    parts.append(part.as_code(color_support))
-            if self._last_color != _Color.NONE:
+                    if prev_color is None:
+                        parts.append(part.as_code(color_support))
+                    elif code := part.as_code_from(prev_color, color_support):
+                        parts.append(code)
+                    if delta:
+                        prev_color = part
+            if close and self._last_color != _Color.NONE:
                 parts.append(_Color.NONE.as_code(color_support))
-            if self._last_url is not None:
+            if close and self._last_url is not None:
                 parts.append("\x1b]8;;\x1b\\")
             return parts
 
+    def _continuation(self) -> ColorizedString:
+        # Returns an empty string that picks up where this one ends: appending
+        # anything to it produces the same parts as appending to `self` would.
+        res = ColorizedString()
+        res._last_color = self._last_color
+        res._active_color = self._active_color
+        res._last_url = self._last_url
+        res._active_url = self._active_url
+        res._has_no_wrap = self._has_no_wrap
+        return res
+
     def wrap(
         self,
         width: int,
@@ -1138,6 +1225,41 @@ class ColorizedString:
             continuation_indent=continuation_indent,
         ).wrap(self)
 
+    def iter_wrap(
+        self,
+        width: int,
+        /,
+        *,
+        preserve_spaces: bool = False,
+        preserve_newlines: bool = True,
+        break_long_words: bool = True,
+        break_long_nowrap_words: bool = False,
+        overflow: _t.Literal[False] | str = False,
+        indent: AnyString | int = "",
+        continuation_indent: AnyString | int | None = None,
+    ) -> _t.Iterator[ColorizedString]:
+        """
+        Like :meth:`~ColorizedString.wrap`, but yields lines one by one
+        as soon as they're ready.
+
+        This is useful for very long texts: only the line that's currently
+        being wrapped is kept in memory.
+
+        See :meth:`~ColorizedString.wrap` for description of parameters.
+
+        """
+
+        return _TextWrapper(
+            width,
+            preserve_spaces=preserve_spaces,
+            preserve_newlines=preserve_newlines,
+            break_long_words=break_long_words,
+            break_long_nowrap_words=break_long_nowrap_words,
+            overflow=overflow,
+            indent=indent,
+            continuation_indent=continuation_indent,
+        ).iter_wrap(self)
+
     def indent(
         self,
         indent: AnyString | int = "  ",
@@ -1289,6 +1411,50 @@ Any string (i.e. a :class:`str`, a raw colorized string, or a normal colorized s
 """
 
 
+_MAX_STREAMED_PARTS = 1024
+
+
+def _iter_as_code(
+    parts: _t.Iterable[AnyString],
+    color_support: yuio.color.ColorSupport,
+    /,
+    max_parts: int = _MAX_STREAMED_PARTS,
+) -> _t.Iterator[list[str]]:
+    # Same as `ColorizedString(*parts).as_code(color_support, delta=True)`,
+    # but yields escape codes in chunks without assembling the whole string
+    # in memory. Every chunk is written as a whole, and its first color
+    # is a full code, so delta codes are safe to use here.
+    res = ColorizedString()
+    for part in parts:
+        res += part
+        if len(res._parts) >= max_parts:
+            yield res._as_code(color_support, True, False)
+            res = res._continuation()
+    yield res.as_code(color_support, delta=True)
+
+
+def _iter_plain(
+    parts: _t.Iterable[AnyString],
+    /,
+    max_parts: int = _MAX_STREAMED_PARTS,
+) -> _t.Iterator[list[str]]:
+    # Same as `_iter_as_code(parts, ColorSupport.NONE)`, but skips all colors
+    # and markers without assembling a colorized string.
+    chunk: list[str] = []
+    for part in parts:
+        if isinstance(part, str):
+            if part:
+                chunk.append(part)
+        elif isinstance(part, ColorizedString):
+            chunk.extend(s for s in part._parts if isinstance(s, str) and s)
+        elif not isinstance(part, (_Color, NoWrapMarker, LinkMarker)):
+            chunk.extend(ColorizedString(part).as_code(yuio.color.ColorSupport.NONE))
+        if len(chunk) >= max_parts:
+            yield chunk
+            chunk = []
+    yield chunk
+
+
 _S_SYNTAX = re.compile(
     r"""
         %                               # Percent
@@ -1331,30 +1497,55 @@ _F_SYNTAX = re.compile(
 )
 
 
+_PercentFormatItem: _t.TypeAlias = (
+    "_tx.StrReMatch | str | _Color | NoWrapMarker | LinkMarker"
+)
+
+
 def _percent_format(
     s: ColorizedString, args: object, ctx: ReprContext
 ) -> ColorizedString:
-    seen_mapping = False
-    arg_index = 0
-    res = ColorizedString()
+    return _percent_format_parsed(_parse_percent_format(s), args, ctx)
+
+
+def _parse_percent_format(s: ColorizedString) -> list[_PercentFormatItem]:
+    items: list[_PercentFormatItem] = []
     for part in s:
         if isinstance(part, str):
             pos = 0
             for match in _S_SYNTAX.finditer(part):
                 if pos < match.start():
-                    res.append_str(part[pos : match.start()])
-                seen_mapping = seen_mapping or bool(match.group("mapping"))
-                last_color = res.active_color
-                arg_index, replaced = _percent_format_repl(
-                    match, args, arg_index, last_color, ctx
-                )
-                res += replaced
-                res.append_color(last_color)
+                    items.append(part[pos : match.start()])
+                items.append(match)
                 pos = match.end()
             if pos < len(part):
-                res.append_str(part[pos:])
+                items.append(part[pos:])
+        else:
+            items.append(part)
+    return items
+
+
+def _percent_format_parsed(
+    items: list[_PercentFormatItem], args: object, ctx: ReprContext
+) -> ColorizedString:
+    seen_mapping = False
+    arg_index = 0
+    res = ColorizedString()
+    for item in items:
+        if isinstance(item, str):
+            res.append_str(item)
+        elif isinstance(item, _Color):
+            res.append_color(item)
+        elif isinstance(item, re.Match):
+            seen_mapping = seen_mapping or bool(item.group("mapping"))
+            last_color = res.active_color
+            arg_index, replaced = _percent_format_repl(
+                item, args, arg_index, last_color, ctx
+            )
+            res += replaced
+            res.append_color(last_color)
         else:
-            res += part
+            res += item
 
     if (isinstance(args, tuple) and arg_index < len(args)) or (
         not isinstance(args, tuple)
@@ -1512,6 +1703,9 @@ def _percent_format_repl_str(
         align = ">"
     res = _apply_format(res, width, precision, align, " ")
 
+    if ctx.term.color_support == yuio.color.ColorSupport.NONE:
+        # Colors will be dropped anyway.
+        return arg_index, res
     return arg_index, res.with_base_color(base_color)
 
 
@@ -1627,6 +1821,17 @@ def colorize(
 
     """
 
+    if isinstance(template, str) and len(template) <= _MAX_CACHED_TEMPLATE_LEN:
+        # Messages are usually string literals, so we parse them once.
+        theme = ctx.theme
+        parsed = _parse_template(
+            template, ctx.to_color(default_color), theme, theme._color_version
+        )
+        if args:
+            return _percent_format_parsed(parsed.percent_format_items, args, ctx)
+        else:
+            return parsed.string.copy()
+
     interpolations: list[tuple[int, _Interpolation]] = []
     if isinstance(template, _Template):
         if args:
@@ -1644,8 +1849,42 @@ def colorize(
     else:
         line = template
 
-    default_color = ctx.to_color(default_color)
+    res = _colorize(line, interpolations, ctx.to_color(default_color), ctx.theme, ctx)
+
+    if args:
+        return res.percent_format(args, ctx)
+    else:
+        return res
+
+
+# Longer strings are unlikely to be literals.
+_MAX_CACHED_TEMPLATE_LEN = 1024
+
 
+class _ParsedTemplate:
+    def __init__(self, string: ColorizedString):
+        self.string = string
+
+    @functools.cached_property
+    def percent_format_items(self) -> list[_PercentFormatItem]:
+        return _parse_percent_format(self.string)
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_template(
+    line: str, default_color: _Color, theme: yuio.theme.Theme, color_version: int, /
+) -> _ParsedTemplate:
+    # Parsing depends only on theme's colors, which are versioned by `color_version`.
+    return _ParsedTemplate(_colorize(line, [], default_color, theme, None))
+
+
+def _colorize(
+    line: str,
+    interpolations: list[tuple[int, _Interpolation]],
+    default_color: _Color,
+    theme: yuio.theme.Theme,
+    ctx: ReprContext | None,
+) -> ColorizedString:
     res = ColorizedString(default_color)
     stack = [default_color]
     last_pos = 0
@@ -1660,6 +1899,7 @@ def colorize(
             and start + len(s) >= interpolations[last_interp][0]
         ):
             interp_start, interp = interpolations[last_interp]
+            assert ctx is not None
             res.append_str(
                 s[
                     index : interp_start
@@ -1679,7 +1919,7 @@ def colorize(
         last_pos = tag.end()
 
         if name := tag.group("tag_open"):
-            color = stack[-1] | ctx.get_color(name)
+            color = stack[-1] | theme.get_color(name)
             res.append_color(color)
             stack.append(color)
         elif code := tag.group("code"):
@@ -1689,9 +1929,9 @@ def colorize(
                 code = code[1:-1]
                 code_pos += 1
             if __FLAG_RE.match(code) and not __NEG_NUM_RE.match(code):
-                res.append_color(stack[-1] | ctx.get_color("flag"))
+                res.append_color(stack[-1] | theme.get_color("flag"))
             else:
-                res.append_color(stack[-1] | ctx.get_color("code"))
+                res.append_color(stack[-1] | theme.get_color("code"))
             res.start_no_wrap()
             append_to_res(code, code_pos)
             res.end_no_wrap()
@@ -1704,10 +1944,7 @@ def colorize(
 
     append_to_res(line[last_pos:], last_pos)
 
-    if args:
-        return res.percent_format(args, ctx)
-    else:
-        return res
+    return res
 
 
 def strip_color_tags(s: str) -> str:
@@ -1815,6 +2052,7 @@ class _TextWrapper:
             self.continuation_indent += continuation_indent
 
         self.lines: list[ColorizedString] = []
+        self.prev_line_explicit_newline: bool = True
 
         self.current_line = ColorizedString()
         if self.indent:
@@ -1832,6 +2070,7 @@ class _TextWrapper:
     def _flush_line(self, explicit_newline=""):
         self.current_line._explicit_newline = explicit_newline
         self.lines.append(self.current_line)
+        self.prev_line_explicit_newline = bool(explicit_newline)
 
         next_line = ColorizedString()
 
@@ -1861,7 +2100,7 @@ class _TextWrapper:
             and self.current_line._parts[-1] == " "
         ):
             # Remove space that was added before no-wrap sequence.
-            self.current_line._parts.pop()
+            self.current_line._own_parts().pop()
         self._flush_line()
         self.current_line += tail
         self.current_line.append_color(tail.active_color)
@@ -1922,7 +2161,7 @@ class _TextWrapper:
             self.has_ellipsis = True
         elif not self.at_line_start:
             # Modify last word on this line, if there is any.
-            parts = self.current_line._parts
+            parts = self.current_line._own_parts()
             for i in range(len(parts) - 1, -1, -1):
                 part = parts[i]
                 if isinstance(part, str):
@@ -1960,6 +2199,9 @@ class _TextWrapper:
             self._append_word(word, word_width)
 
     def wrap(self, text: ColorizedString) -> list[ColorizedString]:
+        return list(self.iter_wrap(text))
+
+    def iter_wrap(self, text: ColorizedString) -> _t.Iterator[ColorizedString]:
         nowrap = False
 
         for part in text:
@@ -2030,6 +2272,12 @@ class _TextWrapper:
                 words = _WORDSEP_RE.split(part)
 
             for word in words:
+                if self.lines:
+                    # Hand out finished lines as soon as possible, so that we never
+                    # hold more than a few lines in memory.
+                    yield from self.lines
+                    self.lines.clear()
+
                 if not word:
                     # `_WORDSEP_RE` produces empty strings, skip them.
                     continue
@@ -2056,7 +2304,7 @@ class _TextWrapper:
                         # explicit newline, otherwise this is not an indent.
                         or (
                             self.at_line_start_or_indent
-                            and (not self.lines or self.lines[-1].explicit_newline)
+                            and self.prev_line_explicit_newline
                         )
                     ):
                         word = word.translate(_SPACE_TRANS)
@@ -2127,10 +2375,11 @@ class _TextWrapper:
                 else:
                     self._append_word(word, word_width)
 
-        if self.current_line or not self.lines or self.lines[-1].explicit_newline:
+        if self.current_line or self.prev_line_explicit_newline:
             self._flush_line()
 
-        return self.lines
+        yield from self.lines
+        self.lines.clear()
 
     def _try_fit_word(self, word: str, word_width: int):
         if (
@@ -2195,6 +2444,14 @@ class ReprContext:
     :param max_depth:
         maximum depth of nested containers, after which container's contents
         are not rendered. Default is ``5``.
+    :param max_items:
+        maximum number of items rendered for every container, after which
+        the rest of container's items are replaced with ``…(N more)``.
+        Default is ``1000``.
+    :param max_chars:
+        approximate limit on length of the rendered value. Once it is reached,
+        contents of all remaining containers are replaced with ``…(N more)``.
+        Default is ``100000``.
     :param width:
         maximum width of the content, used when wrapping text, rendering markdown,
         or rendering horizontal rulers. If not given, defaults
@@ -2213,6 +2470,8 @@ class ReprContext:
         highlighted: bool | None = None,
         max_depth: int | None = None,
         width: int | None = None,
+        max_items: int | None = None,
+        max_chars: int | None = None,
     ):
         self.term = term
         """
@@ -2251,16 +2510,34 @@ class ReprContext:
 
         """
 
+        self.max_items: int = max_items if max_items is not None else 1000
+        """
+        Maximum number of items rendered for every container.
+
+        """
+
+        self.max_chars: int = max_chars if max_chars is not None else 100_000
+        """
+        Approximate limit on length of a value rendered
+        with :meth:`~ReprContext.repr`.
+
+        """
+
         self._seen: set[int] = set()
         self._line = ColorizedString()
         self._indent = 0
         self._state = _ReprContextState.START
         self._pending_sep = None
 
+        self._base_color = theme.get_color("msg/text:code/repr")
+
+    @functools.cached_property
+    def _hl(self) -> yuio.hl.SyntaxHighlighter:
+        # Highlighter is only needed for `repr`, no need to import it
+        # for every message.
         import yuio.hl
 
-        self._hl, _ = yuio.hl.get_highlighter("repr")
-        self._base_color = theme.get_color("msg/text:code/repr")
+        return yuio.hl.get_highlighter("repr")[0]
 
     @staticmethod
     def make_dummy(is_unicode: bool = True) -> ReprContext:
@@ -2366,6 +2643,8 @@ class ReprContext:
         highlighted: bool | None = None,
         width: int | None = None,
         max_depth: int | None = None,
+        max_items: int | None = None,
+        max_chars: int | None = None,
     ) -> ColorizedString:
         """
         Convert value to colorized string using repr methods.
@@ -2380,6 +2659,10 @@ class ReprContext:
             if given, overrides settings passed to :class:`ReprContext` for this call.
         :param max_depth:
             if given, overrides settings passed to :class:`ReprContext` for this call.
+        :param max_items:
+            if given, overrides settings passed to :class:`ReprContext` for this call.
+        :param max_chars:
+            if given, overrides settings passed to :class:`ReprContext` for this call.
         :returns:
             a colorized string containing representation of the `value`.
         :raises:
@@ -2396,6 +2679,8 @@ class ReprContext:
             use_str=False,
             width=width,
             max_depth=max_depth,
+            max_items=max_items,
+            max_chars=max_chars,
         )
 
     def str(
@@ -2407,6 +2692,8 @@ class ReprContext:
         highlighted: bool | None = None,
         width: int | None = None,
         max_depth: int | None = None,
+        max_items: int | None = None,
+        max_chars: int | None = None,
     ) -> ColorizedString:
         """
         Convert value to colorized string.
@@ -2421,6 +2708,10 @@ class ReprContext:
             if given, overrides settings passed to :class:`ReprContext` for this call.
         :param max_depth:
             if given, overrides settings passed to :class:`ReprContext` for this call.
+        :param max_items:
+            if given, overrides settings passed to :class:`ReprContext` for this call.
+        :param max_chars:
+            if given, overrides settings passed to :class:`ReprContext` for this call.
         :returns:
             a colorized string containing string representation of the `value`.
         :raises:
@@ -2437,6 +2728,8 @@ class ReprContext:
             use_str=True,
             width=width,
             max_depth=max_depth,
+            max_items=max_items,
+            max_chars=max_chars,
         )
 
     def convert(
@@ -2450,6 +2743,8 @@ class ReprContext:
         highlighted: bool | None = None,
         width: int | None = None,
         max_depth: int | None = None,
+        max_items: int | None = None,
+        max_chars: int | None = None,
     ):
         """
         Perform string conversion, similar to :func:`string.templatelib.convert`,
@@ -2475,6 +2770,10 @@ class ReprContext:
             if given, overrides settings passed to :class:`ReprContext` for this call.
         :param max_depth:
             if given, overrides settings passed to :class:`ReprContext` for this call.
+        :param max_items:
+            if given, overrides settings passed to :class:`ReprContext` for this call.
+        :param max_chars:
+            if given, overrides settings passed to :class:`ReprContext` for this call.
         :returns:
             a colorized string containing string representation of the `value`.
         :raises:
@@ -2590,6 +2889,8 @@ class ReprContext:
                 highlighted=highlighted,
                 width=width,
                 max_depth=max_depth,
+                max_items=max_items,
+                max_chars=max_chars,
             )
         elif conversion == "a":
             res = ColorizedString()
@@ -2599,6 +2900,8 @@ class ReprContext:
                 highlighted=highlighted,
                 width=width,
                 max_depth=max_depth,
+                max_items=max_items,
+                max_chars=max_chars,
             ):
                 if isinstance(part, _UserString):
                     res += part._wrap(
@@ -2615,6 +2918,8 @@ class ReprContext:
                 highlighted=highlighted,
                 width=width,
                 max_depth=max_depth,
+                max_items=max_items,
+                max_chars=max_chars,
             )
         else:
             raise ValueError(
@@ -2660,6 +2965,8 @@ class ReprContext:
         highlighted: bool | None = None,
         width: int | None = None,
         max_depth: int | None = None,
+        max_items: int | None = None,
+        max_chars: int | None = None,
     ):
         """
         Temporarily replace settings of this context.
@@ -2672,6 +2979,10 @@ class ReprContext:
             if given, overrides settings passed to :class:`ReprContext` for this call.
         :param max_depth:
             if given, overrides settings passed to :class:`ReprContext` for this call.
+        :param max_items:
+            if given, overrides settings passed to :class:`ReprContext` for this call.
+        :param max_chars:
+            if given, overrides settings passed to :class:`ReprContext` for this call.
         :returns:
             a context manager that overrides settings.
 
@@ -2693,6 +3004,14 @@ class ReprContext:
             self.max_depth,
             (self.max_depth if max_depth is None else max_depth),
         )
+        old_max_items, self.max_items = (
+            self.max_items,
+            (self.max_items if max_items is None else max_items),
+        )
+        old_max_chars, self.max_chars = (
+            self.max_chars,
+            (self.max_chars if max_chars is None else max_chars),
+        )
 
         try:
             yield
@@ -2701,6 +3020,8 @@ class ReprContext:
             self.highlighted = old_highlighted
             self.width = old_width
             self.max_depth = old_max_depth
+            self.max_items = old_max_items
+            self.max_chars = old_max_chars
 
     def _print(
         self,
@@ -2709,6 +3030,8 @@ class ReprContext:
         highlighted: bool | None,
         width: int | None,
         max_depth: int | None,
+        max_items: int | None,
+        max_chars: int | None,
         use_str: bool,
     ) -> ColorizedString:
         old_line, self._line = self._line, ColorizedString()
@@ -2721,6 +3044,8 @@ class ReprContext:
                 highlighted=highlighted,
                 width=width,
                 max_depth=max_depth,
+                max_items=max_items,
+                max_chars=max_chars,
             ):
                 self._print_nested(value, use_str)
             return self._line
@@ -2815,7 +3140,10 @@ class ReprContext:
             self._push_token("...", "more")
         else:
             self._start_container()
-            for item in items:
+            for i, item in enumerate(items):
+                if self._is_over_budget(i):
+                    self._print_more(items, i)
+                    break
                 self._print_nested(item)
                 self._terminate_item()
             self._end_container()
@@ -2829,7 +3157,10 @@ class ReprContext:
             self._push_token("...", "more")
         else:
             self._start_container()
-            for key, value in items:
+            for i, (key, value) in enumerate(items):
+                if self._is_over_budget(i):
+                    self._print_more(items, i)
+                    break
                 self._print_nested(key)
                 self._push_token(": ", "punct")
                 self._print_nested(value)
@@ -2837,6 +3168,20 @@ class ReprContext:
             self._end_container()
         self._push_token(cbrace, "punct")
 
+    def _is_over_budget(self, n_printed_items: int) -> bool:
+        return n_printed_items >= self.max_items or self._line.len >= self.max_chars
+
+    def _print_more(self, items, n_printed_items: int):
+        ellipsis = "…" if self.term.is_unicode else "..."
+        try:
+            n_more = len(items) - n_printed_items
+        except TypeError:  # pragma: no cover
+            # Not a sized collection.
+            self._push_token(ellipsis, "more")
+        else:
+            self._push_token(f"{ellipsis}({n_more} more)", "more")
+        self._terminate_item()
+
     def _print_defaultdict(self, value: collections.defaultdict[_t.Any, _t.Any]):
         self._push_token("defaultdict", "type")
         self._push_token("(", "punct")
@@ -3828,6 +4173,15 @@ class Wrap(_StrBase):
         yield "break_long_nowrap_words", self._break_long_nowrap_words, False
 
     def __colorized_str__(self, ctx: ReprContext) -> ColorizedString:
+        res = ColorizedString()
+        res.extend(self._iter_parts(ctx))
+        return res
+
+    def _iter_parts(
+        self, ctx: ReprContext
+    ) -> _t.Iterator[str | ColorizedString | NoWrapMarker]:
+        # Yields wrapped lines one by one, separated by newlines. Concatenating
+        # everything gives the result of `__colorized_str__`.
         if isinstance(self._indent, int):
             indent = ColorizedString(" " * self._indent)
         else:
@@ -3847,10 +4201,9 @@ class Wrap(_StrBase):
         if overflow is True:
             overflow = ctx.get_msg_decoration("overflow")
 
-        res = ColorizedString()
-        res.start_no_wrap()
+        yield NO_WRAP_START
         sep = False
-        for line in ctx.str(self._msg, width=inner_width).wrap(
+        for line in ctx.str(self._msg, width=inner_width).iter_wrap(
             width,
             preserve_spaces=self._preserve_spaces,
             preserve_newlines=self._preserve_newlines,
@@ -3861,12 +4214,10 @@ class Wrap(_StrBase):
             continuation_indent=continuation_indent,
         ):
             if sep:
-                res.append_str("\n")
-            res.append_colorized_str(line)
+                yield "\n"
+            yield line
             sep = True
-        res.end_no_wrap()
-
-        return res
+        yield NO_WRAP_END
 
 
 @_t.final
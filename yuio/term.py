@@ -1030,6 +1030,13 @@ elif os.name == "nt":
     ]
     _ReadConsoleW.restype = ctypes.wintypes.BOOL
 
+    _WaitForSingleObject = ctypes.windll.kernel32.WaitForSingleObject
+    _WaitForSingleObject.argtypes = [ctypes.wintypes.HANDLE, ctypes.wintypes.DWORD]
+    _WaitForSingleObject.restype = ctypes.wintypes.DWORD
+
+    _WAIT_TIMEOUT = 0x00000102
+    _WAIT_FAILED = 0xFFFFFFFF
+
     _ENABLE_PROCESSED_OUTPUT = 0x0001
     _ENABLE_WRAP_AT_EOL_OUTPUT = 0x0002
     _ENABLE_VIRTUAL_TERMINAL_PROCESSING = 0x0004
@@ -1077,6 +1084,13 @@ elif os.name == "nt":
     ) -> str:
         assert _ISTREAM_HANDLE is not None
 
+        if timeout:
+            res = _WaitForSingleObject(_ISTREAM_HANDLE, int(timeout * 1000))
+            if res == _WAIT_TIMEOUT:
+                raise TimeoutError()
+            elif res == _WAIT_FAILED:
+                raise ctypes.WinError()
+
         CHAR16 = ctypes.wintypes.WCHAR * 16
 
         n_read = ctypes.wintypes.DWORD()
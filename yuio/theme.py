@@ -518,12 +518,14 @@ import dataclasses
 import functools
 import os
 import pathlib
+import threading
 import warnings
 from dataclasses import dataclass
 from enum import IntFlag
 
 import yuio.color
 import yuio.term
+import yuio.util
 
 from typing import TYPE_CHECKING
 
@@ -554,6 +556,25 @@ class RecursiveThemeWarning(ThemeWarning):
     pass
 
 
+# Guards lazy resolution of theme colors.
+_COLOR_LOCK = threading.RLock()
+
+
+def _reinit_color_lock():
+    # Colors can be precompiled in a background thread. We don't want a forked
+    # process to inherit a locked lock, or a half-resolved color cache.
+    global _COLOR_LOCK
+    _COLOR_LOCK = threading.RLock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(
+        before=lambda: _COLOR_LOCK.acquire(),
+        after_in_parent=lambda: _COLOR_LOCK.release(),
+        after_in_child=_reinit_color_lock,
+    )
+
+
 _COLOR_NAMES = [
     "background",
     "foreground",
@@ -891,6 +912,15 @@ class Theme(metaclass=_ThemeMeta):
     def __init__(self):
         self.__color_cache: dict[str, yuio.color.Color | None] = {}
 
+        # Fully resolved colors, including multi-path combinations. This table
+        # is only added to, and it is replaced with a new one when colors change,
+        # so reading from it doesn't require a lock.
+        self.__color_table: dict[str, yuio.color.Color] = {}
+
+        # Incremented every time colors change. Allows other modules to cache
+        # resolved colors.
+        self._color_version = 0
+
     def _set_msg_decoration_unicode_if_not_overridden(
         self,
         name: str,
@@ -1000,13 +1030,16 @@ class Theme(metaclass=_ThemeMeta):
         """
 
         proxy = _t.cast(_ImmutableDict[str, str | yuio.color.Color], self.colors)
-        proxy._set_if_not_overridden(
-            path,
-            color,
-            self.__expected_source,
-        )
-        self.__color_cache.clear()
-        self.__dict__.pop("_Theme__color_tree", None)  # type: ignore
+        with _COLOR_LOCK:
+            proxy._set_if_not_overridden(
+                path,
+                color,
+                self.__expected_source,
+            )
+            self.__color_cache.clear()
+            self.__color_table = {}
+            self.__dict__.pop("_Theme__color_tree", None)  # type: ignore
+            self._color_version += 1
 
     def set_color(
         self,
@@ -1020,13 +1053,16 @@ class Theme(metaclass=_ThemeMeta):
         """
 
         proxy = _t.cast(_ImmutableDict[str, str | yuio.color.Color], self.colors)
-        proxy._set(
-            path,
-            color,
-            self.__expected_source or type(self),
-        )
-        self.__color_cache.clear()
-        self.__dict__.pop("_Theme__color_tree", None)  # type: ignore
+        with _COLOR_LOCK:
+            proxy._set(
+                path,
+                color,
+                self.__expected_source or type(self),
+            )
+            self.__color_cache.clear()
+            self.__color_table = {}
+            self.__dict__.pop("_Theme__color_tree", None)  # type: ignore
+            self._color_version += 1
 
     @dataclass(kw_only=True, slots=True)
     class __ColorTree:
@@ -1091,11 +1127,43 @@ class Theme(metaclass=_ThemeMeta):
 
         """
 
-        color = yuio.color.Color.NONE
-        for path in paths.split():
-            color |= self.__get_color(path)
+        try:
+            return self.__color_table[paths]
+        except KeyError:
+            pass
+
+        with _COLOR_LOCK:
+            color = yuio.color.Color.NONE
+            for path in paths.split():
+                color |= self.__get_color(path)
+            self.__color_table[paths] = color
         return color
 
+    def _precompile_colors(self):
+        """
+        Resolve all paths from :attr:`~Theme.colors`, as well as combinations
+        of paths used in its values, so that looking them up is a single
+        dict access.
+
+        This method is called from a background thread when theme is passed
+        to :func:`yuio.io.setup`. It doesn't block other lookups for long,
+        the lock is only held while resolving a single path. If theme's colors
+        change while it runs, it stops early.
+
+        """
+
+        with _COLOR_LOCK:
+            version = self._color_version
+            items = list(self.colors.items())
+
+        for path, colors in items:
+            if self._color_version != version:
+                # Colors were changed, no point in precompiling stale paths.
+                return
+            self.get_color(path)
+            if isinstance(colors, str):
+                self.get_color(colors)
+
     def __get_color(self, path: str, /) -> yuio.color.Color:
         res: yuio.color.Color | None | yuio.Missing = self.__color_cache.get(
             path, yuio.MISSING
@@ -1189,6 +1257,10 @@ class Theme(metaclass=_ThemeMeta):
             if not v:
                 warnings.warn(f"color value for path {k!r} is empty", ThemeWarning)
 
+        # Drop cached colors, otherwise we won't see warnings for them.
+        self.__color_cache.clear()
+        self.__color_table = {}
+
         err_path = None
         with warnings.catch_warnings():
             warnings.simplefilter("error", category=RecursiveThemeWarning)
@@ -1201,6 +1273,7 @@ class Theme(metaclass=_ThemeMeta):
             return
 
         self.__color_cache.clear()
+        self.__color_table = {}
         recursive_path = []
         get_color_inner = self.__get_color
 
@@ -1774,6 +1847,77 @@ def load(
     if not (path := os.environ.get("YUIO_THEME_PATH")):
         return theme_ctor(term)
 
+    theme_data = _load_theme_data_cached(pathlib.Path(path))
+
+    theme = theme_ctor(term)
+
+    if (progress_bar_width := theme_data.get("progress_bar_width")) is not None:
+        theme.progress_bar_width = progress_bar_width
+    if (spinner_update_rate_ms := theme_data.get("spinner_update_rate_ms")) is not None:
+        theme.spinner_update_rate_ms = spinner_update_rate_ms
+    if (separate_headings := theme_data.get("separate_headings")) is not None:
+        theme.separate_headings = separate_headings
+    if (fallback_width := theme_data.get("fallback_width")) is not None:
+        theme.fallback_width = fallback_width
+
+    for k, v in theme_data.get("msg_decorations_ascii", {}).items():
+        theme.set_msg_decoration_ascii(k, v)
+    for k, v in theme_data.get("msg_decorations_unicode", {}).items():
+        theme.set_msg_decoration_unicode(k, v)
+    for k, v in theme_data.get("colors", {}).items():
+        theme.set_color(k, v)
+
+    return theme
+
+
+_THEME_CACHE_VERSION = 1
+
+
+def _load_theme_data_cached(path: pathlib.Path) -> dict[str, _t.Any]:
+    # Loading theme files requires config machinery, which is slow to import
+    # and to run. Instead, we cache merged theme data, and invalidate the cache
+    # when any of the loaded files change.
+
+    import json
+
+    # Set `YUIO_THEME_CACHE=0` to always load theme files from scratch.
+    cache_path = None
+    if os.environ.get("YUIO_THEME_CACHE", "1") != "0":
+        cache_path = yuio.util._cache_path("themes", path)
+        try:
+            cached = json.loads(cache_path.read_text(encoding="utf-8"))
+            if cached["version"] == _THEME_CACHE_VERSION and all(
+                yuio.util._stat_key(file[0]) == file for file in cached["files"]
+            ):
+                return cached["data"]
+        except (OSError, ValueError, KeyError, TypeError, IndexError):
+            pass
+
+    theme_data, files, ok = _load_theme_data(path)
+
+    if cache_path is not None and ok:
+        # Only cache themes that loaded without errors, otherwise
+        # we'll silence the warnings on the next run.
+        try:
+            files_keys = [yuio.util._stat_key(file) for file in files]
+        except OSError:
+            pass
+        else:
+            yuio.util._write_cache(
+                cache_path,
+                {
+                    "version": _THEME_CACHE_VERSION,
+                    "files": files_keys,
+                    "data": theme_data,
+                },
+            )
+
+    return theme_data
+
+
+def _load_theme_data(
+    path: pathlib.Path,
+) -> tuple[dict[str, _t.Any], list[pathlib.Path], bool]:
     import yuio.config
     import yuio.parse
 
@@ -1797,23 +1941,30 @@ def load(
         )
 
     seen = set()
-    stack = [pathlib.Path(path)]
+    stack = [path]
+    loaded_files = []
     loaded_partials = []
+    ok = True
     while stack:
         path = stack.pop()
         if path in seen:
             continue
+        seen.add(path)
         if not path.exists():
             warnings.warn(f"theme file {path} does not exist", ThemeWarning)
+            ok = False
             continue
         if not path.is_file():
             warnings.warn(f"theme file {path} is not a file", ThemeWarning)
+            ok = False
             continue
         try:
             loaded = ThemeData.load_from_json_file(path, ignore_unknown_fields=True)
         except yuio.parse.ParsingError as e:
             warnings.warn(str(e), ThemeWarning)
+            ok = False
             continue
+        loaded_files.append(path)
         loaded_partials.append(loaded)
         include = loaded.include
         if isinstance(include, str):
@@ -1825,25 +1976,19 @@ def load(
     for partial in reversed(loaded_partials):
         theme_data.update(partial)
 
-    theme = theme_ctor(term)
-
-    if theme_data.progress_bar_width is not None:
-        theme.progress_bar_width = theme_data.progress_bar_width
-    if theme_data.spinner_update_rate_ms is not None:
-        theme.spinner_update_rate_ms = theme_data.spinner_update_rate_ms
-    if theme_data.separate_headings is not None:
-        theme.separate_headings = theme_data.separate_headings
-    if theme_data.fallback_width is not None:
-        theme.fallback_width = theme_data.fallback_width
-
-    for k, v in theme_data.msg_decorations_ascii.items():
-        theme.set_msg_decoration_ascii(k, v)
-    for k, v in theme_data.msg_decorations_unicode.items():
-        theme.set_msg_decoration_unicode(k, v)
-    for k, v in theme_data.colors.items():
-        theme.set_color(k, v)
-
-    return theme
+    return (
+        {
+            "progress_bar_width": theme_data.progress_bar_width,
+            "spinner_update_rate_ms": theme_data.spinner_update_rate_ms,
+            "separate_headings": theme_data.separate_headings,
+            "fallback_width": theme_data.fallback_width,
+            "msg_decorations_unicode": dict(theme_data.msg_decorations_unicode),
+            "msg_decorations_ascii": dict(theme_data.msg_decorations_ascii),
+            "colors": dict(theme_data.colors),
+        },
+        loaded_files,
+        ok,
+    )
 
 
 class TableJunction(IntFlag):
@@ -29,6 +29,8 @@
 from __future__ import annotations
 
 import io as _io
+import os as _os
+import pathlib as _pathlib
 import re as _re
 import textwrap as _textwrap
 import weakref
@@ -148,6 +150,9 @@ def find_docs(obj: _t.Any, /) -> dict[str, str]:
     for variables in its body. Doesn't inspect ``__init__``, doesn't return documentation
     for class methods.
 
+    Each source file is parsed once, and results are cached in user's cache
+    directory. Set ``YUIO_DOCS_CACHE=0`` to disable the on-disk cache.
+
     """
 
     # Based on code from Sphinx, two clause BSD license.
@@ -160,10 +165,6 @@ def find_docs(obj: _t.Any, /) -> dict[str, str]:
     except TypeError:
         return {}
 
-    import ast
-    import inspect
-    import itertools
-
     if (qualname := getattr(obj, "__qualname__", None)) is None:
         # Not a known object.
         _DOCS_CACHE[obj] = {}
@@ -174,19 +175,152 @@ def find_docs(obj: _t.Any, /) -> dict[str, str]:
         _DOCS_CACHE[obj] = {}
         return {}
 
+    import inspect
+
     try:
-        sourcelines, _ = inspect.getsourcelines(obj)
+        filename = inspect.getsourcefile(inspect.unwrap(obj))
     except TypeError:
         _DOCS_CACHE[obj] = {}
         return {}
 
-    docs: dict[str, str] = {}
+    # Parsing source of every object separately is slow because `inspect` has to
+    # parse the whole module to find a class. Instead, we parse each module once
+    # and collect docs for all of its top-level classes and functions.
+    module_docs = _find_module_docs(filename) if filename else None
+    if (
+        module_docs is not None
+        and (found := module_docs.get(qualname)) is not None
+        and found[0] == isinstance(obj, type)
+    ):
+        docs = found[1]
+    else:
+        # Fall back to inspecting this object's source.
+        docs = _find_object_docs(obj)
+
+    _DOCS_CACHE[obj] = docs
+    return docs
+
+
+def _find_object_docs(obj: _t.Any) -> dict[str, str]:
+    import ast
+    import inspect
+
+    try:
+        sourcelines, _ = inspect.getsourcelines(obj)
+    except TypeError:
+        return {}
 
     node = ast.parse(_textwrap.dedent("".join(sourcelines)))
     assert isinstance(node, ast.Module)
     assert len(node.body) == 1
     cdef = node.body[0]
 
+    if isinstance(cdef, (ast.ClassDef, ast.FunctionDef)):
+        return _find_def_docs(cdef, sourcelines)
+    else:  # pragma: no cover
+        return {}
+
+
+_MODULE_DOCS_CACHE_VERSION = 1
+_MODULE_DOCS_CACHE: dict[str, dict[str, tuple[bool, dict[str, str]] | None] | None] = {}
+
+
+def _find_module_docs(
+    filename: str,
+) -> dict[str, tuple[bool, dict[str, str]] | None] | None:
+    # Returns mapping from qualnames of top-level classes and functions (and classes
+    # and functions nested in classes) to a tuple `(is_class, docs)`. Qualnames that
+    # are defined more than once map to `None`, we can't tell which one is needed.
+
+    try:
+        return _MODULE_DOCS_CACHE[filename]
+    except KeyError:
+        pass
+
+    import json
+
+    try:
+        stat_key = _stat_key(filename)
+    except OSError:
+        _MODULE_DOCS_CACHE[filename] = None
+        return None
+
+    # Set `YUIO_DOCS_CACHE=0` to always parse sources from scratch.
+    cache_path = None
+    if _os.environ.get("YUIO_DOCS_CACHE", "1") != "0":
+        cache_path = _cache_path("docs", filename)
+        try:
+            cached = json.loads(cache_path.read_text(encoding="utf-8"))
+            if (
+                cached["version"] == _MODULE_DOCS_CACHE_VERSION
+                and cached["file"] == stat_key
+            ):
+                module_docs = {
+                    qualname: (found[0], found[1]) if found is not None else None
+                    for qualname, found in cached["docs"].items()
+                }
+                _MODULE_DOCS_CACHE[filename] = module_docs
+                return module_docs
+        except (OSError, ValueError, KeyError, TypeError, IndexError):
+            pass
+
+    import ast
+    import linecache
+
+    linecache.checkcache(filename)
+    sourcelines = linecache.getlines(filename)
+    try:
+        node = ast.parse("".join(sourcelines))
+    except (SyntaxError, ValueError):
+        _MODULE_DOCS_CACHE[filename] = None
+        return None
+
+    module_docs: dict[str, tuple[bool, dict[str, str]] | None] = {}
+    stack: list[tuple[str, ast.stmt]] = [("", stmt) for stmt in reversed(node.body)]
+    while stack:
+        prefix, stmt = stack.pop()
+        if isinstance(stmt, (ast.ClassDef, ast.FunctionDef)):
+            qualname = prefix + stmt.name
+            if qualname in module_docs:
+                module_docs[qualname] = None
+            else:
+                module_docs[qualname] = (
+                    isinstance(stmt, ast.ClassDef),
+                    _find_def_docs(stmt, sourcelines),
+                )
+            if isinstance(stmt, ast.ClassDef):
+                stack.extend((qualname + ".", child) for child in reversed(stmt.body))
+        elif isinstance(stmt, ast.AsyncFunctionDef):
+            qualname = prefix + stmt.name
+            module_docs[qualname] = None
+        elif isinstance(stmt, (ast.If, ast.Try, ast.With)):
+            # Definitions in these blocks don't get a separate qualname.
+            children = [*stmt.body, *getattr(stmt, "orelse", [])]
+            for handler in getattr(stmt, "handlers", []):
+                children.extend(handler.body)
+            children.extend(getattr(stmt, "finalbody", []))
+            stack.extend((prefix, child) for child in reversed(children))
+
+    if cache_path is not None:
+        _write_cache(
+            cache_path,
+            {
+                "version": _MODULE_DOCS_CACHE_VERSION,
+                "file": stat_key,
+                "docs": module_docs,
+            },
+        )
+
+    _MODULE_DOCS_CACHE[filename] = module_docs
+    return module_docs
+
+
+def _find_def_docs(cdef: _t.Any, sourcelines: list[str]) -> dict[str, str]:
+    import ast
+    import itertools
+
+    docs: dict[str, str] = {}
+
     if isinstance(cdef, ast.ClassDef):
         fields: list[tuple[int, str]] = []
         last_field: str | None = None
@@ -208,7 +342,8 @@ def find_docs(obj: _t.Any, /) -> dict[str, str]:
             if isinstance(target, ast.Name) and not target.id.startswith("_"):
                 fields.append((stmt.lineno, target.id))
                 last_field = target.id
-    elif isinstance(cdef, ast.FunctionDef):
+    else:
+        assert isinstance(cdef, ast.FunctionDef)
         fields = [
             (field.lineno, field.arg)
             for field in itertools.chain(
@@ -218,9 +353,6 @@ def find_docs(obj: _t.Any, /) -> dict[str, str]:
                 cdef.args.kwonlyargs,
             )
         ]
-    else:  # pragma: no cover
-        _DOCS_CACHE[obj] = {}
-        return {}
 
     for pos, name in fields:
         if name in docs:
@@ -236,10 +368,48 @@ def find_docs(obj: _t.Any, /) -> dict[str, str]:
         if comment_lines:
             docs[name] = dedent("\n".join(reversed(comment_lines))).removesuffix("\n")
 
-    _DOCS_CACHE[obj] = docs
     return docs
 
 
+def _cache_path(namespace: str, path: str | _os.PathLike[str], /) -> _pathlib.Path:
+    # Returns path to a JSON file in user's cache directory
+    # where data derived from the given file can be stored.
+
+    import hashlib
+
+    if _os.name == "nt":
+        cache_home = _pathlib.Path(
+            _os.environ.get("LOCALAPPDATA") or (_pathlib.Path.home() / "AppData/Local")
+        )
+    else:
+        cache_home = _pathlib.Path(
+            _os.environ.get("XDG_CACHE_HOME") or (_pathlib.Path.home() / ".cache")
+        )
+
+    key = hashlib.sha256(_os.fsencode(_os.path.abspath(path))).hexdigest()[:32]
+    return cache_home / "yuio" / namespace / f"{key}.json"
+
+
+def _stat_key(path: str | _os.PathLike[str], /) -> list[_t.Any]:
+    # Used to check that a cached file didn't change.
+    stat = _os.stat(path)
+    return [_os.fspath(path), stat.st_mtime_ns, stat.st_size]
+
+
+def _write_cache(cache_path: _pathlib.Path, data: _t.Any, /):
+    # Write a cache file atomically, ignoring any errors.
+
+    import json
+
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{_os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(data), encoding="utf-8")
+        _os.replace(tmp_path, cache_path)
+    except (OSError, TypeError, ValueError):
+        pass
+
+
 def commonprefix(m: _t.Collection[str]) -> str:
     if not m:
         return ""
@@ -140,11 +140,11 @@ import math
 import re
 import string
 import sys
+import threading
 import time
 from dataclasses import dataclass
 
 import yuio.color
-import yuio.complete
 import yuio.string
 import yuio.term
 from yuio.color import Color as _Color
@@ -159,6 +159,8 @@ import typing
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    import yuio.complete
+
     import typing_extensions as _t
 else:
     from yuio import _typing as _t
@@ -535,10 +537,19 @@ class RenderContext:
         self._final_y: int = 0
         self._lines: list[list[str]] = []
         self._colors: list[list[str]] = []
+        self._urls: list[list[str]] = []
         self._prev_lines: list[list[str]] = []
         self._prev_colors: list[list[str]] = []
         self._prev_urls: list[list[str]] = []
 
+        # Rows that weren't written to are not allocated. Instead, they all share
+        # these blank rows, which are never modified. Row is copied on first write
+        # (see `_get_row`), and `render` skips rows that are the same object
+        # or equal to their counterparts from the previous frame.
+        self._blank_line: list[str] = []
+        self._blank_colors: list[str] = []
+        self._blank_urls: list[str] = []
+
         # Rendering status
         self._full_redraw: bool = False
         self._term_x: int = 0
@@ -551,14 +562,17 @@ class RenderContext:
         self._normal_buffer_term_x: int = 0
         self._normal_buffer_term_y: int = 0
         self._spinner_state: int = 0
+        self._spinner_state_used: bool = False
 
         # Helpers
         self._none_color: str = _Color.NONE.as_code(term.color_support)
 
-        # Used for tests and debug
+        # Used for metrics, tests and debug
         self._renders: int = 0
         self._bytes_rendered: int = 0
         self._total_bytes_rendered: int = 0
+        self._rows_skipped: int = 0
+        self._total_rows_skipped: int = 0
 
     @property
     def term(self) -> _Term:
@@ -586,6 +600,9 @@ class RenderContext:
 
         """
 
+        # Lets the caller know that this frame will need
+        # to be re-rendered when spinner ticks.
+        self._spinner_state_used = True
         return self._spinner_state
 
     @contextlib.contextmanager
@@ -918,9 +935,7 @@ class RenderContext:
                     self._frame_cursor_color = s.as_code(self._term.color_support)
             return
 
-        ll = self._lines[y]
-        cc = self._colors[y]
-        uu = self._urls[y]
+        ll, cc, uu = self._get_row(y)
 
         url = ""
 
@@ -1196,6 +1211,7 @@ class RenderContext:
         now_us = start_ns // 1000
         now_us -= now_us % self._update_rate_us
         self._spinner_state = now_us // self.theme.spinner_update_rate_ms // 1000
+        self._spinner_state_used = False
 
     def clear_screen(self):
         """
@@ -1210,13 +1226,26 @@ class RenderContext:
     def _make_empty_canvas(
         self,
     ) -> tuple[list[list[str]], list[list[str]], list[list[str]]]:
-        lines = [l[:] for l in [[" "] * self._width] * self._height]
-        colors = [
-            c[:] for c in [[self._frame_cursor_color] * self._width] * self._height
-        ]
-        urls = [l[:] for l in [[""] * self._width] * self._height]
+        if len(self._blank_line) != self._width:
+            self._blank_line = [" "] * self._width
+            self._blank_colors = [self._none_color] * self._width
+            self._blank_urls = [""] * self._width
+        lines = [self._blank_line] * self._height
+        colors = [self._blank_colors] * self._height
+        urls = [self._blank_urls] * self._height
         return lines, colors, urls
 
+    def _get_row(self, y: int, /) -> tuple[list[str], list[str], list[str]]:
+        ll = self._lines[y]
+        if ll is self._blank_line:
+            ll = self._lines[y] = ll.copy()
+            cc = self._colors[y] = self._blank_colors.copy()
+            uu = self._urls[y] = self._blank_urls.copy()
+        else:
+            cc = self._colors[y]
+            uu = self._urls[y]
+        return ll, cc, uu
+
     def render(self):
         """
         Render current canvas onto the terminal.
@@ -1237,19 +1266,31 @@ class RenderContext:
             self._out.append("\x1b[J")
 
         term_url = ""
+        rows_skipped = 0
 
         for y in range(self._height):
             line = self._lines[y]
+            colors = self._colors[y]
+            urls = self._urls[y]
+            prev_line = self._prev_lines[y]
+            prev_colors = self._prev_colors[y]
+            prev_urls = self._prev_urls[y]
+
+            if line is prev_line or (
+                line == prev_line and colors == prev_colors and urls == prev_urls
+            ):
+                # Fast track: row didn't change, nothing to redraw.
+                rows_skipped += 1
+                continue
 
             for x in range(self._width):
-                prev_color = self._prev_colors[y][x]
-                color = self._colors[y][x]
-                url = self._urls[y][x]
+                color = colors[x]
+                url = urls[x]
 
                 if (
-                    color != prev_color
-                    or line[x] != self._prev_lines[y][x]
-                    or url != self._prev_urls[y][x]
+                    color != prev_colors[x]
+                    or line[x] != prev_line[x]
+                    or url != prev_urls[x]
                 ):
                     self._move_term_cursor(x, y)
 
@@ -1278,12 +1319,19 @@ class RenderContext:
         self._term.ostream.flush()
         self._out.clear()
 
+        self._renders += 1
+        self._bytes_rendered = (
+            len(rendered)
+            if rendered.isascii()
+            else len(rendered.encode(errors="replace"))
+        )
+
         if yuio._debug:
-            self._renders += 1
-            self._bytes_rendered = len(rendered.encode())
             self._total_bytes_rendered += self._bytes_rendered
+            self._rows_skipped = rows_skipped
+            self._total_rows_skipped += rows_skipped
 
-            debug_msg = f"n={self._renders:>04},r={self._bytes_rendered:>04},t={self._total_bytes_rendered:>04}"
+            debug_msg = f"n={self._renders:>04},r={self._bytes_rendered:>04},t={self._total_bytes_rendered:>04},s={self._rows_skipped:>02}"
             term_x, term_y = self._term_x, self._term_y
             self._move_term_cursor(self._width - len(debug_msg), 0)
             color = yuio.color.Color.STYLE_INVERSE | yuio.color.Color.FORE_CYAN
@@ -1307,9 +1355,11 @@ class RenderContext:
         self._move_term_cursor(0, 0)
         self._out.append("\x1b[J")
         self._out.append(self._none_color)
-        self._term.ostream.write("".join(self._out))
+        rendered = "".join(self._out)
+        self._term.ostream.write(rendered)
         self._term.ostream.flush()
         self._out.clear()
+        self._bytes_rendered = len(rendered)
         self._term_color = self._none_color
 
     def _move_term_cursor(self, x: int, y: int):
@@ -1368,7 +1418,8 @@ class Widget(abc.ABC, _t.Generic[T_co]):
     """
     Base class for all interactive console elements.
 
-    Widgets are displayed with their :meth:`~Widget.run` method.
+    Widgets are displayed with their :meth:`~Widget.run` method,
+    or :meth:`~Widget.run_async` in :mod:`asyncio` applications.
     They always go through the same event loop:
 
     .. raw:: html
@@ -1503,55 +1554,101 @@ class Widget(abc.ABC, _t.Generic[T_co]):
 
             try:
                 while True:
-                    rc.prepare(alternative_buffer=self.__in_help_menu)
-
-                    height = rc.height
-                    if self.__in_help_menu:
-                        min_h, max_h = self.__help_menu_layout(rc)
-                        inline_help_height = 0
-                    else:
-                        with rc.frame(0, 0):
-                            inline_help_height = self.__help_menu_layout_inline(rc)[0]
-                        if height > inline_help_height:
-                            height -= inline_help_height
-                        with rc.frame(0, 0, height=height):
-                            min_h, max_h = self.layout(rc)
-                        max_h = max(min_h, min(max_h, height))
-                    rc.set_final_pos(0, max_h + inline_help_height)
-                    if self.__in_help_menu:
-                        self.__help_menu_draw(rc)
-                    else:
-                        with rc.frame(0, 0, height=max_h):
-                            self.draw(rc)
-                        if max_h < rc.height:
-                            with rc.frame(0, max_h, height=rc.height - max_h):
-                                self.__help_menu_draw_inline(rc)
-
-                    if self.__bell:
-                        rc.bell()
-                        self.__bell = False
-                    rc.render()
+                    self.__render_frame(rc)
 
                     try:
                         event = next(events)
                     except StopIteration:
                         assert False, "_event_stream supposed to be infinite"
 
-                    if event == KeyboardEvent("c", ctrl=True):
-                        raise KeyboardInterrupt()
-                    elif event == KeyboardEvent("l", ctrl=True):
-                        rc.clear_screen()
-                    elif event == KeyboardEvent(Key.F1) and not self.__in_help_menu:
-                        self.__in_help_menu = True
-                        self.__help_menu_line = 0
-                        self.__last_help_data = None
-                    elif self.__in_help_menu:
-                        self.__help_menu_event(event)
-                    elif result := self.event(event):
+                    if result := self.__process_event(rc, event):
                         return result.value
             finally:
                 rc.finalize()
 
+    @_t.final
+    async def run_async(self, term: _Term, theme: _Theme, /) -> T_co:
+        """
+        Read user input and run the widget without blocking the running
+        :mod:`asyncio` event loop.
+
+        User input is read using event loop's reader callbacks. If event loop
+        doesn't support them (i.e. Windows proactor loop), input is read
+        in a worker thread.
+
+        """
+
+        if not term.can_run_widgets:
+            raise RuntimeError("terminal doesn't support rendering widgets")
+
+        with yuio.term._enter_raw_mode(
+            term.ostream, term.istream, bracketed_paste=True, modify_keyboard=True
+        ):
+            rc = RenderContext(term, theme)
+
+            events = _async_event_stream(term.ostream, term.istream)
+
+            try:
+                while True:
+                    self.__render_frame(rc)
+
+                    try:
+                        event = await events.__anext__()
+                    except StopAsyncIteration:
+                        assert False, "_event_stream supposed to be infinite"
+
+                    if result := self.__process_event(rc, event):
+                        return result.value
+            finally:
+                await events.aclose()
+                rc.finalize()
+
+    def __render_frame(self, rc: RenderContext):
+        rc.prepare(alternative_buffer=self.__in_help_menu)
+
+        height = rc.height
+        if self.__in_help_menu:
+            min_h, max_h = self.__help_menu_layout(rc)
+            inline_help_height = 0
+        else:
+            with rc.frame(0, 0):
+                inline_help_height = self.__help_menu_layout_inline(rc)[0]
+            if height > inline_help_height:
+                height -= inline_help_height
+            with rc.frame(0, 0, height=height):
+                min_h, max_h = self.layout(rc)
+            max_h = max(min_h, min(max_h, height))
+        rc.set_final_pos(0, max_h + inline_help_height)
+        if self.__in_help_menu:
+            self.__help_menu_draw(rc)
+        else:
+            with rc.frame(0, 0, height=max_h):
+                self.draw(rc)
+            if max_h < rc.height:
+                with rc.frame(0, max_h, height=rc.height - max_h):
+                    self.__help_menu_draw_inline(rc)
+
+        if self.__bell:
+            rc.bell()
+            self.__bell = False
+        rc.render()
+
+    def __process_event(
+        self, rc: RenderContext, event: KeyboardEvent
+    ) -> Result[T_co] | None:
+        if event == KeyboardEvent("c", ctrl=True):
+            raise KeyboardInterrupt()
+        elif event == KeyboardEvent("l", ctrl=True):
+            rc.clear_screen()
+        elif event == KeyboardEvent(Key.F1) and not self.__in_help_menu:
+            self.__in_help_menu = True
+            self.__help_menu_line = 0
+            self.__last_help_data = None
+        elif self.__in_help_menu:
+            self.__help_menu_event(event)
+        else:
+            return self.event(event)
+
     def _bell(self):
         self.__bell = True
 
@@ -4253,7 +4350,7 @@ class InputWithCompletion(Widget[str]):
         self.__completer = completer
 
         self.__input = Input(placeholder=placeholder, decoration_path=decoration_path)
-        self.__grid = Grid[yuio.complete.Completion](
+        self.__grid: Grid[yuio.complete.Completion] = Grid(
             [], active_item_decoration_path=active_item_decoration_path, min_rows=None
         )
         self.__grid_active = False
@@ -4941,6 +5038,10 @@ class Task(Widget[_t.Never]):
         return self._format_task(ctx)
 
 
+# How often a worker thread checks that reading input was cancelled.
+_INPUT_POLL_TIMEOUT = 0.1
+
+
 @dataclass(slots=True)
 class _EventStreamState:
     ostream: _t.TextIO
@@ -4955,6 +5056,62 @@ class _EventStreamState:
         self.key = key
         self.index = 0
 
+    def _load_until(self, cancelled: threading.Event):
+        # Reads input in a worker thread. Input is polled with a timeout,
+        # so that the thread stops soon after the awaiting task is cancelled,
+        # and doesn't consume input meant for other readers.
+        key = ""
+        while not key:
+            if cancelled.is_set():
+                return
+            try:
+                key = yuio.term._read_keycode(
+                    self.ostream, self.istream, timeout=_INPUT_POLL_TIMEOUT
+                )
+            except TimeoutError:
+                pass
+        self.key = key
+        self.index = 0
+
+    async def load_async(self):
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+
+        try:
+            fd = self.istream.fileno()
+        except (AttributeError, ValueError, OSError):
+            fd = None
+
+        key = ""
+        while not key:
+            if fd is None:
+                cancelled = threading.Event()
+                try:
+                    await loop.run_in_executor(None, self._load_until, cancelled)
+                except asyncio.CancelledError:
+                    cancelled.set()
+                    raise
+                return
+
+            readable = loop.create_future()
+            try:
+                loop.add_reader(fd, readable.set_result, None)
+            except (NotImplementedError, ValueError, OSError):
+                # Event loop can't watch this file (i.e. Windows console),
+                # read it in a thread instead.
+                fd = None
+                continue
+            try:
+                await readable
+            finally:
+                loop.remove_reader(fd)
+
+            # Input is ready, so this won't block.
+            key = yuio.term._read_keycode(self.ostream, self.istream)
+        self.key = key
+        self.index = 0
+
     def next(self):
         ch = self.peek()
         self.index += 1
@@ -4971,15 +5128,38 @@ class _EventStreamState:
 
 
 def _event_stream(ostream: _t.TextIO, istream: _t.TextIO) -> _t.Iterator[KeyboardEvent]:
+    state = _EventStreamState(ostream, istream)
+    for event in _parse_events(state):
+        if event is None:
+            state.load()
+        else:
+            yield event
+
+
+async def _async_event_stream(
+    ostream: _t.TextIO, istream: _t.TextIO
+) -> _t.AsyncGenerator[KeyboardEvent, None]:
+    state = _EventStreamState(ostream, istream)
+    for event in _parse_events(state):
+        if event is None:
+            await state.load_async()
+        else:
+            yield event
+
+
+def _parse_events(state: _EventStreamState) -> _t.Iterator[KeyboardEvent | None]:
     # Implementation is heavily inspired by libtermkey by Paul Evans, MIT license,
     # with some additions for modern protocols.
     # See https://sw.kovidgoyal.net/kitty/keyboard-protocol/.
+    #
+    # Parser doesn't read input by itself. Instead, it yields `None` whenever
+    # it needs more input, and expects the caller to load it into `state`.
+    # This way, the same parser works with blocking and async reads.
 
-    state = _EventStreamState(ostream, istream)
     while True:
         ch = state.next()
         if not ch:
-            state.load()
+            yield None
             ch = state.next()
         if ch == "\x1b":
             alt = False
@@ -4992,7 +5172,7 @@ def _event_stream(ostream: _t.TextIO, istream: _t.TextIO) -> _t.Iterator[Keyboar
             elif ch == "[":
                 yield from _parse_csi(state, alt)
             elif ch in "N]":
-                _parse_dcs(state)
+                yield from _parse_dcs(state)
             elif ch == "O":
                 yield from _parse_ss3(state, alt)
             else:
@@ -5002,7 +5182,7 @@ def _event_stream(ostream: _t.TextIO, istream: _t.TextIO) -> _t.Iterator[Keyboar
             yield from _parse_csi(state, False)
         elif ch in "\x90\x9d":
             # DCS or SS2
-            _parse_dcs(state)
+            yield from _parse_dcs(state)
         elif ch == "\x8f":
             # SS3
             yield from _parse_ss3(state, False)
@@ -5019,7 +5199,7 @@ def _parse_ss3(state: _EventStreamState, alt: bool = False):
         yield from _parse_ss3_key(ch, alt=alt)
 
 
-def _parse_dcs(state: _EventStreamState):
+def _parse_dcs(state: _EventStreamState) -> _t.Iterator[KeyboardEvent | None]:
     while True:
         ch = state.next()
         if ch == "\x9c":
@@ -5028,10 +5208,12 @@ def _parse_dcs(state: _EventStreamState):
             state.next()
             break
         elif not ch:
-            state.load()
+            yield None
 
 
-def _parse_csi(state: _EventStreamState, alt: bool = False):
+def _parse_csi(
+    state: _EventStreamState, alt: bool = False
+) -> _t.Iterator[KeyboardEvent | None]:
     buffer = ""
     while state.peek() and not (0x40 <= ord(state.peek()) <= 0x80):
         buffer += state.next()
@@ -5064,7 +5246,8 @@ def _parse_csi(state: _EventStreamState, alt: bool = False):
             else:
                 yield from _parse_char(ch, ctrl=ctrl, alt=alt, shift=shift)
         elif args[0] == "200":
-            yield KeyboardEvent(Key.PASTE, paste_str=_read_pasted_content(state))
+            paste_str = yield from _read_pasted_content(state)
+            yield KeyboardEvent(Key.PASTE, paste_str=paste_str)
         elif key := _CSI_CODES.get(args[0]):
             yield KeyboardEvent(key, ctrl=ctrl, alt=alt, shift=shift)
     elif cmd == "u":
@@ -5172,7 +5355,9 @@ def _parse_char(
         yield KeyboardEvent(ch, ctrl, alt, shift)
 
 
-def _read_pasted_content(state: _EventStreamState) -> str:
+def _read_pasted_content(
+    state: _EventStreamState,
+) -> _t.Generator[KeyboardEvent | None, None, str]:
     buf = ""
     while True:
         index = state.tail().find("\x1b[201~")
@@ -5182,4 +5367,4 @@ def _read_pasted_content(state: _EventStreamState) -> str:
             buf += state.tail()[:index]
             state.index += index
             return buf
-        state.load()
+        yield None